@@ -0,0 +1,202 @@
+"""
+Headless benchmarks for :class:`~mplsel.AxesLineSelector` operations on the
+Agg backend.
+
+Each operation is run on a freshly built Axes for every combination of line
+count and points per line, reporting the best wall-clock time over a number
+of repeats and the peak memory allocated while running the operation (as
+measured by ``tracemalloc``). Combinations exceeding ``--max-total-points``
+are reported as skipped. Cases that raise are reported and the script exits
+with a non-zero status once all cases have run.
+
+Usage:
+    python benchmarks/bench_linesel.py
+    python benchmarks/bench_linesel.py --lines 10 1000 --points 1000 \\
+        --ops select_all_lines delete_selection --json results.json
+"""
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.backend_bases import MouseEvent  # noqa: E402
+from matplotlib.lines import Line2D  # noqa: E402
+
+from mplsel import AxesLineSelector  # noqa: E402
+
+DEFAULT_LINES = (10, 100, 1000, 10000, 100000)
+DEFAULT_POINTS = (10, 1000, 100000, 10000000)
+
+#: Default limit on lines * points per case. Admits 10 lines of 10M points,
+#: which need about 3 GiB with matplotlib's cached copies of the data
+DEFAULT_MAX_TOTAL_POINTS = 1e8
+
+#: Registered benchmarks: name -> (prepare, run, target). ``prepare(sel)``
+#: performs untimed setup on a freshly built selector and ``run(sel)`` is
+#: timed. If ``target`` is **True**, ``run(sel, target_ax)`` is passed an
+#: empty Axes of a new figure created before timing starts.
+BENCHMARKS = {}
+
+
+def benchmark(name, prepare=None, target=False):
+    def register(run):
+        BENCHMARKS[name] = (prepare, run, target)
+        return run
+    return register
+
+
+def _select_half(sel):
+    sel.select_lines_by_inds(*range(0, len(sel.ax.lines), 2))
+
+
+def _click_first_line(sel):
+    ln = sel.ax.lines[0]
+    x, y = ln.get_xdata()[0], ln.get_ydata()[0]
+    px, py = sel.ax.transData.transform((x, y))
+    event = MouseEvent('button_press_event', sel.fig.canvas, px, py, button=1)
+    sel.fig.canvas.callbacks.process('button_press_event', event)
+    sel.flush_picks()
+
+
+benchmark('select_all_lines')(lambda sel: sel.select_all_lines())
+benchmark('select_lines')(
+    lambda sel: sel.select_lines(lambda ln, i: i % 2 == 0))
+benchmark('select_lines_by_inds')(_select_half)
+benchmark('delete_selection', prepare=_select_half)(
+    lambda sel: sel.delete_selection())
+benchmark('delete_all_lines')(lambda sel: sel.delete_all_lines())
+benchmark('delete_lines_by_inds')(
+    lambda sel: sel.delete_lines_by_inds(*range(0, len(sel.ax.lines), 2)))
+benchmark('undo_all_delete', prepare=lambda sel: sel.delete_all_lines())(
+    lambda sel: sel.undo_all_delete())
+benchmark('reorder_lines')(
+    lambda sel: sel.reorder_lines(range(len(sel.ax.lines) - 1, -1, -1)))
+benchmark('setattr_selection', prepare=_select_half)(
+    lambda sel: sel.setattr_selection('linewidth', 3))
+benchmark('paste_selection', prepare=_select_half, target=True)(
+    lambda sel, target_ax: sel.paste_selection(target_ax))
+benchmark('pick', prepare=lambda sel: sel.interactive_select(highlight=False))(
+    _click_first_line)
+
+
+def _prepare_id_buffer_pick(sel):
+    sel.interactive_select(id_buffer=True, highlight=False)
+    _click_first_line(sel)  # Build the id buffer so that only lookup is timed
+
+
+benchmark('pick_id_buffer', prepare=_prepare_id_buffer_pick)(
+    _click_first_line)
+benchmark('repr')(repr)
+
+
+def build_selector(n_lines, n_points):
+    """Create a new Agg figure with ``n_lines`` lines of ``n_points`` points
+    sharing the same x-array and return a selector bound to its Axes"""
+    fig, ax = plt.subplots()
+    x = np.arange(n_points, dtype=float)
+    rng = np.random.default_rng(0)
+    for i in range(n_lines):
+        ax.add_line(Line2D(x, i + rng.random(n_points), label=f'Line-{i}'))
+    ax.autoscale_view()
+    ax.legend(handles=ax.lines[:10])
+    fig.canvas.draw()
+    return AxesLineSelector(ax)
+
+
+def run_case(name, n_lines, n_points, repeats):
+    """
+    Returns:
+        (dict): Best time in seconds and peak traced memory in bytes
+    """
+    prepare, run, target = BENCHMARKS[name]
+    times = []
+    peak = None
+    for i in range(repeats + 1):
+        try:
+            sel = build_selector(n_lines, n_points)
+            if prepare is not None:
+                prepare(sel)
+            args = (plt.figure().add_subplot(111),) if target else ()
+            gc.collect()
+            if i == repeats:  # Final run only measures memory
+                tracemalloc.start()
+                run(sel, *args)
+                peak = tracemalloc.get_traced_memory()[1]
+            else:
+                start = time.perf_counter()
+                run(sel, *args)
+                times.append(time.perf_counter() - start)
+        finally:
+            tracemalloc.stop()
+            plt.close('all')
+    return {'time': min(times), 'peak_memory': peak}
+
+
+def main(argv=None):
+    """
+    Returns:
+        (int): Exit status, 1 if any case raised and 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--lines', type=int, nargs='+', default=DEFAULT_LINES,
+                        help='Line counts to benchmark')
+    parser.add_argument('--points', type=int, nargs='+',
+                        default=DEFAULT_POINTS, help='Points per line')
+    parser.add_argument('--ops', nargs='+', default=list(BENCHMARKS),
+                        choices=list(BENCHMARKS), help='Operations to run')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Timed repeats per case (best is reported)')
+    parser.add_argument('--max-total-points', type=float,
+                        default=DEFAULT_MAX_TOTAL_POINTS,
+                        help='Skip cases with more lines * points than this')
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args(argv)
+    logging.getLogger('mplsel').setLevel(logging.WARNING)
+
+    results = []
+    print(f'{"operation":<22}{"lines":>8}{"points":>10}'
+          f'{"time [s]":>12}{"peak [MiB]":>12}')
+    for name in args.ops:
+        for n_lines in args.lines:
+            for n_points in args.points:
+                if n_lines * n_points > args.max_total_points:
+                    print(f'{name:<22}{n_lines:>8}{n_points:>10}'
+                          f'  skipped: more than --max-total-points')
+                    results.append(dict(operation=name, lines=n_lines,
+                                        points=n_points, skipped=True))
+                    continue
+                try:
+                    res = run_case(name, n_lines, n_points, args.repeats)
+                except Exception as e:  # Report and continue with other cases
+                    res = {'time': None, 'peak_memory': None,
+                           'error': f'{type(e).__name__}: {e}'}
+                    print(f'{name:<22}{n_lines:>8}{n_points:>10}'
+                          f'  error: {res["error"]}')
+                else:
+                    print(f'{name:<22}{n_lines:>8}{n_points:>10}'
+                          f'{res["time"]:>12.4f}'
+                          f'{res["peak_memory"] / 2 ** 20:>12.2f}')
+                results.append(dict(operation=name, lines=n_lines,
+                                    points=n_points, **res))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'matplotlib': matplotlib.__version__,
+                       'numpy': np.__version__,
+                       'results': results}, f, indent=2)
+    n_skipped = sum(res.get('skipped', False) for res in results)
+    if n_skipped > 0:
+        print(f'Skipped {n_skipped} case(s) exceeding --max-total-points='
+              f'{args.max_total_points:g}')
+    return int(any('error' in res for res in results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
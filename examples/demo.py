@@ -23,6 +23,10 @@ sel.select_lines_by_inds(1, 4)
 sel.clear_clipboard() \
    .select_lines(lambda ln, i: any([x in ln.get_label() for x in ['-1', '-4']]))
 
+# %% Or look lines up by label (exact, glob or regex) or by style via an index
+sel.clear_clipboard() \
+   .select_by_label('Line-[14]', mode='glob')
+
 # %% Delete the selected lines
 # sel.delete_selection()
 
@@ -55,7 +59,8 @@ sel.undo_all_delete()
 sel.clear_clipboard()
 
 # Enable interactive line selection by left-clicking on lines in plot window
-# Left-click on lines should print a selection notification to console
+# Selection notifications are emitted via the 'mplsel' logger. Enable them with
+# logging.basicConfig(level=logging.INFO)
 sel.interactive_select()
 
 # Enable interactive deletion by left-clicking on lines
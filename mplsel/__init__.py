@@ -1 +1,14 @@
 from .linesel import AxesLineSelector
+from .picking import IdBufferPicker
+from .selection import LineSelection
+from .stats import LineStatsTable
+from .collection import ConsolidatedLineCollection
+from .decimate import LineDecimator
+from .highlight import SelectionHighlighter
+from .figsel import FigureLineSelector
+from .lineindex import LineIndex
+from .legend import LegendManager
+from .spatial import SegmentIndex
+from .duplicates import LineHashTable
+from .store import LineStore
+from .editor import LineEditor
@@ -0,0 +1,266 @@
+"""
+Headless batch restyling of pickled matplotlib figures.
+
+A recipe is a JSON file describing the operations applied to one Axes of
+every figure, as a list of steps. Each step maps the name of an
+:class:`~mplsel.AxesLineSelector` method in :data:`OPERATIONS` to its
+arguments: a list of positional arguments, a dict of keyword arguments, or
+``true``/``null`` for none. The ``paste`` step pastes the current selection
+into an Axes of a pickled template figure, and all subsequent steps as well as
+the saved output apply to the template. Example::
+
+    {
+        "axes": 0,
+        "steps": [
+            {"select_by_label": ["sensor-*", "glob"]},
+            {"setattrs_selection": {"attrs": {"color": "C1", "linewidth": 2}}},
+            {"clear_clipboard": null},
+            {"select_where": {"nnan__gt": 0}},
+            {"delete_selection": null},
+            {"select_all_lines": null},
+            {"paste": {"template": "template.pickle", "axes": 0}}
+        ],
+        "savefig": {"dpi": 150}
+    }
+
+Figures are processed on the Agg backend in a pool of worker processes, and
+a CSV report with per-file timings is written alongside the outputs.
+
+Usage:
+    mplsel recipe.json figures/ out/ --format png svg --jobs 8
+"""
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import time
+from pathlib import Path
+
+import matplotlib
+from matplotlib._pylab_helpers import Gcf
+
+from .linesel import AxesLineSelector
+
+#: Selector methods that may be used as recipe steps
+OPERATIONS = (
+    'select_all_lines', 'select_lines_by_inds', 'select_by_label',
+    'select_by_style', 'select_where', 'select_in_region', 'clear_clipboard',
+    'setattr_selection', 'setattrs_selection', 'delete_selection',
+    'delete_lines_by_inds', 'delete_all_lines', 'reorder_lines', 'undo',
+    'redo', 'consolidate', 'decimate', 'configure_legend')
+
+#: File extensions of pickled figures picked up from an input directory
+FIGURE_SUFFIXES = ('.pickle', '.pkl')
+
+#: Columns of the timing report
+REPORT_FIELDS = ('file', 'status', 'load_s', 'apply_s', 'save_s', 'total_s',
+                 'outputs', 'error')
+
+_templates = {}  # Path -> pickled template figure, cached per process
+
+
+def load_recipe(path):
+    """
+    Load and validate a recipe from a JSON file. Relative template paths are
+    resolved against the directory containing the recipe.
+
+    Args:
+        path (str or Path): Path to the recipe
+
+    Returns:
+        (dict): The recipe
+    """
+    path = Path(path)
+    with open(path) as f:
+        recipe = json.load(f)
+    unknown = set(recipe) - {'axes', 'steps', 'savefig'}
+    if len(unknown) > 0:
+        raise ValueError(f'Unknown recipe keys: {sorted(unknown)}')
+    for step in recipe.get('steps', []):
+        if not isinstance(step, dict) or len(step) != 1:
+            raise ValueError(f'Invalid recipe step: {step}. Each step must '
+                             f'map one operation to its arguments')
+        (op, args), = step.items()
+        if op == 'paste':
+            if not isinstance(args, dict) or 'template' not in args:
+                raise ValueError("The 'paste' step requires a 'template'")
+            args['template'] = str(path.parent / args['template'])
+        elif op not in OPERATIONS:
+            raise ValueError(f'Unsupported recipe operation: {op}. Must be '
+                             f'one of {OPERATIONS + ("paste",)}')
+    return recipe
+
+
+def _load_template(path):
+    if path not in _templates:
+        with open(path, 'rb') as f:
+            _templates[path] = f.read()
+    return pickle.loads(_templates[path])  # Fresh copy for every figure
+
+
+def apply_recipe(fig, recipe):
+    """
+    Apply the steps of ``recipe`` to ``fig``
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to restyle
+        recipe (dict): Recipe as returned by :func:`load_recipe`
+
+    Returns:
+        (matplotlib.figure.Figure): Figure to save; the template figure if the
+            recipe pastes into a template, and ``fig`` otherwise
+    """
+    sel = AxesLineSelector(fig.axes[recipe.get('axes', 0)])
+    with sel.batch():
+        for step in recipe.get('steps', []):
+            (op, args), = step.items()
+            if op == 'paste':
+                template = _load_template(args['template'])
+                sel = sel.paste_selection(
+                    template.axes[args.get('axes', 0)],
+                    share_data=args.get('share_data', False))
+                continue
+            method = getattr(sel, op)
+            if isinstance(args, list):
+                method(*args)
+            elif isinstance(args, dict):
+                method(**args)
+            else:
+                method()
+    return sel.fig
+
+
+def process_figure(path, recipe, out_dir, formats=('png',)):
+    """
+    Load a pickled figure, apply ``recipe`` and save it in each of
+    ``formats``. Errors are recorded in the returned report row rather than
+    raised so that a batch continues past broken files.
+
+    Args:
+        path (str or Path): Path to the pickled figure
+        recipe (dict): Recipe as returned by :func:`load_recipe`
+        out_dir (str or Path): Directory the outputs are written to
+        formats (Iterable[str], optional): Output formats understood by
+            ``savefig``; Default is **('png',)**
+
+    Returns:
+        (dict): Report row with the keys in :data:`REPORT_FIELDS`
+    """
+    path = Path(path)
+    row = dict(file=str(path), status='ok', load_s=None, apply_s=None,
+               save_s=None, total_s=None, outputs='', error='')
+    start = t = time.perf_counter()
+    figs = []
+    try:
+        with open(path, 'rb') as f:
+            fig = pickle.load(f)
+        figs.append(fig)
+        row['load_s'], t = time.perf_counter() - t, time.perf_counter()
+        out_fig = apply_recipe(fig, recipe)
+        figs.append(out_fig)
+        row['apply_s'], t = time.perf_counter() - t, time.perf_counter()
+        outputs = [Path(out_dir) / f'{path.stem}.{fmt}' for fmt in formats]
+        for out in outputs:
+            out_fig.savefig(out, **recipe.get('savefig', {}))
+        row['save_s'] = time.perf_counter() - t
+        row['outputs'] = ';'.join(str(out) for out in outputs)
+    except Exception as e:  # Report and continue with other figures
+        row['status'] = 'error'
+        row['error'] = f'{type(e).__name__}: {e}'
+    finally:
+        for fig in figs:
+            Gcf.destroy_fig(fig)  # Figures unpickled via pyplot
+    row['total_s'] = time.perf_counter() - start
+    return row
+
+
+def _init_worker():
+    # Selected before pyplot is imported (e.g. by unpickling figures) so that
+    # no GUI backend is initialised
+    matplotlib.use('Agg')
+    logging.getLogger('mplsel').setLevel(logging.WARNING)
+
+
+def _process_task(task):
+    return process_figure(*task)
+
+
+def run_batch(recipe, paths, out_dir, formats=('png',), jobs=None):
+    """
+    Process the pickled figures in ``paths`` in a pool of ``jobs`` worker
+    processes (see :func:`process_figure`)
+
+    Args:
+        recipe (dict): Recipe as returned by :func:`load_recipe`
+        paths (Iterable[str or Path]): Paths to pickled figures
+        out_dir (str or Path): Directory the outputs are written to
+        formats (Iterable[str], optional): Output formats; Default is
+            **('png',)**
+        jobs (int, optional): Number of worker processes; Default of **None**
+            uses all CPUs. **1** processes all figures in this process, on
+            its current backend
+
+    Returns:
+        (list[dict]): Report rows ordered like ``paths``
+    """
+    paths = [Path(p) for p in paths]
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    tasks = [(p, recipe, out_dir, tuple(formats)) for p in paths]
+    jobs = min(jobs or os.cpu_count() or 1, max(len(tasks), 1))
+    if jobs == 1:
+        # Runs in the caller's process, keeping its backend and logging
+        rows = [_process_task(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(jobs, initializer=_init_worker) as pool:
+            # Figures vary in size, so hand them out one at a time
+            rows = list(pool.imap_unordered(_process_task, tasks, chunksize=1))
+    order = {str(p): i for i, p in enumerate(paths)}
+    return sorted(rows, key=lambda row: order[row['file']])
+
+
+def write_report(rows, path):
+    """Write the report rows of :func:`run_batch` to a CSV file"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='mplsel', description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('recipe', help='JSON recipe to apply')
+    parser.add_argument('inputs', nargs='+',
+                        help='Pickled figures, or directories containing them')
+    parser.add_argument('out_dir', help='Directory for outputs and the report')
+    parser.add_argument('--format', nargs='+', default=['png'],
+                        dest='formats', help='Output formats (png, svg, pdf)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes (default: all CPUs)')
+    parser.add_argument('--report', default=None,
+                        help='CSV timing report (default: out_dir/report.csv)')
+    args = parser.parse_args(argv)
+
+    recipe = load_recipe(args.recipe)
+    matplotlib.use('Agg')  # Also for figures processed in this process
+    paths = []
+    for inp in map(Path, args.inputs):
+        if inp.is_dir():
+            paths.extend(sorted(p for p in inp.iterdir()
+                                if p.suffix in FIGURE_SUFFIXES))
+        else:
+            paths.append(inp)
+    start = time.perf_counter()
+    rows = run_batch(recipe, paths, args.out_dir, args.formats, args.jobs)
+    report = args.report or Path(args.out_dir) / 'report.csv'
+    write_report(rows, report)
+
+    failed = [row for row in rows if row['status'] != 'ok']
+    for row in failed:
+        print(f'{row["file"]}: {row["error"]}')
+    print(f'Processed {len(rows) - len(failed)}/{len(rows)} figures in '
+          f'{time.perf_counter() - start:.2f} s. Report: {report}')
+    return 1 if len(failed) > 0 else 0
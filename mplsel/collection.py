@@ -0,0 +1,119 @@
+from functools import partial
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+
+from .stats import data_version
+
+
+def _skip_draw(renderer):
+    """Replacement ``draw`` method for lines rendered by a collection"""
+
+
+def is_consolidated(line):
+    """Returns ``True`` if ``line`` is rendered by a
+    :class:`ConsolidatedLineCollection` instead of itself"""
+    return vars(line).get('draw') is _skip_draw
+
+
+def can_consolidate(line, ax):
+    """Returns ``True`` if ``line`` can be faithfully rendered as a segment of
+    a ``LineCollection`` in ``ax`` (i.e. it has no markers, a default
+    drawstyle and is drawn in the data coordinates of ``ax``)"""
+    return not is_consolidated(line) \
+        and line.get_marker() in ('None', None, '', ' ') \
+        and line.get_drawstyle() == 'default' \
+        and line.get_transform() is ax.transData  # == compares values
+
+
+class ConsolidatedLineCollection(LineCollection):
+    """
+    A ``LineCollection`` that renders a group of ``Line2D`` objects as a single
+    artist while the lines themselves remain in ``ax.lines`` as logical lines.
+
+    The logical lines keep their data, properties, legend entries, data limits
+    and picking behaviour, but their own drawing is suppressed. Any change to a
+    logical line (property setters, ``set_data``), or its removal from or
+    restoration to ``ax.lines``, is synced into the collection on the next
+    draw, so index-based selection, ``setattr_selection``, deletion and undo
+    keep operating on the logical lines.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance containing ``lines``
+        lines (Sequence[Line2D]): Lines to be rendered by the collection. See
+            :func:`can_consolidate`. Segments are drawn in the order of the
+            lines in ``ax.lines``, which follows reordering of the lines
+    """
+    def __init__(self, ax, lines):
+        super().__init__([], zorder=max(ln.get_zorder() for ln in lines))
+        self.logical_lines = list(lines)
+        self._target_ax = ax
+        self._stale_callbacks = {}  # Line -> original stale_callback
+        self._data_versions = {}  # Line -> data version of cached segment
+        self._segments = {}  # Line -> cached (N, 2) segment
+        self._members_key = None
+        self._dirty = True
+        for ln in self.logical_lines:
+            self._stale_callbacks[ln] = ln.stale_callback
+            ln.stale_callback = partial(self._line_stale, ln)
+            ln.draw = _skip_draw
+
+    def _line_stale(self, line, artist, val):
+        self._dirty = True
+        original = self._stale_callbacks.get(line)
+        if original is not None:
+            original(artist, val)
+
+    def sync(self):
+        """Update segments and per-segment styles from the logical lines"""
+        in_axes = set(self._target_ax.lines)
+        for ln in self.logical_lines:
+            if ln in in_axes and ln.stale_callback is not None \
+                    and getattr(ln.stale_callback, 'func', None) != \
+                    self._line_stale:
+                # Restoring a removed line to the Axes resets its callback
+                self._stale_callbacks[ln] = ln.stale_callback
+                ln.stale_callback = partial(self._line_stale, ln)
+                self._dirty = True
+        logical = set(self.logical_lines)
+        members = [ln for ln in self._target_ax.lines
+                   if ln in logical and ln.get_visible()]
+        members_key = tuple(map(id, members))
+        if not self._dirty and members_key == self._members_key:
+            return
+
+        segments = []
+        for ln in members:
+            version = data_version(ln)
+            if self._data_versions.get(ln) != version:
+                self._segments[ln] = np.asarray(ln.get_xydata())
+                self._data_versions[ln] = version
+            segments.append(self._segments[ln])
+        self.set_segments(segments)
+        self.set_color([to_rgba(ln.get_color(), ln.get_alpha())
+                        for ln in members])
+        self.set_linewidth([ln.get_linewidth() for ln in members])
+        self.set_linestyle([ln.get_linestyle() for ln in members])
+        self.set_antialiased([ln.get_antialiased() for ln in members])
+        self._members_key = members_key
+        self._dirty = False
+
+    def draw(self, renderer):
+        self.sync()
+        super().draw(renderer)
+
+    def expand(self):
+        """
+        Restore drawing of the logical lines as individual ``Line2D`` artists
+        and remove this collection from its Axes
+        """
+        for ln in self.logical_lines:
+            if is_consolidated(ln):
+                del ln.draw
+            ln.stale_callback = self._stale_callbacks.pop(ln, None)
+            ln.stale = True
+        self.logical_lines = []
+        self._segments.clear()
+        self._data_versions.clear()
+        self.remove()
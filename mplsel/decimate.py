@@ -0,0 +1,175 @@
+import numpy as np
+
+from .stats import data_version
+from .storage import data_nbytes
+
+
+def _as_numeric(line, data, axis):
+    """Return ``data`` as a float array, using the unit-converted data of
+    ``line`` if the original data is not already numeric"""
+    if isinstance(data, np.ndarray) and np.issubdtype(data.dtype, np.floating):
+        return data
+    getter = line.get_xdata if axis == 'x' else line.get_ydata
+    return np.array(getter(orig=False), dtype=float)
+
+
+def minmax_indices(y, n_bins):
+    """
+    Indices of the minimum and maximum of ``y`` within each of ``n_bins``
+    contiguous chunks, in ascending order. NaN values are ignored unless a
+    chunk consists solely of NaNs.
+
+    Args:
+        y (numpy.ndarray): 1D array of values
+        n_bins (int): Number of chunks to split ``y`` into
+
+    Returns:
+        (numpy.ndarray): Sorted unique indices into ``y``
+    """
+    n = len(y)
+    chunk = n // n_bins
+    if chunk < 2:
+        return np.arange(n)
+    m = chunk * n_bins
+    yc = y[:m].reshape(n_bins, chunk)
+    nan = np.isnan(yc)
+    offsets = np.arange(n_bins) * chunk
+    imin = np.argmin(np.where(nan, np.inf, yc), axis=1) + offsets
+    imax = np.argmax(np.where(nan, -np.inf, yc), axis=1) + offsets
+    inds = [imin, imax]
+    if m < n:  # Remainder chunk
+        tail = y[m:]
+        inds.append(np.array([m + np.nanargmin(tail), m + np.nanargmax(tail)])
+                    if not np.all(np.isnan(tail)) else np.array([m]))
+    return np.unique(np.concatenate(inds))
+
+
+class _DecimatedLine:
+    """Full-resolution data of a decimated line"""
+    __slots__ = ('x', 'y', 'x_num', 'y_num', 'is_sorted', 'anchors', 'version')
+
+    def __init__(self, line):
+        self.x = np.asarray(line.get_xdata(orig=True))
+        self.y = np.asarray(line.get_ydata(orig=True))
+        self.x_num = _as_numeric(line, self.x, 'x')
+        self.y_num = _as_numeric(line, self.y, 'y')
+        n = len(self.y_num)
+        finite = ~np.isnan(self.y_num)
+        self.is_sorted = bool(np.all(np.diff(self.x_num) >= 0))
+        # Endpoints and global extrema preserve the data limits of the line
+        anchors = [0, n - 1] if n > 0 else []
+        if finite.any():
+            anchors += [np.nanargmin(self.y_num), np.nanargmax(self.y_num)]
+        self.anchors = np.unique(np.array(anchors, dtype=int))
+        self.version = None  # Data version of the line once decimated
+
+
+class LineDecimator:
+    """
+    View-dependent level-of-detail manager for very long lines. Each managed
+    line displays a min/max-preserving downsampled version of its data sized
+    to the pixel width of the Axes, recomputed for the visible x-range
+    whenever the x-limits change. The full-resolution data is retained and
+    remains available via :meth:`full_data`. Data set on a managed line
+    (e.g. via ``set_data``) after it was decimated becomes its new
+    full-resolution data.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance containing the lines
+        points_per_pixel (int, optional): Number of min/max bins per pixel of
+            Axes width; Default is **1** (i.e. up to two points per pixel)
+    """
+    def __init__(self, ax, points_per_pixel=1):
+        self.ax = ax
+        self.points_per_pixel = points_per_pixel
+        self._lines = {}  # Line -> _DecimatedLine
+        self._cid = None
+
+    def __contains__(self, line):
+        return line in self._lines
+
+    def __len__(self):
+        return len(self._lines)
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the full-resolution data in bytes"""
+        return data_nbytes(arr for full in self._lines.values()
+                           for arr in (full.x, full.y, full.x_num, full.y_num))
+
+    def add(self, lines):
+        """Start managing ``lines`` and display their decimated data"""
+        for ln in lines:
+            if ln not in self._lines:
+                self._lines[ln] = _DecimatedLine(ln)
+        if self._cid is None and len(self._lines) > 0:
+            self._cid = self.ax.callbacks.connect(
+                'xlim_changed', self._on_xlim_changed)
+        self.update()
+
+    def remove(self, lines=None):
+        """Restore full-resolution data of ``lines`` (or all managed lines if
+        **None**) and stop managing them"""
+        lines = list(self._lines) if lines is None else lines
+        for ln in lines:
+            full = self._lines.pop(ln, None)
+            # Keep data set on the line since it was decimated
+            if full is not None and full.version == data_version(ln):
+                ln.set_data(full.x, full.y)
+        if self._cid is not None and len(self._lines) == 0:
+            self.ax.callbacks.disconnect(self._cid)
+            self._cid = None
+
+    def full_data(self, line, orig=True):
+        """
+        Return the full-resolution x/y data of ``line``
+
+        Args:
+            line (Line2D): Any line of the Axes
+            orig (bool, optional): If **True** return the original data,
+                otherwise float arrays; Default is **True**
+
+        Returns:
+            (tuple): ``(x, y)`` data of the line. Unmanaged lines return their
+                current data
+        """
+        if line not in self._lines:
+            return line.get_xdata(orig=orig), line.get_ydata(orig=orig)
+        full = self._full(line)
+        return (full.x, full.y) if orig else (full.x_num, full.y_num)
+
+    def _full(self, line):
+        """Return the full-resolution data of a managed ``line``, adopting
+        the data of the line instead if it was set since it was decimated"""
+        full = self._lines[line]
+        if full.version is not None and full.version != data_version(line):
+            full = self._lines[line] = _DecimatedLine(line)
+        return full
+
+    def _on_xlim_changed(self, ax):
+        self.update()
+
+    def _visible_indices(self, full, xlim, n_bins):
+        n = len(full.x_num)
+        if full.is_sorted:
+            lo = max(np.searchsorted(full.x_num, xlim[0], side='left') - 1, 0)
+            hi = min(np.searchsorted(full.x_num, xlim[1], side='right') + 1, n)
+        else:
+            lo, hi = 0, n
+        inds = minmax_indices(full.y_num[lo:hi], n_bins) + lo
+        outside = full.anchors[(full.anchors < lo) | (full.anchors >= hi)]
+        return np.union1d(inds, outside)
+
+    def update(self):
+        """Recompute the displayed data of all managed lines for the current
+        view limits and Axes width"""
+        xlim = sorted(self.ax.get_xlim())
+        n_bins = max(int(self.ax.bbox.width * self.points_per_pixel), 1)
+        in_axes = set(self.ax.lines)
+        for ln in list(self._lines):
+            if ln not in in_axes:
+                continue
+            full = self._full(ln)
+            inds = self._visible_indices(full, xlim, n_bins)
+            ln.set_data(full.x[inds], full.y[inds])
+            full.version = data_version(ln)
@@ -0,0 +1,129 @@
+import hashlib
+
+import numpy as np
+
+
+def _update_digest(h, arr, tolerance):
+    arr = np.ascontiguousarray(arr, dtype=float)
+    if tolerance is not None:
+        arr = np.round(arr / tolerance) + 0.  # + 0. turns -0. into 0.
+    h.update(len(arr).to_bytes(8, 'little'))
+    h.update(arr.data)
+
+
+def array_digest(arr, tolerance=None):
+    """Return a content hash of the 1D array ``arr`` (see
+    :func:`data_digest`)"""
+    h = hashlib.blake2b(digest_size=16)
+    _update_digest(h, arr, tolerance)
+    return h.digest()
+
+
+def data_digest(x, y, tolerance=None):
+    """
+    Return a content hash of line data ``x, y``. Data with equal values hash
+    equally regardless of their dtype.
+
+    Args:
+        x (ArrayLike): x-data of the line
+        y (ArrayLike): y-data of the line
+        tolerance (float, optional): If provided, values are quantised to
+            multiples of ``tolerance`` before hashing so that data differing
+            by less than ``tolerance`` usually hashes equally. Values on
+            either side of a quantisation boundary hash differently. Default
+            of **None** hashes the exact values
+
+    Returns:
+        (bytes): Digest of the data
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arr in (x, y):
+        _update_digest(h, arr, tolerance)
+    return h.digest()
+
+
+class LineHashTable:
+    """
+    Cache of content hashes of the data of the lines of an Axes, used to find
+    lines plotting identical (or nearly identical) data by grouping equal
+    hashes rather than comparing every pair of lines.
+
+    The hash of a line is computed once per tolerance and reused until its
+    data arrays are replaced.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance whose lines are hashed
+        data_getter (Callable, optional): Function with call-signature
+            ``(line)`` returning the ``(x, y)`` data to hash for ``line``.
+            Default of **None** uses the line's current data
+    """
+    def __init__(self, ax, data_getter=None):
+        self.ax = ax
+        self.data_getter = data_getter
+        self._digests = {}  # Tolerance -> {line: (data version, digest)}
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the cached hashes in bytes"""
+        # 16-byte digest plus the references to the line and its version
+        return sum(len(digests) for digests in self._digests.values()) * 64
+
+    def invalidate(self, line=None):
+        """
+        Discard cached hashes of ``line``, or of all lines if **None**.
+        Required after modifying line data arrays in place.
+        """
+        for digests in self._digests.values():
+            if line is None:
+                digests.clear()
+            else:
+                digests.pop(line, None)
+
+    def _get_data(self, line):
+        if self.data_getter is not None:
+            return self.data_getter(line)
+        return line.get_xdata(orig=False), line.get_ydata(orig=False)
+
+    def digests(self, tolerance=None):
+        """
+        Return the content hashes of all lines in ``ax.lines``
+
+        Args:
+            tolerance (float, optional): See :func:`data_digest`
+
+        Returns:
+            (list[bytes]): Digests in the same order as ``ax.lines``
+        """
+        lines = self.ax.lines
+        cache = self._digests.setdefault(tolerance, {})
+        digests = []
+        for ln in lines:
+            x, y = self._get_data(ln)
+            version = (id(x), id(y), len(x), len(y))
+            cached = cache.get(ln)
+            if cached is None or cached[0] != version:
+                cached = (version, data_digest(x, y, tolerance))
+                cache[ln] = cached
+            digests.append(cached[1])
+        # Drop cached hashes of lines no longer in the Axes
+        if len(cache) > len(lines):
+            current = set(lines)
+            for ln in [ln for ln in cache if ln not in current]:
+                del cache[ln]
+        return digests
+
+    def duplicate_groups(self, tolerance=None):
+        """
+        Group the lines of ``ax.lines`` plotting the same data
+
+        Args:
+            tolerance (float, optional): See :func:`data_digest`
+
+        Returns:
+            (list[list[Line2D]]): Groups of two or more lines with equal data,
+                each ordered as in ``ax.lines``
+        """
+        groups = {}
+        for ln, digest in zip(self.ax.lines, self.digests(tolerance)):
+            groups.setdefault(digest, []).append(ln)
+        return [group for group in groups.values() if len(group) > 1]
@@ -0,0 +1,632 @@
+import logging
+
+import numpy as np
+
+from .duplicates import LineHashTable
+from .instrument import Instrumentation
+from .journal import (
+    AddLinesEntry, CompoundEntry, EditJournal, RemoveLinesEntry,
+    ReorderLinesEntry, SetAttrEntry, get_line_attr, held_lines, set_line_attr,
+    set_lines)
+from .lineindex import label_matcher
+from .selection import LineSelection
+from .stats import LineStatsTable
+from .style import as_array, resolve_values, values_equal
+
+logger = logging.getLogger(__name__)
+
+
+class LineEditor:
+    """
+    Selection, deletion, reordering, styling and undo/redo of an ordered
+    collection of lines, shared by :class:`~mplsel.AxesLineSelector` (lines of
+    an Axes) and :class:`~mplsel.LineStore` (line records without artists).
+
+    Subclasses provide ``lines``, the lines being edited in drawing order,
+    and :attr:`_lines_owner`, the object whose ``lines`` journal entries
+    update, and are notified of changes through
+    :meth:`_changed`, :meth:`_lines_removed`, :meth:`_lines_restored`,
+    :meth:`_attrs_changed` and :meth:`_unhighlight`.
+
+    Args:
+        journal_max_bytes (int, optional): Approximate memory budget in bytes
+            for the undo/redo :attr:`journal`; Default is **256 MiB**
+
+    Attributes:
+        line_clipboard (LineSelection): Currently selected lines
+        journal (EditJournal): Undo/redo history of operations on the lines
+        instrumentation (Instrumentation): Event notifications and timings
+    """
+    LINE_PROPERTIES = {
+        'linewidth', 'linestyle', 'alpha', 'color', 'antialiased',
+        'dashcapstyle', 'dashjoinstyle', 'dashOffset', 'dashSeq',
+        'drawstyle', 'label', 'marker', 'markeredgecolor',
+        'markeredgewidth', 'markerfacecolor', 'markerfacecoloralt',
+        'markersize', 'markevery', 'solidcapstyle', 'solidjoinstyle',
+        'visible'}
+
+    def __init__(self, journal_max_bytes=256 * 2 ** 20):
+        self.journal = EditJournal(max_bytes=journal_max_bytes,
+                                   on_evict=self._on_journal_evict)
+        self.instrumentation = Instrumentation()
+        self.line_clipboard = LineSelection()
+        self._stats = None  # Lazily created LineStatsTable
+        self._hashes = None  # Lazily created LineHashTable
+
+    @property
+    def _lines_owner(self):
+        """Object with a ``lines`` attribute updated by journal entries"""
+        raise NotImplementedError
+
+    def _line_data(self, line):
+        """Return the full ``(x, y)`` data of ``line`` for data queries"""
+        return line.get_data()
+
+    def _changed(self):
+        """Called once lines were removed, restored, reordered or restyled"""
+
+    def _lines_removed(self, lines):
+        """Called after ``lines`` were removed from :attr:`lines`"""
+
+    def _lines_restored(self, lines):
+        """Called after ``lines`` were restored to :attr:`lines`"""
+
+    def _attrs_changed(self, lines, attr):
+        """Called after property ``attr`` of ``lines`` changed"""
+
+    def _unhighlight(self, *lines):
+        """Called once ``lines`` are no longer selected"""
+
+    def _record(self, entry):
+        """Record an applied operation in the undo journal"""
+        with self.instrumentation.timed('snapshot'):
+            self.journal.record(entry)
+
+    def _on_journal_evict(self, entries):
+        """Deselect lines that can no longer be restored once the journal
+        entries holding them have been evicted"""
+        evicted = held_lines(entries)
+        if len(evicted) == 0:
+            return
+        remaining = [entry for entry, _ in self.journal.undo_stack]
+        held = held_lines(remaining + self.journal.redo_stack)
+        held.update(self.lines)
+        gone = [ln for ln in evicted
+                if ln not in held and ln in self.line_clipboard]
+        for ln in gone:
+            self.line_clipboard.discard(ln)
+        self._unhighlight(*gone)
+
+    def delete_all_lines(self):
+        """
+        Delete all lines. They are all stored in :attr:`journal` in case
+        undoing of the deletion operation is desired
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        self._delete_lines(self.lines)
+        return self
+
+    def delete_selection(self):
+        """
+        Delete all lines in current selection and store in undo journal
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        lines, self.line_clipboard = self.line_clipboard, LineSelection()
+        self._unhighlight(*lines)
+        self._delete_lines(lines)
+        return self
+
+    def delete_lines_by_inds(self, *inds):
+        """
+        Programmatically delete lines based on their indices in :attr:`lines`.
+
+        Args:
+            *inds (Iterable[int]): Indices of the lines to be deleted
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+
+        Note:
+            The best way to determine indices for lines of interest is to rely
+            on the ``__repr__()`` method by simply querying the variable
+            containing the instance in your Python interpreter. The output
+            provides indices for each line along with its label.
+
+        Example:
+            >>> ax_sel = AxesLineSelector()
+            >>> ax_sel
+            AxesLineSelector (
+                ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7fba168c9990>
+                is_interactive: False
+                lines: ['0: Line2D(Label-A)',
+                    '1: Line2D(Label-B)',
+                    '2: Line2D(Label-C)',
+                clipboard: ['0: Line2D(Label-A)',
+                    '1: Line2D(Label-B)',
+                deleted buffer: []
+            )
+            >>> # Delete lines with labels 'Label-A' and 'Label-C'
+            >>> ax_sel.delete_lines_by_inds(0, 2)
+        """
+        if len(inds) < 1:
+            raise ValueError('At least one or more indices should be provided')
+        lines = list(self.lines)  # Index into a plain list
+        self._delete_lines([lines[i] for i in set(inds)])
+        return self
+
+    def _delete_lines(self, lines):
+        """Remove ``lines`` from :attr:`lines` in a single pass and record the
+        removal in the journal"""
+        to_delete = {id(ln): ln for ln in lines}
+        indexed_lines, new_lines = [], []
+        for i, ln in enumerate(self.lines):
+            if to_delete.pop(id(ln), None) is not None:
+                indexed_lines.append((i, ln))
+            else:
+                new_lines.append(ln)
+        if len(to_delete) > 0:
+            logger.info('%d line(s) not in lines. Skipped deletion',
+                        len(to_delete))
+        if len(indexed_lines) > 0:
+            set_lines(self._lines_owner, new_lines)
+            self._record(RemoveLinesEntry(indexed_lines))
+            deleted = [ln for _, ln in indexed_lines]
+            self._lines_removed(deleted)
+            logger.info('Deleted %d line(s)', len(deleted))
+            logger.debug('Deleted lines: %s', deleted)
+            self.instrumentation.emit('deleted', deleted)
+        self._changed()
+
+    def undo(self):
+        """
+        Revert the most recent operation recorded in :attr:`journal`
+        (deletion, reordering, attribute change or paste)
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        if len(self.journal) == 0:
+            logger.warning('No operations to undo!')
+        else:
+            self._undo()
+        return self
+
+    def _undo(self, kind=None):
+        """Revert the most recent journal entry, or the most recent one of
+        ``kind``, and notify of the changed lines"""
+        entry = self.journal.undo(self._lines_owner, kind)
+        self._emit_line_changes(entry, undone=True)
+        self._changed()
+
+    def redo(self):
+        """
+        Re-apply the most recent operation reverted via :meth:`undo`
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        if len(self.journal.redo_stack) == 0:
+            logger.warning('No operations to redo!')
+        else:
+            entry = self.journal.redo(self._lines_owner)
+            self._emit_line_changes(entry, undone=False)
+            self._changed()
+        return self
+
+    def _emit_line_changes(self, entry, undone):
+        """Emit ``'deleted'``/``'restored'`` events for lines removed or
+        restored by undoing or redoing ``entry`` and notify subclasses"""
+        for sub in getattr(entry, 'entries', (entry,)):
+            if sub.kind == SetAttrEntry.kind:
+                self._attrs_changed(sub.lines, sub.attr)
+        if entry.kind not in (RemoveLinesEntry.kind, AddLinesEntry.kind):
+            return
+        restored = undone == (entry.kind == RemoveLinesEntry.kind)
+        event = 'restored' if restored else 'deleted'
+        if restored:
+            self._lines_restored(entry.lines)
+        else:
+            self._lines_removed(entry.lines)
+        logger.info('%s %d line(s)', event.capitalize(), len(entry.lines))
+        self.instrumentation.emit(event, entry.lines)
+
+    def reorder_lines(self, order):
+        """
+        Reorder lines based on new ordering provided
+
+        Args:
+            order(Iterable[int]): An iterable of length matching the number of
+                lines, such that ``len(set(order)) == len(lines)`` and
+                ``set(range(len(lines))) == set(order)``. i.e., all indices in
+                ``order`` must be unique and span the range 0 to
+                ``len(lines) - 1``
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+
+        Example:
+            >>> fig, ax = plt.subplots()
+            >>> ax.plot([1, 2, 3, 4], [1, 2, 1, 3], label='Line-A')
+            >>> ax.plot([1, 2, 3, 4], [2, 4, 2, 1], label='Line-B')
+            >>> ax.legend()
+            >>> sel = AxesLineSelector(ax)
+            >>> sel
+                AxesLineSelector (
+                    ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7fa1e57a32d0>
+                    is_interactive: False
+                    lines: ['0: Line2D(Line-A)', '1: Line2D(Line-B)']
+                    clipboard: []
+                    deleted buffer: []
+                )
+            >>> sel.reorder_lines([1, 0])  # 'Line-B' now precedes 'Line-A'
+        """
+        n_lines = len(self.lines)
+        assert set(order) == set(range(n_lines)), \
+            (f'Provided ordering is not compatible with required unique inds: '
+             f'{set(range(n_lines))}')
+        entry = ReorderLinesEntry(order)
+        entry.redo(self._lines_owner)
+        self._record(entry)
+        self._changed()
+        return self
+
+    def select_all_lines(self):
+        """
+        Select all lines and store in :attr:`line_clipboard`
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        self._add_lines_to_clipboard(self.lines)
+        return self
+
+    def select_lines(self, sel_fn):
+        """
+        Select lines using provided selection function to the clipboard
+
+        Args:
+            sel_fn (Callable): Function signature is (line, i) where line is
+                one of :attr:`lines` and ``i`` is its index in :attr:`lines`.
+                ``sel_fn`` must return ``True`` for lines to be selected and
+                ``False`` otherwise
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        self._add_lines_to_clipboard(
+            [ln for i, ln in enumerate(self.lines) if sel_fn(ln, i)])
+        return self
+
+    def select_lines_by_inds(self, *inds):
+        """
+        Select lines programmatically based on their indices in :attr:`lines`
+
+        Args:
+            *inds (Iterable[int]): Indices of lines in :attr:`lines` to be
+                selected and placed in :attr:`line_clipboard`. Usually best
+                determined by examining the output of ``__repr__()`` as shown
+                in the example below.
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+
+        Example:
+            >>> fig, ax = plt.subplots()
+            >>> ax.plot([1, 2, 3, 4], [1, 2, 1, 3], label='Line-A')
+            >>> ax.plot([1, 2, 3, 4], [2, 4, 2, 1], label='Line-B')
+            >>> ax.legend()
+            >>> sel = AxesLineSelector(ax)
+            >>> sel
+                AxesLineSelector (
+                    ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7fa1e57a32d0>
+                    is_interactive: False
+                    lines: ['0: Line2D(Line-A)', '1: Line2D(Line-B)']
+                    clipboard: []
+                    deleted buffer: []
+                )
+            >>> sel.select_lines_by_inds(1)  # Select 'Line-B'
+            >>> sel
+            AxesLineSelector (
+                ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7f3fb2b935d0>
+                is_interactive: False
+                lines: ['0: Line2D(Line-A)', '1: Line2D(Line-B)']
+                clipboard: ['0: Line2D(Line-B)']
+                deleted buffer: []
+            )
+
+        """
+        if len(inds) < 1:
+            raise ValueError('At least one or more indices should be provided')
+        lines = list(self.lines)  # Index into a plain list
+        self._add_lines_to_clipboard([lines[ind] for ind in inds])
+        return self
+
+    def select_by_label(self, pattern, mode='exact'):
+        """
+        Select lines whose label matches ``pattern``
+
+        Args:
+            pattern (str): Label, glob pattern or regular expression
+            mode (str, optional): One of ``'exact'``, ``'glob'`` or
+                ``'regex'`` (matched with :func:`re.search`); Default is
+                **'exact'**
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        matches = label_matcher(pattern, mode)
+        self._add_lines_to_clipboard(
+            [ln for ln in self.lines if matches(ln.get_label())])
+        return self
+
+    @property
+    def stats_table(self):
+        """Returns the :class:`~mplsel.stats.LineStatsTable` of :attr:`lines`"""
+        if self._stats is None:
+            self._stats = LineStatsTable(self._lines_owner,
+                                         data_getter=self._line_data)
+        return self._stats
+
+    def line_stats(self):
+        """
+        Per-line data statistics for all lines in :attr:`lines`
+
+        Returns:
+            (dict): Mapping of each field in
+                :attr:`~mplsel.stats.LineStatsTable.FIELDS` to a NumPy array
+                indexed in the same order as :attr:`lines`
+        """
+        return self.stats_table.table()
+
+    def select_where(self, **criteria):
+        """
+        Select lines whose data statistics satisfy all provided criteria. The
+        statistics are cached per line and only recomputed when a line's data
+        is replaced, so repeated queries are evaluated as vectorized NumPy
+        comparisons.
+
+        Args:
+            **criteria: Conditions of the form ``<field>__<op>=value`` where
+                ``field`` is one of ``xmin``, ``xmax``, ``xmean``, ``ymin``,
+                ``ymax``, ``ymean``, ``npoints`` or ``nnan`` and ``op`` is one
+                of ``gt``, ``ge``, ``lt``, ``le``, ``eq``, ``ne``, ``between``
+                or ``isin``. ``<field>=value`` is shorthand for ``eq``.
+                ``xrange=(lo, hi)`` and ``yrange=(lo, hi)`` match lines whose
+                data extent overlaps the interval.
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+
+        Example:
+            >>> sel = AxesLineSelector(ax)
+            >>> # Lines peaking above 3 with fewer than 100 points
+            >>> sel.select_where(ymax__gt=3, npoints__lt=100)
+            >>> # Lines containing any NaN values
+            >>> sel.clear_clipboard().select_where(nnan__gt=0)
+        """
+        mask = self.stats_table.query(**criteria)
+        lines = list(self.lines)  # Index into a plain list
+        self._add_lines_to_clipboard([lines[i] for i in np.flatnonzero(mask)])
+        return self
+
+    @property
+    def hash_table(self):
+        """Returns the :class:`~mplsel.duplicates.LineHashTable` of
+        :attr:`lines`"""
+        if self._hashes is None:
+            self._hashes = LineHashTable(self._lines_owner,
+                                         data_getter=self._line_data)
+        return self._hashes
+
+    def _duplicates(self, tolerance):
+        """Lines duplicating the data of a line before them in :attr:`lines`"""
+        with self.instrumentation.timed('duplicates'):
+            groups = self.hash_table.duplicate_groups(tolerance)
+        return [ln for group in groups for ln in group[1:]]
+
+    def select_duplicates(self, tolerance=None):
+        """
+        Select all lines with the same data as a line before them in
+        :attr:`lines`, so that the first line of each group of duplicates
+        remains unselected. Lines are compared via content hashes of their
+        data, which are cached per line until its data is replaced.
+
+        Args:
+            tolerance (float, optional): If provided, also treat lines whose
+                data values differ by less than ``tolerance`` as duplicates.
+                Values are quantised to multiples of ``tolerance`` before
+                hashing, so near-duplicates straddling a quantisation boundary
+                may be missed. Default of **None** only matches identical data
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        self._add_lines_to_clipboard(self._duplicates(tolerance))
+        return self
+
+    def dedupe(self, tolerance=None):
+        """
+        Delete all lines with the same data as a line before them in
+        :attr:`lines` (see :meth:`select_duplicates`), keeping the first line
+        of each group of duplicates. The deletion is recorded in the undo
+        journal as a single operation.
+
+        Args:
+            tolerance (float, optional): See :meth:`select_duplicates`
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        duplicates = self._duplicates(tolerance)
+        if len(duplicates) > 0:
+            self._delete_lines(duplicates)
+        return self
+
+    def _add_lines_to_clipboard(self, lines):
+        """Add ``lines`` to the clipboard, skipping lines already selected, and
+        emit a single ``'selected'`` event for the newly added lines"""
+        added = [ln for ln in lines if self.line_clipboard.add(ln)]
+        if len(added) > 0:
+            logger.info('Added %d line(s) to clipboard', len(added))
+            logger.debug('Added lines: %s', added)
+            self.instrumentation.emit('selected', added)
+        return added
+
+    def undo_last_selection(self):
+        """
+        Removes most recent selection from :attr:`line_clipboard`
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        if len(self.line_clipboard) == 0:
+            logger.warning('No line selections to undo!')
+        else:
+            ln = self.line_clipboard.pop()
+            self._unhighlight(ln)
+            logger.info('Removed line: %s from clipboard', ln)
+            self.instrumentation.emit('deselected', [ln])
+        return self
+
+    def clear_clipboard(self):
+        lines, self.line_clipboard = self.line_clipboard, LineSelection()
+        if len(lines) > 0:
+            self._unhighlight(*lines)
+            self.instrumentation.emit('deselected', list(lines))
+        return self
+
+    def setattr_selection(self, attr, value):
+        """
+        Set a supported line property (see :attr:`LINE_PROPERTIES`) for all
+        lines in the current clipboard selection.
+
+        Args:
+            attr (str): A supported line-property (see :attr:`LINE_PROPERTIES`)
+            value (tuple, or Callable or Any): Either a single valid property
+                value that is assigned uniformly to all lines in the selection,
+                or a tuple of the same length as the current line-clipboard
+                selection with valid property values that are assigned to each
+                line. or a function with call-signature ``(line, i)`` where line
+                is the selected line and ``i`` is the index of the line in
+                ``self.line_clipboard``. This function must return a valid
+                value to be set for the provided attribute - ``attr``. NumPy
+                arrays and colormap specs are also accepted (see
+                :meth:`setattrs_selection`)
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+        """
+        return self.setattrs_selection({attr: value})
+
+    def setattrs_selection(self, attrs):
+        """
+        Set several line properties for all lines in the current clipboard
+        selection in a single pass. Setters are only called for lines whose
+        value actually changes, and all changes are recorded as one undoable
+        operation.
+
+        Args:
+            attrs (dict): Mapping of supported line-property (see
+                :attr:`LINE_PROPERTIES`) to value. Each value may be anything
+                accepted by :meth:`setattr_selection`, a NumPy array with one
+                entry per selected line (an ``(N, 3)`` or ``(N, 4)`` RGB(A)
+                array for colors) or, for colors, a colormap spec ``dict`` with
+                keys ``'cmap'`` and ``'values'`` and optionally ``'norm'`` or
+                ``'vmin'``/``'vmax'``. ``'values'`` is either an array with one
+                value per selected line or the name of a
+                :attr:`~mplsel.stats.LineStatsTable.FIELDS` statistic
+
+        Returns:
+            (LineEditor): Current instance (``self``)
+
+        Example:
+            >>> # Color lines by their peak value and thin them out
+            >>> sel.select_all_lines().setattrs_selection({
+            ...     'color': {'cmap': 'viridis', 'values': 'ymax'},
+            ...     'linewidth': np.linspace(.5, 2, len(sel.line_clipboard)),
+            ...     'alpha': .8})
+        """
+        unsupported = set(attrs) - self.LINE_PROPERTIES
+        assert len(unsupported) == 0, \
+            f'{unsupported} are unsupported line-properties. Must be ' \
+            f'one of {self.LINE_PROPERTIES}'
+        lines = list(self.line_clipboard)
+        entries = []
+        with self.instrumentation.timed('setattr'):
+            for attr, value in attrs.items():
+                values = resolve_values(attr, value, lines,
+                                        self._selection_field)
+                changed, old_values, new_values = [], [], []
+                for ln, val in zip(lines, values):
+                    old_val = get_line_attr(ln, attr)
+                    if values_equal(old_val, val):
+                        continue
+                    set_line_attr(ln, attr, val)
+                    changed.append(ln)
+                    old_values.append(old_val)
+                    new_values.append(val)
+                if len(changed) > 0:
+                    entries.append(
+                        SetAttrEntry(attr, changed, old_values, new_values))
+                    self._attrs_changed(changed, attr)
+        if len(entries) == 0:
+            logger.debug('No line properties changed')
+            return self
+        self._record(entries[0] if len(entries) == 1 else
+                     CompoundEntry(entries))
+        self._changed()
+        return self
+
+    def _selection_field(self, field):
+        """Return statistics ``field`` for each line in the clipboard"""
+        positions = {ln: i for i, ln in enumerate(self.lines)}
+        inds = [positions[ln] for ln in self.line_clipboard]
+        return self.line_stats()[field][inds]
+
+    def getattr_selection(self, attr):
+        """
+        Get a tuple of attribute values for lines in current clipboard selection.
+
+        Args:
+            attr (str): A supported line-property (see :attr:`LINE_PROPERTIES`)
+
+        Returns:
+            (tuple): Tuple of length matching the number of lines in the current
+                clipboard selection with each entry containing the value for the
+                `attr` attribute for that line
+        """
+        assert attr in self.LINE_PROPERTIES, \
+            f'{attr} is an unsupported line-property. Must be ' \
+            f'one of {self.LINE_PROPERTIES}'
+        return tuple(get_line_attr(ln, attr) for ln in self.line_clipboard)
+
+    def getattrs_selection(self, *attrs):
+        """
+        Get values of several line properties for all lines in the current
+        clipboard selection in bulk.
+
+        Args:
+            *attrs (str): Supported line-properties (see
+                :attr:`LINE_PROPERTIES`)
+
+        Returns:
+            (dict): Mapping of each of ``attrs`` to its values for the selected
+                lines. Numeric properties are returned as NumPy arrays (``NaN``
+                where unset, e.g. ``alpha``), colors as ``(N, 4)`` RGBA arrays
+                and all other properties as tuples
+
+        Example:
+            >>> vals = sel.getattrs_selection('linewidth', 'color')
+            >>> sel.setattr_selection('linewidth', vals['linewidth'] * 2)
+        """
+        unsupported = set(attrs) - self.LINE_PROPERTIES
+        assert len(unsupported) == 0, \
+            f'{unsupported} are unsupported line-properties. Must be ' \
+            f'one of {self.LINE_PROPERTIES}'
+        return {attr: as_array(attr, [get_line_attr(ln, attr)
+                                      for ln in self.line_clipboard])
+                for attr in attrs}
@@ -0,0 +1,322 @@
+import logging
+from contextlib import contextmanager
+from pprint import pformat
+
+import numpy as np
+
+from .linesel import AxesLineSelector
+from .selection import LineSelection
+from .style import as_array, resolve_values
+
+logger = logging.getLogger(__name__)
+
+
+class FigureLineSelector:
+    """
+    Line selector spanning all Axes of one or more figures. Operations are
+    fanned out to one :class:`~mplsel.AxesLineSelector` per Axes and all
+    resulting redraws are coalesced so that each canvas is drawn once per
+    operation, rather than once per Axes.
+
+    Args:
+        figs (Figure or Iterable[Figure], optional): Figure(s) whose Axes are
+            to be spanned; Default of **None** results in ``plt.gcf()`` being
+            used unless ``axes`` is provided
+        axes (Iterable[Axes], optional): Explicit Axes to be spanned, in
+            addition to those of ``figs``
+        picker_arg (Any, optional): Passed on to each
+            :class:`~mplsel.AxesLineSelector`
+
+    Example:
+        >>> fig, axs = plt.subplots(6, 6)
+        >>> sel = FigureLineSelector(fig)
+        >>> sel.select_lines(lambda ln, i: ln.get_label() == 'baseline') \\
+        ...    .setattr_selection('linewidth', 3)  # One draw for all 36 Axes
+    """
+    def __init__(self, figs=None, axes=None, picker_arg=True):
+        # Loaded by the time figures exist; deferred to keep import fast
+        from matplotlib.figure import Figure
+        if figs is None and axes is None:
+            import matplotlib.pyplot as plt  # Only needed for the default
+            figs = plt.gcf()
+        if isinstance(figs, Figure):
+            figs = [figs]
+        all_axes = [ax for fig in (figs or []) for ax in fig.axes]
+        all_axes += [ax for ax in (axes or []) if ax not in all_axes]
+        self.picker_arg = picker_arg
+        self.selectors = [AxesLineSelector(ax, picker_arg=picker_arg)
+                          for ax in all_axes]
+        self._undo_stack = []  # Lists of selectors changed per operation
+        self._redo_stack = []
+
+    @classmethod
+    def _from_selectors(cls, selectors, picker_arg=True):
+        new_sel = cls.__new__(cls)
+        new_sel.picker_arg = picker_arg
+        new_sel.selectors = list(selectors)
+        new_sel._undo_stack = []
+        new_sel._redo_stack = []
+        return new_sel
+
+    @property
+    def axes(self):
+        """Returns list of Axes spanned by this selector"""
+        return [sel.ax for sel in self.selectors]
+
+    @property
+    def figures(self):
+        """Returns list of unique Figures spanned by this selector"""
+        figs = []
+        for sel in self.selectors:
+            if not any(sel.fig is f for f in figs):
+                figs.append(sel.fig)
+        return figs
+
+    @property
+    def line_clipboard(self):
+        """Returns combined selection across all Axes, in Axes order"""
+        combined = LineSelection()
+        for sel in self.selectors:
+            combined.update(sel.line_clipboard)
+        return combined
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that defers redraws of all spanned Axes until the
+        block exits, at which point legends of affected Axes are refreshed and
+        each affected canvas is drawn exactly once.
+
+        Yields:
+            (FigureLineSelector): Current selection instance (``self``)
+        """
+        for sel in self.selectors:
+            sel.begin_batch()
+        try:
+            yield self
+        finally:
+            pending = [(sel, ax) for sel in self.selectors
+                       for ax in sel._close_batch()]
+            self._redraw(pending)
+
+    @staticmethod
+    def _redraw(pending):
+        """Refresh legends of the pending ``(selector, ax)`` pairs and draw
+        each affected canvas once"""
+        canvases = []
+        for sel, ax in pending:
+            sel._refresh_legend(ax)
+            sel.instrumentation.track_draws(ax.figure.canvas)
+            if not any(ax.figure.canvas is c for c in canvases):
+                canvases.append(ax.figure.canvas)
+        for canvas in canvases:
+            canvas.draw_idle()
+        for sel, ax in pending:
+            sel.instrumentation.emit('redrawn', ax)
+
+    @contextmanager
+    def _operation(self):
+        """Batch an operation and remember which selectors recorded undoable
+        changes so that it can be undone as a whole"""
+        before = [sel.journal.peek() for sel in self.selectors]
+        with self.batch():
+            yield
+        changed = [sel for sel, entry in zip(self.selectors, before)
+                   if sel.journal.peek() is not entry]
+        if len(changed) > 0:
+            self._undo_stack.append(changed)
+            self._redo_stack.clear()
+
+    def _fan_out(self, method, *args, **kwargs):
+        with self._operation():
+            for sel in self.selectors:
+                getattr(sel, method)(*args, **kwargs)
+        return self
+
+    def select_all_lines(self):
+        """Select all lines in all spanned Axes. Returns ``self``"""
+        return self._fan_out('select_all_lines')
+
+    def select_lines(self, sel_fn):
+        """
+        Select lines across all spanned Axes using ``sel_fn``. See
+        :meth:`AxesLineSelector.select_lines`; ``i`` is the index of the line
+        within its own Axes. Returns ``self``
+        """
+        return self._fan_out('select_lines', sel_fn)
+
+    def select_where(self, **criteria):
+        """Select lines across all spanned Axes whose data statistics satisfy
+        ``criteria``. See :meth:`AxesLineSelector.select_where`. Returns
+        ``self``"""
+        return self._fan_out('select_where', **criteria)
+
+    def select_by_label(self, pattern, mode='exact'):
+        """Select lines across all spanned Axes whose label matches
+        ``pattern``. See :meth:`AxesLineSelector.select_by_label`. Returns
+        ``self``"""
+        return self._fan_out('select_by_label', pattern, mode)
+
+    def select_by_style(self, **style):
+        """Select lines across all spanned Axes matching all provided style
+        properties. See :meth:`AxesLineSelector.select_by_style`. Returns
+        ``self``"""
+        return self._fan_out('select_by_style', **style)
+
+    def clear_clipboard(self):
+        """Clear the selection of all spanned Axes. Returns ``self``"""
+        return self._fan_out('clear_clipboard')
+
+    def delete_selection(self):
+        """Delete selected lines in all spanned Axes. Returns ``self``"""
+        return self._fan_out('delete_selection')
+
+    def delete_all_lines(self):
+        """Delete all lines in all spanned Axes. Returns ``self``"""
+        return self._fan_out('delete_all_lines')
+
+    def setattr_selection(self, attr, value):
+        """
+        Set a line property for all selected lines across all spanned Axes
+        with a single draw per canvas. See
+        :meth:`AxesLineSelector.setattr_selection`. A tuple ``value`` must
+        match the combined selection length, and a callable ``value`` receives
+        the index of the line within the combined selection.
+
+        Returns:
+            (FigureLineSelector): Current selection instance (``self``)
+        """
+        return self.setattrs_selection({attr: value})
+
+    def setattrs_selection(self, attrs):
+        """
+        Set several line properties for all selected lines across all spanned
+        Axes with a single draw per canvas. See
+        :meth:`AxesLineSelector.setattrs_selection`. Per-line values and
+        colormap specs refer to the combined selection, so that e.g. a
+        colormap norm spans the selected lines of all Axes.
+
+        Returns:
+            (FigureLineSelector): Current selection instance (``self``)
+        """
+        sources = [sel for sel in self.selectors if len(sel.line_clipboard) > 0]
+        lines = [ln for sel in sources for ln in sel.line_clipboard]
+
+        def field_getter(field):
+            return np.concatenate(
+                [sel._selection_field(field) for sel in sources]
+                + [np.zeros(0)])  # Nothing may be selected
+
+        values = {attr: resolve_values(attr, value, lines, field_getter)
+                  for attr, value in attrs.items()}
+        with self._operation():
+            offset = 0
+            for sel in sources:
+                count = len(sel.line_clipboard)
+                sel.setattrs_selection(
+                    {attr: tuple(vals[offset:offset + count])
+                     for attr, vals in values.items()})
+                offset += count
+        return self
+
+    def getattr_selection(self, attr):
+        """
+        Returns:
+            (tuple): Values of ``attr`` for all selected lines across all
+                spanned Axes, in Axes order
+        """
+        return tuple(val for sel in self.selectors
+                     for val in sel.getattr_selection(attr))
+
+    def getattrs_selection(self, *attrs):
+        """
+        Returns:
+            (dict): Values of each of ``attrs`` for all selected lines across
+                all spanned Axes, in Axes order. See
+                :meth:`AxesLineSelector.getattrs_selection`
+        """
+        return {attr: as_array(attr, self.getattr_selection(attr))
+                for attr in attrs}
+
+    def paste_selection(self, axes, share_data=False):
+        """
+        Paste copies of all selected lines across all spanned Axes into one or
+        several target Axes, drawing each target canvas once.
+
+        Args:
+            axes (Axes or Iterable[Axes]): Target Axes instance(s)
+            share_data (bool, optional): See
+                :meth:`AxesLineSelector.paste_selection`
+
+        Returns:
+            (FigureLineSelector): New selection spanning the target Axes with
+                the pasted lines selected, whose :meth:`undo` removes them
+        """
+        from matplotlib.axes import Axes  # Loaded once any Axes exists
+        targets = [axes] if isinstance(axes, Axes) else list(axes)
+        sources = [sel for sel in self.selectors if len(sel.line_clipboard) > 0]
+        new_selectors = []
+        pending = []
+        for target in targets:
+            n_existing = len(target.lines)
+            new_lines = []
+            for sel in sources:
+                with sel.instrumentation.timed('paste'):
+                    new_lines += sel._paste_lines(target, share_data)
+            target.autoscale_view()
+            if len(sources) > 0:
+                new_sel = sources[0]._pasted_selection(
+                    target, new_lines, n_existing)
+            else:
+                new_sel = AxesLineSelector(target, picker_arg=self.picker_arg)
+            new_selectors.append(new_sel)
+            pending.append((new_sel, target))
+        self._redraw(pending)
+        new_sel = self._from_selectors(new_selectors, picker_arg=self.picker_arg)
+        if len(sources) > 0:
+            new_sel._undo_stack.append(new_selectors)
+        return new_sel
+
+    def undo(self):
+        """
+        Revert the most recent operation performed through this selector on
+        all Axes it changed
+
+        Returns:
+            (FigureLineSelector): Current selection instance (``self``)
+        """
+        if len(self._undo_stack) == 0:
+            logger.warning('No operations to undo!')
+            return self
+        changed = self._undo_stack.pop()
+        with self.batch():
+            for sel in changed:
+                sel.undo()
+        self._redo_stack.append(changed)
+        return self
+
+    def redo(self):
+        """
+        Re-apply the most recent operation reverted via :meth:`undo`
+
+        Returns:
+            (FigureLineSelector): Current selection instance (``self``)
+        """
+        if len(self._redo_stack) == 0:
+            logger.warning('No operations to redo!')
+            return self
+        changed = self._redo_stack.pop()
+        with self.batch():
+            for sel in changed:
+                sel.redo()
+        self._undo_stack.append(changed)
+        return self
+
+    def __repr__(self):
+        axes = pformat(
+            [f'{i}: {sel.ax!r} ({len(sel.ax.lines)} lines, '
+             f'{len(sel.line_clipboard)} selected)'
+             for i, sel in enumerate(self.selectors)]).replace('\n', '\n\t\t')
+        return f"{self.__class__.__name__} (\n" \
+               f"\tfigures: {len(self.figures)}\n" \
+               f"\taxes: {axes}\n)"
@@ -0,0 +1,159 @@
+from matplotlib.lines import Line2D
+
+
+class SelectionHighlighter:
+    """
+    Overlay highlighting of selected lines using blitting. The Axes background
+    is cached after each full canvas draw, and adding or removing highlights
+    only restores that background and re-renders the highlight artists rather
+    than redrawing the full canvas.
+
+    Falls back to ``draw_idle()`` on canvases that do not support blitting.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance containing the lines
+        color (Any, optional): Any valid matplotlib color for the highlight;
+            Default is **'yellow'**
+        alpha (float, optional): Opacity of the highlight; Default is **0.6**
+        extra_width (float, optional): Width in points by which the highlight
+            exceeds the width of the highlighted line; Default is **4**
+    """
+    def __init__(self, ax, color='yellow', alpha=0.6, extra_width=4):
+        self.ax = ax
+        self.color = color
+        self.alpha = alpha
+        self.extra_width = extra_width
+        self._highlights = {}  # Line -> highlight artist
+        self._background = None
+        self._cid = None
+
+    @property
+    def canvas(self):
+        return self.ax.figure.canvas
+
+    def connect(self):
+        """Start caching the Axes background on every full canvas draw"""
+        if self._cid is None:
+            self._cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def disconnect(self):
+        """Remove all highlights and stop listening to draw events"""
+        self.clear()
+        if self._cid is not None:
+            self.canvas.mpl_disconnect(self._cid)
+            self._cid = None
+        self._background = None
+
+    def _make_highlight(self, line):
+        hl = Line2D(*line.get_data(orig=False),
+                    color=self.color, alpha=self.alpha,
+                    linewidth=line.get_linewidth() + self.extra_width,
+                    solid_capstyle='round', animated=True)
+        hl.set_transform(line.get_transform())
+        hl.set_clip_box(line.get_clip_box())
+        hl.set_clip_path(line.get_clip_path())
+        hl.set_figure(line.figure)
+        return hl
+
+    def add(self, *lines):
+        """Highlight ``lines``"""
+        new_lines = [ln for ln in lines if ln not in self._highlights]
+        for ln in new_lines:
+            self._highlights[ln] = self._make_highlight(ln)
+        if len(new_lines) > 0:
+            self.blit()
+
+    def remove(self, *lines):
+        """Remove highlighting of ``lines`` if present"""
+        removed = [self._highlights.pop(ln, None) for ln in lines]
+        if any(hl is not None for hl in removed):
+            self.blit()
+
+    def clear(self):
+        """Remove all highlights"""
+        if len(self._highlights) > 0:
+            self._highlights.clear()
+            self.blit()
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_highlights()
+
+    def _draw_highlights(self):
+        for hl in self._highlights.values():
+            self.ax.draw_artist(hl)
+
+    def blit(self):
+        """Re-render the highlights on top of the cached background"""
+        if self._background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_highlights()
+        self.canvas.blit(self.ax.bbox)
+
+
+class HoverTooltip:
+    """
+    Tooltip annotation shown next to the mouse cursor, rendered by blitting
+    onto the figure background cached after each full canvas draw so that
+    showing, moving or hiding it does not redraw the canvas.
+
+    Falls back to ``draw_idle()`` on canvases that do not support blitting.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance the tooltip belongs to
+    """
+    def __init__(self, ax):
+        self.ax = ax
+        self.annotation = ax.annotate(
+            '', xy=(0, 0), xycoords='figure pixels', xytext=(10, 10),
+            textcoords='offset points', visible=False, animated=True,
+            bbox=dict(boxstyle='round', fc='w', alpha=0.8))
+        self._background = None
+        self._cid = None
+
+    @property
+    def canvas(self):
+        return self.ax.figure.canvas
+
+    def connect(self):
+        """Start caching the figure background on every full canvas draw"""
+        if self._cid is None:
+            self._cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def disconnect(self):
+        """Remove the tooltip and stop listening to draw events"""
+        if self._cid is not None:
+            self.canvas.mpl_disconnect(self._cid)
+            self._cid = None
+        self._background = None
+        self.annotation.remove()
+        self.canvas.draw_idle()
+
+    def show(self, x, y, text):
+        """Show ``text`` next to display coordinates ``(x, y)``"""
+        self.annotation.xy = (x, y)
+        self.annotation.set_text(text)
+        self.annotation.set_visible(True)
+        self.blit()
+
+    def hide(self):
+        if self.annotation.get_visible():
+            self.annotation.set_visible(False)
+            self.blit()
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        if self.annotation.get_visible():
+            self.ax.draw_artist(self.annotation)
+
+    def blit(self):
+        """Re-render the tooltip on top of the cached background"""
+        if self._background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        if self.annotation.get_visible():
+            self.ax.draw_artist(self.annotation)
+        self.canvas.blit(self.ax.figure.bbox)
@@ -0,0 +1,121 @@
+import time
+import weakref
+from contextlib import contextmanager
+
+from matplotlib.cbook import CallbackRegistry
+
+
+class _DrawHook:
+    """
+    Replacement of a canvas' ``draw`` method timing each draw for the
+    :class:`Instrumentation` instances tracking the canvas. Draws requested
+    via ``draw_idle()`` run through ``canvas.draw``, whereas ``savefig`` and
+    blitting do not.
+    """
+    def __init__(self, canvas):
+        self.draw = canvas.draw
+        self.instrumentations = weakref.WeakSet()
+        canvas.draw = self
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.draw(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            for instrumentation in list(self.instrumentations):
+                instrumentation.add_timing('draw', elapsed)
+
+
+class Instrumentation:
+    """
+    Event notifications and timing counters for an
+    :class:`~mplsel.AxesLineSelector`.
+
+    Events carry batches of lines rather than one notification per line.
+    Supported events and their callback signatures are:
+
+    - ``'selected'``: ``func(lines)`` - lines added to the clipboard
+    - ``'deselected'``: ``func(lines)`` - lines removed from the clipboard
+    - ``'deleted'``: ``func(lines)`` - lines removed from the Axes
+    - ``'restored'``: ``func(lines)`` - lines restored to the Axes by undo/redo
+    - ``'redrawn'``: ``func(ax)`` - Axes for which a redraw was issued
+
+    Note:
+        As with matplotlib's own callbacks, bound methods are held by weak
+        reference whereas plain functions are held strongly.
+    """
+    EVENTS = ('selected', 'deselected', 'deleted', 'restored', 'redrawn')
+
+    def __init__(self):
+        self.callbacks = CallbackRegistry()
+        self._timings = {}  # Name -> [count, total seconds, max seconds]
+        self._canvases = weakref.WeakSet()  # Canvases whose draws are timed
+
+    def connect(self, event, func):
+        """
+        Register ``func`` to be called whenever ``event`` occurs
+
+        Returns:
+            (int): Callback id to be passed to :meth:`disconnect`
+        """
+        if event not in self.EVENTS:
+            raise ValueError(f'Unsupported event: {event}. Must be one of '
+                             f'{self.EVENTS}')
+        return self.callbacks.connect(event, func)
+
+    def disconnect(self, cid):
+        """Unregister a callback previously registered via :meth:`connect`"""
+        self.callbacks.disconnect(cid)
+
+    def emit(self, event, *args):
+        self.callbacks.process(event, *args)
+
+    @contextmanager
+    def timed(self, name):
+        """Context manager accumulating the wall-clock time of its block
+        under the timing counter ``name``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(name, time.perf_counter() - start)
+
+    def add_timing(self, name, elapsed):
+        """Add a duration of ``elapsed`` seconds to timing counter ``name``"""
+        counter = self._timings.setdefault(name, [0, 0., 0.])
+        counter[0] += 1
+        counter[1] += elapsed
+        counter[2] = max(counter[2], elapsed)
+
+    def track_draws(self, canvas):
+        """Time every draw of ``canvas`` under the timing counter
+        ``'draw'``, including draws deferred via ``draw_idle()``"""
+        hook = canvas.draw
+        if not isinstance(hook, _DrawHook):
+            hook = _DrawHook(canvas)
+        hook.instrumentations.add(self)
+        self._canvases.add(canvas)
+
+    def untrack_draws(self):
+        """Stop timing the draws of all canvases passed to
+        :meth:`track_draws`"""
+        for canvas in list(self._canvases):
+            hook = canvas.draw
+            if isinstance(hook, _DrawHook):
+                hook.instrumentations.discard(self)
+        self._canvases.clear()
+
+    def timing_stats(self):
+        """
+        Returns:
+            (dict): Mapping of counter name to a dict with the ``count`` of
+                timed calls and their ``total``, ``mean`` and ``max`` duration
+                in seconds
+        """
+        return {name: {'count': count, 'total': total,
+                       'mean': total / count, 'max': max_}
+                for name, (count, total, max_) in self._timings.items()}
+
+    def reset_timings(self):
+        self._timings.clear()
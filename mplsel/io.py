@@ -0,0 +1,156 @@
+import json
+import os
+
+import numpy as np
+
+from .journal import get_line_attr
+
+FORMAT_NAME = 'mplsel-selection'
+FORMAT_VERSION = 1
+HEADER_FILE = 'header.json'
+X_FILE = 'x.npy'
+Y_FILE = 'y.npy'
+
+
+def _to_jsonable(value):
+    """Convert a line property value to a JSON-serializable equivalent,
+    marking tuples so that they can be restored by :func:`_from_jsonable`"""
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, tuple):
+        return {'__tuple__': [_to_jsonable(v) for v in value]}
+    if isinstance(value, list):
+        return [_to_jsonable(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f'Unsupported property value: {value!r}')
+
+
+def _from_jsonable(value):
+    if isinstance(value, dict) and '__tuple__' in value:
+        return tuple(_from_jsonable(v) for v in value['__tuple__'])
+    if isinstance(value, list):
+        return [_from_jsonable(v) for v in value]
+    return value
+
+
+def _storable(data, line, axis):
+    """Return ``data`` as an array with a dtype that can be memory-mapped,
+    falling back to the unit-converted float data of ``line``"""
+    arr = np.asarray(data)
+    if arr.dtype.hasobject:
+        getter = line.get_xdata if axis == 'x' else line.get_ydata
+        arr = np.asarray(getter(orig=False), dtype=float)
+    return arr
+
+
+def _extents(x, y):
+    """Return the corners of the bounding box of the finite points of a line
+    plus its smallest positive coordinates (if any), which is all that is
+    needed to update the data limits of an Axes (including log scales) for
+    it. Returns **None** for data that is not plain numeric"""
+    if (x.dtype.kind not in 'biuf' or y.dtype.kind not in 'biuf'
+            or len(x) != len(y)):
+        return None
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.any():
+        return []
+    x, y = x[finite], y[finite]
+    points = [[float(x.min()), float(y.min())],
+              [float(x.max()), float(y.max())]]
+    x_pos, y_pos = x[x > 0], y[y > 0]
+    if len(x_pos) > 0 and len(y_pos) > 0:
+        points.append([float(x_pos.min()), float(y_pos.min())])
+    return points
+
+
+def _write_concatenated(path, arrays):
+    """Write ``arrays`` back to back into a single ``.npy`` file without
+    concatenating them in memory first. Returns the offset of each array"""
+    try:
+        dtype = np.result_type(*arrays) if len(arrays) > 0 else float
+    except TypeError:  # e.g. mixed datetime64 and float data
+        dtype = float
+    offsets = np.cumsum([0] + [len(a) for a in arrays])
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=dtype,
+                                    shape=(int(offsets[-1]),))
+    for arr, start, stop in zip(arrays, offsets[:-1], offsets[1:]):
+        out[start:stop] = arr
+    out.flush()
+    del out
+    return offsets[:-1].tolist()
+
+
+def write_selection(path, lines, data_getter, properties):
+    """
+    Write ``lines`` to the directory ``path`` as an ``x.npy`` and ``y.npy``
+    block of back-to-back line data plus a ``header.json`` holding the offsets,
+    data extents and line properties of each line.
+
+    Args:
+        path (str): Directory to write to. Created if it does not exist
+        lines (Sequence[Line2D]): Lines to be written
+        data_getter (Callable): Function with call-signature ``(line)``
+            returning the ``(x, y)`` data to be written for ``line``
+        properties (Iterable[str]): Line properties to be stored
+    """
+    os.makedirs(path, exist_ok=True)
+    xs, ys = [], []
+    for ln in lines:
+        x, y = data_getter(ln)
+        xs.append(_storable(x, ln, 'x'))
+        ys.append(_storable(y, ln, 'y'))
+    x_offsets = _write_concatenated(os.path.join(path, X_FILE), xs)
+    y_offsets = _write_concatenated(os.path.join(path, Y_FILE), ys)
+
+    line_headers = []
+    for ln, x, y, x_off, y_off in zip(lines, xs, ys, x_offsets, y_offsets):
+        props = {}
+        for attr in sorted(properties):
+            try:
+                props[attr] = _to_jsonable(get_line_attr(ln, attr))
+            except (AttributeError, TypeError):
+                continue  # Not available in this matplotlib version
+        line_headers.append({'x_offset': x_off, 'x_length': len(x),
+                             'y_offset': y_off, 'y_length': len(y),
+                             'extents': _extents(x, y),
+                             'properties': props})
+    header = {'format': FORMAT_NAME, 'version': FORMAT_VERSION,
+              'lines': line_headers}
+    with open(os.path.join(path, HEADER_FILE), 'w') as f:
+        json.dump(header, f)
+
+
+def read_selection(path, mmap_mode='r'):
+    """
+    Read a selection written by :func:`write_selection`. Line data is
+    memory-mapped rather than loaded into memory.
+
+    Args:
+        path (str): Directory written by :func:`write_selection`
+        mmap_mode (str or None, optional): Passed to :func:`numpy.load`;
+            Default is **'r'** (read-only memory map)
+
+    Returns:
+        (list[tuple]): ``(x, y, properties, extents)`` for each stored line
+            where ``x`` and ``y`` are views into the memory-mapped data and
+            ``extents`` is a list of ``[x, y]`` points spanning the data
+            limits of the line, or **None** if these were not stored
+    """
+    with open(os.path.join(path, HEADER_FILE)) as f:
+        header = json.load(f)
+    if header.get('format') != FORMAT_NAME:
+        raise ValueError(f'{path} does not contain an exported selection')
+    if header.get('version', 0) > FORMAT_VERSION:
+        raise ValueError(f'Unsupported selection format version: '
+                         f'{header["version"]}')
+    x_all = np.load(os.path.join(path, X_FILE), mmap_mode=mmap_mode)
+    y_all = np.load(os.path.join(path, Y_FILE), mmap_mode=mmap_mode)
+    return [(x_all[h['x_offset']:h['x_offset'] + h['x_length']],
+             y_all[h['y_offset']:h['y_offset'] + h['y_length']],
+             {attr: _from_jsonable(val)
+              for attr, val in h['properties'].items()},
+             h.get('extents'))
+            for h in header['lines']]
@@ -0,0 +1,523 @@
+import sys
+from collections import deque
+
+from matplotlib.lines import Line2D
+
+_REF_NBYTES = 8  # Approximate cost of holding one object reference
+
+
+def _nbytes(obj):
+    """Approximate memory footprint of ``obj`` in bytes"""
+    nbytes = getattr(obj, 'nbytes', None)
+    return nbytes if nbytes is not None else sys.getsizeof(obj)
+
+
+def line_nbytes(line):
+    """Approximate memory held alive by a ``Line2D`` through its x/y data"""
+    return _nbytes(line.get_xdata()) + _nbytes(line.get_ydata())
+
+
+#: Line properties whose Line2D accessors are named differently
+_ACCESSORS = {
+    'dashcapstyle': 'dash_capstyle', 'dashjoinstyle': 'dash_joinstyle',
+    'solidcapstyle': 'solid_capstyle', 'solidjoinstyle': 'solid_joinstyle'}
+
+#: Properties of the dash pattern, which has no public getter
+DASH_PROPERTIES = ('dashOffset', 'dashSeq')
+
+
+def _dash_pattern(line):
+    """Return the ``(offset, sequence)`` dash pattern of ``line`` unscaled by
+    its linewidth. The sequence is **None** for solid lines"""
+    if hasattr(line, '_unscaled_dash_pattern'):  # matplotlib >= 3.5
+        return line._unscaled_dash_pattern
+    return line._us_dashOffset, line._us_dashSeq
+
+
+def get_line_attr(line, attr):
+    """Return ``attr`` of ``line`` via its public getter if available"""
+    if attr in DASH_PROPERTIES and isinstance(line, Line2D):
+        return _dash_pattern(line)[DASH_PROPERTIES.index(attr)]
+    getter = getattr(line, f'get_{_ACCESSORS.get(attr, attr)}', None)
+    return getter() if getter is not None else getattr(line, f'_{attr}')
+
+
+def set_line_attr(line, attr, value):
+    """
+    Set ``attr`` of ``line`` via its public setter if available. The dash
+    pattern is set via ``set_linestyle((offset, sequence))`` and is left
+    unchanged for solid lines given no dash sequence.
+    """
+    if attr in DASH_PROPERTIES and isinstance(line, Line2D):
+        pattern = list(_dash_pattern(line))
+        pattern[DASH_PROPERTIES.index(attr)] = value
+        offset, seq = pattern
+        if seq is not None:
+            line.set_linestyle((offset or 0, seq))
+        return
+    setter = getattr(line, f'set_{_ACCESSORS.get(attr, attr)}', None)
+    if setter is not None:
+        setter(value)
+    else:
+        setattr(line, f'_{attr}', value)
+
+
+def _removed(line):
+    """Remove method of lines already taken out of ``ax._children``"""
+
+
+def set_lines(ax, lines):
+    """
+    Make ``lines`` the lines of ``ax``, in that order. Lines of ``ax`` not in
+    ``lines`` are removed from it and lines not yet in ``ax`` are added.
+
+    ``ax.lines`` is a plain list prior to matplotlib 3.5 (and for a
+    :class:`~mplsel.LineStore`) and is assigned directly. In later versions it
+    is a read-only view of ``ax._children``, so lines are removed via
+    ``Line2D.remove``, added via ``Axes.add_line`` and reordered by permuting
+    their slots in ``ax._children``.
+
+    Args:
+        ax (matplotlib.axes.Axes or LineStore): Owner of the lines
+        lines (Sequence[Line2D]): New lines of ``ax``
+    """
+    if isinstance(ax.lines, list):
+        ax.lines = list(lines)
+        return
+    keep = {id(ln) for ln in lines}
+    current = {id(ln) for ln in ax.lines}
+    removed = [ln for ln in ax.lines if id(ln) not in keep]
+    if len(removed) > 0:
+        # Filter ax._children in one pass instead of once per removed line
+        removed_ids = {id(ln) for ln in removed}
+        ax._children[:] = [a for a in ax._children if id(a) not in removed_ids]
+        for ln in removed:
+            ln._remove_method = _removed
+            ln.remove()  # Detaches the line from the Axes and figure
+    for ln in lines:
+        if id(ln) not in current:
+            ax.add_line(ln)
+    slots = [i for i, a in enumerate(ax._children) if isinstance(a, Line2D)]
+    assert len(slots) == len(lines), 'All lines of ax must be Line2D objects'
+    for i, ln in zip(slots, lines):
+        ax._children[i] = ln
+    ax.stale = True
+
+
+def add_line_unscaled(ax, line):
+    """
+    Add ``line`` to ``ax`` like ``Axes.add_line`` but without updating the
+    data limits of ``ax``, which caches a full copy of the line's data. Use
+    ``ax.update_datalim`` to include the line in autoscaling. Prior to
+    matplotlib 3.5, where ``Axes.add_artist`` does not add to ``ax.lines``,
+    this falls back to ``Axes.add_line``.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to add ``line`` to
+        line (Line2D): Line to be added
+
+    Returns:
+        (Line2D): ``line``
+    """
+    if isinstance(ax.lines, list):
+        return ax.add_line(line)
+    if not line.get_label():
+        line.set_label(f'_child{len(ax._children)}')
+    ax.add_artist(line)
+    if hasattr(line, '_set_in_autoscale'):
+        line._set_in_autoscale(True)
+    return line
+
+
+def insert_lines(lines, indexed_lines):
+    """
+    Merge ``indexed_lines`` back into ``lines`` at their original positions
+
+    Args:
+        lines (list): Current lines
+        indexed_lines (Iterable[tuple]): ``(index, line)`` pairs sorted in
+            ascending order of ``index``
+
+    Returns:
+        (list): New list with the lines inserted
+    """
+    merged = []
+    remaining = iter(lines)
+    for ind, ln in indexed_lines:
+        while len(merged) < ind:
+            nxt = next(remaining, None)
+            if nxt is None:
+                break
+            merged.append(nxt)
+        merged.append(ln)
+    merged.extend(remaining)
+    return merged
+
+
+class JournalEntry:
+    """
+    Base class for a single undoable operation on the lines of an Axes. Each
+    entry stores only the delta required to revert or re-apply the operation.
+    """
+    #: Short name describing the kind of operation
+    kind = None
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by this entry in bytes"""
+        raise NotImplementedError
+
+    @property
+    def reverted_nbytes(self):
+        """Approximate memory held by this entry once undone, in bytes"""
+        return self.nbytes
+
+    def undo(self, ax):
+        raise NotImplementedError
+
+    def redo(self, ax):
+        raise NotImplementedError
+
+
+class RemoveLinesEntry(JournalEntry):
+    """
+    Removal of lines from an Axes
+
+    Args:
+        indexed_lines (list[tuple]): ``(index, line)`` pairs of the removed
+            lines with their indices in ``ax.lines`` prior to removal, sorted
+            in ascending order of index
+    """
+    kind = 'delete'
+
+    def __init__(self, indexed_lines):
+        self.indexed_lines = indexed_lines
+
+    @property
+    def lines(self):
+        return [ln for _, ln in self.indexed_lines]
+
+    @property
+    def nbytes(self):
+        # Removed lines are kept alive solely by the journal
+        return sum(2 * _REF_NBYTES + line_nbytes(ln)
+                   for _, ln in self.indexed_lines)
+
+    @property
+    def reverted_nbytes(self):
+        # Restored lines are owned by the Axes again
+        return 2 * _REF_NBYTES * len(self.indexed_lines)
+
+    def undo(self, ax):
+        set_lines(ax, insert_lines(ax.lines, self.indexed_lines))
+
+    def redo(self, ax):
+        removed = {id(ln) for _, ln in self.indexed_lines}
+        set_lines(ax, [ln for ln in ax.lines if id(ln) not in removed])
+
+
+class AddLinesEntry(RemoveLinesEntry):
+    """
+    Addition of lines to an Axes (e.g. by pasting). The inverse of
+    :class:`RemoveLinesEntry`
+
+    Args:
+        indexed_lines (list[tuple]): ``(index, line)`` pairs of the added lines
+            with their indices in ``ax.lines`` after addition, sorted in
+            ascending order of index
+    """
+    kind = 'add'
+
+    @property
+    def nbytes(self):
+        # Added lines are owned by the Axes while the entry is undoable
+        return RemoveLinesEntry.reverted_nbytes.fget(self)
+
+    @property
+    def reverted_nbytes(self):
+        return RemoveLinesEntry.nbytes.fget(self)
+
+    def undo(self, ax):
+        RemoveLinesEntry.redo(self, ax)
+
+    def redo(self, ax):
+        RemoveLinesEntry.undo(self, ax)
+
+
+class ReorderLinesEntry(JournalEntry):
+    """
+    Permutation of the lines of an Axes. The lines are remembered in their
+    order before and after the permutation, so that undo and redo reorder
+    lines by identity. This keeps them correct if lines were removed or
+    restored in the meantime (e.g. by undoing an earlier deletion first), in
+    which case lines not in the permutation keep their positions.
+
+    Args:
+        order (Iterable[int]): New index for the line at each old index, as
+            accepted by :meth:`AxesLineSelector.reorder_lines`
+    """
+    kind = 'reorder'
+
+    def __init__(self, order):
+        self.order = tuple(order)
+        self._before = self._after = None  # Lines in old and new order
+
+    @property
+    def nbytes(self):
+        return sys.getsizeof(self.order) + sys.getsizeof(self._before) \
+            + sys.getsizeof(self._after)
+
+    @staticmethod
+    def _permute(lines, order):
+        new_lines = [None] * len(lines)
+        for old_ind, new_ind in enumerate(order):
+            new_lines[new_ind] = lines[old_ind]
+        return new_lines
+
+    @staticmethod
+    def _arrange(ax, lines):
+        """Place those of ``lines`` present in ``ax`` in the given order into
+        the positions they currently occupy"""
+        current = list(ax.lines)
+        members = {id(ln) for ln in lines}
+        slots = [i for i, ln in enumerate(current) if id(ln) in members]
+        present = {id(current[i]) for i in slots}
+        for i, ln in zip(slots, [ln for ln in lines if id(ln) in present]):
+            current[i] = ln
+        set_lines(ax, current)
+
+    def undo(self, ax):
+        self._arrange(ax, self._before)
+
+    def redo(self, ax):
+        if self._before is None:
+            self._before = tuple(ax.lines)
+            self._after = tuple(self._permute(self._before, self.order))
+        self._arrange(ax, self._after)
+
+
+class SetAttrEntry(JournalEntry):
+    """
+    Change of a line property on a subset of lines
+
+    Args:
+        attr (str): Name of the line property that was changed
+        lines (Sequence[Line2D]): Lines whose property was changed
+        old_values (Sequence): Property values prior to the change
+        new_values (Sequence): Property values after the change
+    """
+    kind = 'setattr'
+
+    def __init__(self, attr, lines, old_values, new_values):
+        self.attr = attr
+        self.lines = tuple(lines)
+        self.old_values = tuple(old_values)
+        self.new_values = tuple(new_values)
+
+    @property
+    def nbytes(self):
+        return sys.getsizeof(self.lines) + sys.getsizeof(self.old_values) \
+            + sys.getsizeof(self.new_values)
+
+    def undo(self, ax):
+        for ln, val in zip(self.lines, self.old_values):
+            set_line_attr(ln, self.attr, val)
+
+    def redo(self, ax):
+        for ln, val in zip(self.lines, self.new_values):
+            set_line_attr(ln, self.attr, val)
+
+
+class CompoundEntry(JournalEntry):
+    """
+    Several operations recorded, undone and redone as a single operation
+
+    Args:
+        entries (Sequence[JournalEntry]): Entries in the order they were applied
+    """
+    kind = 'compound'
+
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+
+    @property
+    def nbytes(self):
+        return sum(entry.nbytes for entry in self.entries)
+
+    @property
+    def reverted_nbytes(self):
+        return sum(entry.reverted_nbytes for entry in self.entries)
+
+    def undo(self, ax):
+        for entry in reversed(self.entries):
+            entry.undo(ax)
+
+    def redo(self, ax):
+        for entry in self.entries:
+            entry.redo(ax)
+
+
+def held_lines(entries):
+    """Return the set of lines removed or added by ``entries``, including
+    those of compound entries"""
+    kinds = (RemoveLinesEntry.kind, AddLinesEntry.kind)
+    return {ln for entry in entries
+            for sub in getattr(entry, 'entries', (entry,))
+            if sub.kind in kinds for ln in sub.lines}
+
+
+class EditJournal:
+    """
+    Undo/redo journal of :class:`JournalEntry` operations on an Axes. Each
+    entry only stores what changed, so that undo and redo cost scales with the
+    number of changed lines rather than with the number of lines in the Axes.
+
+    The journal is bounded by an approximate memory budget covering both the
+    undo and redo history rather than by the number of entries. Once the
+    budget is exceeded, the oldest undoable entries are evicted first, then
+    the redoable entries furthest from the current state, although the most
+    recently applied or reverted entry is always retained.
+
+    Args:
+        max_bytes (int, optional): Approximate memory budget in bytes for all
+            undoable and redoable entries; Default is **256 MiB**
+        on_evict (Callable, optional): Function with call-signature
+            ``(entries)`` called with the entries evicted to stay within
+            ``max_bytes``
+
+    Attributes:
+        undo_stack (collections.deque): ``(entry, nbytes)`` pairs of undoable
+            entries, oldest first
+        redo_stack (list): Reverted entries that may be re-applied, most
+            recently reverted last
+    """
+    def __init__(self, max_bytes=256 * 2 ** 20, on_evict=None):
+        self._max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self._redo_sizes = []  # Cached nbytes of the entries in redo_stack
+        self._nbytes = 0
+
+    @property
+    def max_bytes(self):
+        """Approximate memory budget in bytes. Lowering it evicts entries
+        immediately"""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        self._max_bytes = max_bytes
+        if self.redo_stack:
+            self._evict(keep=self.redo_stack[-1])
+        elif self.undo_stack:
+            self._evict(keep=self.undo_stack[-1][0])
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by undoable entries in bytes"""
+        return self._nbytes
+
+    @property
+    def redo_nbytes(self):
+        """Approximate memory held by redoable entries in bytes"""
+        return sum(self._redo_sizes)
+
+    def record(self, entry):
+        """
+        Record a newly applied operation. This invalidates any redo history.
+
+        Args:
+            entry (JournalEntry): The operation that was just applied
+        """
+        self._push(entry)
+        self.redo_stack.clear()
+        self._redo_sizes.clear()
+        self._evict(keep=entry)
+
+    def _push(self, entry):
+        nbytes = entry.nbytes  # Cached so that eviction stays consistent
+        self.undo_stack.append((entry, nbytes))
+        self._nbytes += nbytes
+
+    def _evict(self, keep):
+        """Evict entries other than ``keep`` until within the budget"""
+        evicted = []
+        redo_nbytes = self.redo_nbytes
+        while self._nbytes + redo_nbytes > self._max_bytes:
+            if self.undo_stack and self.undo_stack[0][0] is not keep:
+                entry, nbytes = self.undo_stack.popleft()
+                self._nbytes -= nbytes
+            elif self.redo_stack and self.redo_stack[0] is not keep:
+                entry = self.redo_stack.pop(0)
+                redo_nbytes -= self._redo_sizes.pop(0)
+            else:
+                break
+            evicted.append(entry)
+        if evicted and self.on_evict is not None:
+            self.on_evict(evicted)
+
+    def _position(self, kind):
+        """Position in :attr:`undo_stack` of the most recent entry of
+        ``kind``, or **None** if there is none"""
+        for i in range(len(self.undo_stack) - 1, -1, -1):
+            if self.undo_stack[i][0].kind == kind:
+                return i
+        return None
+
+    def peek(self, kind=None):
+        """
+        Return the most recent undoable entry, or the most recent one of
+        ``kind`` if provided. Returns **None** if there is no such entry
+        """
+        if kind is not None:
+            i = self._position(kind)
+            return self.undo_stack[i][0] if i is not None else None
+        return self.undo_stack[-1][0] if self.undo_stack else None
+
+    def undo(self, ax, kind=None):
+        """
+        Revert the most recent entry on ``ax``
+
+        Args:
+            ax (matplotlib.axes.Axes or LineStore): Owner of the lines
+            kind (str, optional): Only revert the most recent entry of this
+                :attr:`JournalEntry.kind`, leaving more recent entries of
+                other kinds in place; Default of **None** reverts the most
+                recent entry
+
+        Returns:
+            (JournalEntry): The entry that was reverted
+        """
+        i = len(self.undo_stack) - 1 if kind is None else self._position(kind)
+        entry, nbytes = self.undo_stack[i]
+        del self.undo_stack[i]
+        self._nbytes -= nbytes
+        entry.undo(ax)
+        self.redo_stack.append(entry)
+        self._redo_sizes.append(entry.reverted_nbytes)
+        self._evict(keep=entry)
+        return entry
+
+    def redo(self, ax):
+        """
+        Re-apply the most recently reverted entry on ``ax``
+
+        Returns:
+            (JournalEntry): The entry that was re-applied
+        """
+        entry = self.redo_stack.pop()
+        self._redo_sizes.pop()
+        entry.redo(ax)
+        self._push(entry)
+        self._evict(keep=entry)
+        return entry
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self._redo_sizes.clear()
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self.undo_stack)
@@ -0,0 +1,246 @@
+from inspect import signature
+
+from matplotlib.colors import to_hex
+from matplotlib.legend import Legend
+from matplotlib.lines import Line2D
+from matplotlib.offsetbox import TextArea
+from matplotlib.patches import BoxStyle
+
+# Legend attributes stored under the name of the matching Legend kwarg
+_LEGEND_ATTRS = (
+    'numpoints', 'markerscale', 'scatterpoints', 'borderpad', 'labelspacing',
+    'handlelength', 'handleheight', 'handletextpad', 'borderaxespad',
+    'columnspacing', 'shadow')
+
+# Keyword arguments accepted by Legend in the installed matplotlib version
+_LEGEND_PARAMS = set(signature(Legend.__init__).parameters)
+
+
+def _markerfirst(legend):
+    """Whether legend handles precede their labels (the ``markerfirst`` kwarg,
+    which is not stored by the legend)"""
+    try:
+        item = legend._legend_handle_box.get_children()[0].get_children()[0]
+        return not isinstance(item.get_children()[0], TextArea)
+    except (AttributeError, IndexError):
+        return True
+
+
+def legend_config(legend):
+    """
+    Recover the keyword arguments a legend was created with, so that it can be
+    rebuilt with the same configuration
+
+    Args:
+        legend (matplotlib.legend.Legend): Existing legend
+
+    Returns:
+        (dict): Keyword arguments accepted by ``ax.legend``
+    """
+    config = {attr: getattr(legend, attr) for attr in _LEGEND_ATTRS
+              if hasattr(legend, attr)}
+    config['loc'] = legend._loc
+    config['ncol'] = getattr(legend, '_ncols', None) or legend._ncol
+    config['prop'] = legend.prop
+    config['frameon'] = legend.get_frame_on()
+    config['mode'] = getattr(legend, '_mode', None)
+    config['markerfirst'] = _markerfirst(legend)
+    frame = legend.get_frame()
+    config['framealpha'] = frame.get_alpha()
+    config['facecolor'] = frame.get_facecolor()
+    config['edgecolor'] = frame.get_edgecolor()
+    config['fancybox'] = isinstance(frame.get_boxstyle(), BoxStyle.Round)
+    label_colors = {to_hex(t.get_color(), keep_alpha=True)
+                    for t in legend.texts}
+    if len(label_colors) == 1:
+        config['labelcolor'] = label_colors.pop()
+    elif len(label_colors) > 1:
+        config['labelcolor'] = 'linecolor'
+    if getattr(legend, '_scatteryoffsets', None) is not None:
+        config['scatteryoffsets'] = \
+            legend._scatteryoffsets[:legend.scatterpoints]
+    if getattr(legend, '_custom_handler_map', None):
+        config['handler_map'] = legend._custom_handler_map
+    if hasattr(legend, '_alignment'):
+        config['alignment'] = legend._alignment
+    if legend._bbox_to_anchor is not None:
+        config['bbox_to_anchor'] = legend._bbox_to_anchor
+    title = legend.get_title()
+    if title.get_text():
+        config['title'] = title.get_text()
+        config['title_fontproperties'] = title.get_fontproperties()
+    # Drop kwargs unknown to the installed matplotlib version
+    return {key: val for key, val in config.items() if key in _LEGEND_PARAMS}
+
+
+def legend_entries(legend, ax):
+    """
+    Recover the ``(handle, label)`` entries of an existing legend of ``ax``
+    by matching its labels with those of the artists of ``ax``. Labels
+    matching no artist (e.g. custom labels, or entries whose artist has since
+    been removed) are skipped.
+
+    Returns:
+        (list[tuple] or None): Entries in legend order, or **None** if no
+            label of the legend matches an artist
+    """
+    candidates = {}
+    for artist in [*ax.get_children(), *ax.containers]:
+        candidates.setdefault(artist.get_label(), []).append(artist)
+    entries = []
+    for text in legend.texts:
+        matches = candidates.get(text.get_text())
+        if matches:
+            entries.append((matches.pop(0), text.get_text()))
+    return entries if len(entries) > 0 or len(legend.texts) == 0 else None
+
+
+def _legend_handles(legend):
+    handles = getattr(legend, 'legend_handles', None)
+    return handles if handles is not None else legend.legendHandles
+
+
+class LegendManager:
+    """
+    Incrementally maintained legend of an Axes. The legend's configuration
+    (``loc``, ``ncol``, font properties, title, frame, ...) and its entries
+    are captured from the existing legend and reused whenever the legend has
+    to be rebuilt. A legend showing all labelled artists of the Axes follows
+    artists being added or removed, whereas a legend created with explicit
+    handles keeps to those handles that remain in the Axes. If only styles of
+    the legend's lines changed, the existing legend handles are restyled in
+    place instead of rebuilding the legend and re-measuring its text.
+
+    Entries are recovered by matching the legend's labels with the artists of
+    the Axes (see :func:`legend_entries`). Legends none of whose labels match
+    (e.g. all custom labels) are left untouched.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance whose legend is managed
+        max_entries (int, optional): Maximum number of entries shown at once.
+            Further entries are paged (see :attr:`page`) and summarized by a
+            final ``'... N more'`` entry. Default of **None** shows all entries
+    """
+    def __init__(self, ax, max_entries=None):
+        self.ax = ax
+        self.max_entries = max_entries
+        self.page = 0
+        self._legend = None  # Legend created by this manager
+        self._config = {}
+        self._draggable = False
+        self._entries = None  # (handle, label) pairs shown in self._legend
+        self._handles = None  # Explicit handles of the legend, if any
+        self._matched = True  # Entries of the legend could be recovered
+        self._more_handle = Line2D([], [], linestyle='None')
+
+    @property
+    def n_pages(self):
+        """Returns number of legend pages for the current entries"""
+        if self.max_entries is None:
+            return 1
+        n_entries = len(self._all_entries()[0])
+        return max(1, -(-n_entries // self.max_entries))
+
+    def _all_entries(self):
+        """Handles and labels of all entries the legend should show"""
+        if self._handles is None:
+            return self.ax.get_legend_handles_labels()
+        present = {*self.ax.get_children(), *self.ax.containers}
+        handles = [h for h in self._handles if h in present
+                   and h.get_label() and not h.get_label().startswith('_')]
+        return handles, [h.get_label() for h in handles]
+
+    def _capture(self, legend):
+        """Adopt the configuration of a legend not created by this manager"""
+        self._config = legend_config(legend)
+        draggable = getattr(legend, 'get_draggable', None)
+        self._draggable = draggable() if draggable is not None \
+            else legend._draggable is not None
+        self._legend = legend
+        self._entries = None
+        entries = legend_entries(legend, self.ax)
+        self._matched = entries is not None
+        self._handles = None
+        if self._matched and entries != list(
+                zip(*self.ax.get_legend_handles_labels())):
+            self._handles = [h for h, _ in entries]
+
+    def _visible_entries(self, handles, labels):
+        entries = list(zip(handles, labels))
+        if self.max_entries is None or len(entries) <= self.max_entries:
+            return entries
+        n_pages = -(-len(entries) // self.max_entries)
+        self.page = min(max(self.page, 0), n_pages - 1)
+        start = self.page * self.max_entries
+        shown = entries[start:start + self.max_entries]
+        n_more = len(entries) - len(shown)
+        if n_more > 0:
+            shown.append((self._more_handle, f'... {n_more} more'))
+        return shown
+
+    def _same_entries(self, entries):
+        if self._entries is None or len(entries) != len(self._entries):
+            return False
+        return all(h is old_h and lbl == old_lbl for (h, lbl), (old_h, old_lbl)
+                   in zip(entries, self._entries))
+
+    def _restyle(self):
+        """Update the legend handles from their lines in place. Returns
+        ``False`` if the handles cannot be restyled and a rebuild is needed"""
+        handles = _legend_handles(self._legend)
+        if len(handles) != len(self._entries):
+            return False
+        handler_map = self._legend.get_legend_handler_map()
+        for legend_handle, (orig_handle, _) in zip(handles, self._entries):
+            if legend_handle is None or hasattr(legend_handle, '_legmarker'):
+                return False  # Separate marker proxy of older matplotlib
+            handler = self._legend.get_legend_handler(handler_map, orig_handle)
+            if handler is None:
+                return False
+            # update_prop resets the transform, markevery and markersize
+            # that the handler adjusted when it created the legend handle
+            transform = legend_handle.get_transform()
+            markevery = getattr(legend_handle, 'get_markevery', None)
+            markevery = markevery() if markevery is not None else None
+            handler.update_prop(legend_handle, orig_handle, self._legend)
+            legend_handle.set_transform(transform)
+            if isinstance(legend_handle, Line2D):
+                legend_handle.set_markevery(markevery)
+                if self._legend.markerscale != 1:
+                    legend_handle.set_markersize(
+                        legend_handle.get_markersize()
+                        * self._legend.markerscale)
+        self._legend.stale = True
+        return True
+
+    def refresh(self):
+        """
+        Bring the legend up to date with the Axes if a visible legend exists.
+        Rebuilds the legend, with its original configuration, only if entries
+        were added, removed or relabelled; otherwise restyles it in place.
+
+        Returns:
+            (bool): ``True`` if the legend was rebuilt
+        """
+        legend = self.ax.get_legend()
+        if legend is None or not legend.get_visible():
+            return False
+        if legend is not self._legend:
+            self._capture(legend)
+        if not self._matched:
+            return False
+        entries = self._visible_entries(*self._all_entries())
+        if self._entries is None:
+            # Adopt the handles of a legend matching the current entries
+            if [t.get_text() for t in legend.texts] == \
+                    [lbl for _, lbl in entries]:
+                self._entries = entries
+        if self._same_entries(entries) and self._restyle():
+            return False
+        handles = [h for h, _ in entries]
+        labels = [lbl for _, lbl in entries]
+        self._legend = self.ax.legend(handles, labels, **self._config)
+        if self._draggable:
+            self._legend.set_draggable(True)
+        self._entries = entries
+        return True
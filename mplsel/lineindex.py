@@ -0,0 +1,221 @@
+import fnmatch
+import re
+
+from matplotlib.colors import to_rgba
+from matplotlib.lines import ls_mapper_r
+
+
+def _normalize_color(color):
+    return to_rgba(color)
+
+
+def _normalize_linestyle(linestyle):
+    return ls_mapper_r.get(linestyle, linestyle)
+
+
+def _normalize_marker(marker):
+    if marker in (None, '', ' ', 'none'):
+        return 'None'
+    return marker
+
+
+def label_matcher(pattern, mode='exact'):
+    """
+    Return a predicate testing whether a label matches ``pattern``
+
+    Args:
+        pattern (str): Label, glob pattern or regular expression
+        mode (str, optional): One of ``'exact'``, ``'glob'`` (see
+            :mod:`fnmatch`) or ``'regex'`` (matched with :func:`re.search`);
+            Default is **'exact'**
+
+    Returns:
+        (Callable): Function with call-signature ``(label)``
+    """
+    if mode == 'exact':
+        return lambda label: label == pattern
+    if mode == 'glob':
+        return re.compile(fnmatch.translate(pattern)).match
+    if mode == 'regex':
+        return re.compile(pattern).search
+    raise ValueError(f"Unsupported mode: {mode}. Must be one of "
+                     f"('exact', 'glob', 'regex')")
+
+
+class LineIndex:
+    """
+    Incrementally maintained index from line properties to the lines of an
+    Axes, used to answer label and style queries with dictionary lookups
+    instead of a scan over all lines.
+
+    The index of a property is built on its first query. Afterwards, lines
+    added to or removed from the Axes are detected by comparing its artists
+    with those at the previous query and indexed or dropped individually;
+    changes made through
+    :class:`~mplsel.AxesLineSelector` are reported via :meth:`add`,
+    :meth:`remove` and :meth:`refresh`. Indexed properties are listed in
+    :attr:`KEYS`.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance whose lines are indexed
+
+    Note:
+        Properties changed directly on a ``Line2D`` (e.g. ``ln.set_label``)
+        rather than via the selector are not detected. Call :meth:`refresh`
+        or :meth:`invalidate` after such changes.
+    """
+    KEYS = {
+        'label': str,
+        'color': _normalize_color,
+        'linestyle': _normalize_linestyle,
+        'marker': _normalize_marker}
+
+    def __init__(self, ax):
+        self.ax = ax
+        self._lines = {}  # Indexed lines in insertion order
+        self._values = {}  # Key -> {line: normalized value}
+        self._buckets = {}  # Key -> {normalized value: {line: None}}
+        self._synced = None  # Artists of the Axes at last sync
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the index in bytes"""
+        # References from the line table and, per key, the value and bucket
+        n_synced = len(self._synced) if self._synced is not None else 0
+        return 8 * (len(self._lines) * (1 + 2 * len(self._values)) + n_synced)
+
+    def invalidate(self):
+        """Discard the index; it is rebuilt from ``ax.lines`` on next use"""
+        self._lines.clear()
+        self._values.clear()
+        self._buckets.clear()
+        self._synced = None
+
+    def _value(self, line, key):
+        return self.KEYS[key](getattr(line, f'get_{key}')())
+
+    def _index_line(self, line, key):
+        value = self._value(line, key)
+        self._values[key][line] = value
+        self._buckets[key].setdefault(value, {})[line] = None
+
+    def _unindex_line(self, line, key):
+        value = self._values[key].pop(line)
+        bucket = self._buckets[key][value]
+        del bucket[line]
+        if len(bucket) == 0:
+            del self._buckets[key][value]
+
+    def add(self, lines):
+        """Index ``lines`` that were added to the Axes"""
+        for ln in lines:
+            if ln in self._lines:
+                continue
+            self._lines[ln] = None
+            for key in self._values:
+                self._index_line(ln, key)
+
+    def remove(self, lines):
+        """Drop ``lines`` that were removed from the Axes from the index"""
+        for ln in lines:
+            if ln in self._lines:
+                del self._lines[ln]
+                for key in self._values:
+                    self._unindex_line(ln, key)
+
+    def refresh(self, lines, key=None):
+        """
+        Re-index ``lines`` after a change of their properties
+
+        Args:
+            lines (Iterable[Line2D]): Lines whose properties changed
+            key (str, optional): Changed property. Default of **None**
+                re-indexes all indexed properties
+        """
+        keys = list(self._values) if key is None else \
+            [key] if key in self._values else []
+        for ln in lines:
+            if ln not in self._lines:
+                continue
+            for k in keys:
+                self._unindex_line(ln, k)
+                self._index_line(ln, k)
+
+    def _artists(self):
+        # ax.lines is a filtered view of ax._children in recent matplotlib
+        # versions, which is slower to copy than the list it filters. The
+        # artists are held rather than their ids, so ids cannot be reused
+        children = getattr(self.ax, '_children', None)
+        return tuple(children if children is not None else self.ax.lines)
+
+    def _sync(self):
+        """Pick up lines added to or removed from the Axes by other means
+        than the selector"""
+        artists = self._artists()
+        if artists == self._synced:  # Compares the artists by identity
+            return
+        self._synced = artists
+        current = dict.fromkeys(self.ax.lines)
+        self.remove([ln for ln in self._lines if ln not in current])
+        self.add([ln for ln in current if ln not in self._lines])
+
+    def _bucket_index(self, key):
+        """Return the mapping of normalized value to lines for ``key``"""
+        if key not in self.KEYS:
+            raise ValueError(f'Unsupported key: {key}. Must be one of '
+                             f'{tuple(self.KEYS)}')
+        self._sync()
+        if key not in self._values:
+            self._values[key] = {}
+            self._buckets[key] = {}
+            for ln in self._lines:
+                self._index_line(ln, key)
+        return self._buckets[key]
+
+    def lookup(self, key, value):
+        """
+        Returns:
+            (list[Line2D]): Lines whose ``key`` property equals ``value``
+        """
+        buckets = self._bucket_index(key)
+        return list(buckets.get(self.KEYS[key](value), ()))
+
+    def labels(self):
+        """Returns list of distinct labels of the lines in the Axes"""
+        return list(self._bucket_index('label'))
+
+    def match_label(self, pattern, mode='exact'):
+        """
+        Return lines whose label matches ``pattern``. Glob and regular
+        expression patterns are matched against the distinct labels only.
+
+        Args:
+            pattern (str): Label, glob pattern or regular expression
+            mode (str, optional): One of ``'exact'``, ``'glob'`` (see
+                :mod:`fnmatch`) or ``'regex'`` (matched with
+                :func:`re.search`); Default is **'exact'**
+
+        Returns:
+            (list[Line2D]): Matching lines
+        """
+        if mode == 'exact':
+            return self.lookup('label', pattern)
+        matches = label_matcher(pattern, mode)
+        buckets = self._bucket_index('label')
+        return [ln for label, bucket in buckets.items() if matches(label)
+                for ln in bucket]
+
+    def match_style(self, **style):
+        """
+        Returns:
+            (list[Line2D]): Lines matching all ``key=value`` pairs in
+                ``style``, where each key is one of :attr:`KEYS`
+        """
+        if len(style) == 0:
+            raise ValueError('At least one style property must be provided')
+        # Intersect starting from the smallest candidate set
+        candidates = sorted(
+            (self._bucket_index(key).get(self.KEYS[key](value), {})
+             for key, value in style.items()), key=len)
+        return [ln for ln in candidates[0]
+                if all(ln in other for other in candidates[1:])]
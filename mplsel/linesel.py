@@ -1,48 +1,82 @@
-from collections import deque
+import logging
+import operator
+import weakref
+from contextlib import contextmanager
+from functools import partial
+from numbers import Number
 from pprint import pformat
 
-import matplotlib.pyplot as plt
-
-
-class SnapshotBuffer:
-    """
-    A simple class for storing snapshots of any items (list of Line2D
-    objects here) and rewinding snapshots if needed.
-
-    Args:
-        max_len (int, optional): Maximum length of the snapshot buffer.
-            Setting this to a large value may result in out-of-memory errors
-            if the items being snapshotted are large; Default is **25**
-    """
-    def __init__(self, max_len=25):
-        self.max_len = max_len
-        self.item_snapshots = deque(maxlen=max_len)
-
-    def snapshot(self, items):
-        """
-        Snapshot the provided ``items`` in the internal buffer
-
-        Args:
-            items (list or Any): Any object that supports a `.copy()` method.
-                Typically a list
-        """
-        self.item_snapshots.append(items.copy())
-
-    def rewind(self):
-        """
-        Rewind the buffer by one snapshot and return the items from the last
-        snapshot
-
-        Returns:
-            (Any): The items stored in the last snapshot
-        """
-        return self.item_snapshots.pop()
-
-    def __len__(self):
-        return len(self.item_snapshots)
-
-
-class AxesLineSelector:
+import numpy as np
+from matplotlib._pylab_helpers import Gcf
+from matplotlib.artist import Artist
+from matplotlib.lines import Line2D
+
+from .collection import ConsolidatedLineCollection, can_consolidate
+from .decimate import LineDecimator
+from .highlight import HoverTooltip, SelectionHighlighter
+from .io import read_selection, write_selection
+from .editor import LineEditor
+from .journal import (
+    DASH_PROPERTIES, AddLinesEntry, RemoveLinesEntry, add_line_unscaled,
+    get_line_attr, set_line_attr)
+from .legend import LegendManager
+from .lineindex import LineIndex
+from .picking import IdBufferPicker
+from .region import as_region, lines_in_region
+from .selection import LineSelection
+from .spatial import SegmentIndex, line_distance
+from .storage import (
+    bind_data, buffer_key, cached_arrays, compact_lines, data_nbytes,
+    line_arrays, readonly_copy)
+from .stream import LineStreamer
+from .style import values_equal
+
+logger = logging.getLogger(__name__)
+
+#: Live selectors, held weakly so that they can be released once their
+#: pyplot figure has been closed
+_selectors = weakref.WeakSet()
+
+
+def _release_closed_selectors():
+    """Release the state of selectors whose pyplot figure has been closed,
+    which, unlike closing a GUI window, emits no ``close_event``"""
+    open_managers = {id(m) for m in Gcf.get_all_fig_managers()}
+    for sel in list(_selectors):
+        manager = sel._manager_ref() if sel._manager_ref is not None else None
+        if sel._manager_ref is not None and id(manager) not in open_managers:
+            logger.debug('Releasing selector of closed figure: %s', sel)
+            sel._on_close(None)
+
+
+def _readonly_view(data):
+    """Return a read-only view of ``data`` if it is a NumPy array so that it
+    can be shared between lines. ``data`` itself is made read-only too, as
+    in-place writes to it would otherwise change all lines sharing it"""
+    if isinstance(data, np.ndarray):
+        data.flags.writeable = False
+        return data.view()
+    return data
+
+
+def _is_numeric(data):
+    return np.asarray(data).dtype.kind in 'biuf'
+
+
+def _new_line(xdata, ydata, share_data=False, share_x=None):
+    """Return a new ``Line2D`` for ``xdata``/``ydata``, either bound to
+    read-only views of the given arrays or to copies of them. ``share_x``
+    overrides ``share_data`` for ``xdata``"""
+    share_x = share_data if share_x is None else share_x
+    new_l = Line2D([], [])
+    bind_data(new_l,
+              _readonly_view(xdata) if share_x else np.array(xdata, copy=True),
+              _readonly_view(ydata) if share_data
+              else np.array(ydata, copy=True))
+    return new_l
+
+
+class AxesLineSelector(LineEditor):
     """
     A utility class that enables both interactive or programmatic selection
     and/or deletion of ``Line2D`` objects in the provided Axes instance. Also
@@ -56,44 +90,323 @@ class AxesLineSelector:
         picker_arg (Any, optional): A valid value for the matplotlib ``picker``
             arg for any ``Artist`` instance as described here:
             https://matplotlib.org/3.2.1/users/event_handling.html#object-picking
+        journal_max_bytes (int, optional): Approximate memory budget in bytes
+            for the undo/redo :attr:`journal`; Default is **256 MiB**
+        release_on_close (bool, optional): If **True**, :meth:`release` all
+            state held by the selector once its figure is closed, so that the
+            figure and its line data can be garbage collected; Default is
+            **True**
     """
-    LINE_PROPERTIES = {
-        'linewidth', 'linestyle', 'alpha', 'color', 'antialiased',
-        'dashcapstyle', 'dashjoinstyle', 'dashOffset', 'dashSeq',
-        'drawstyle', 'label', 'marker', 'markeredgecolor',
-        'markeredgewidth', 'markerfacecolor', 'markerfacecoloralt',
-        'markersize', 'markevery', 'solidcapstyle', 'solidjoinstyle',
-        'visible'}
-
-    def __init__(self, ax=None, picker_arg=True):
-        self.delete_buffer = SnapshotBuffer(max_len=25)
-        self.line_clipboard = []
+    #: Policies for clicks hitting several overlapping lines: ``'topmost'``
+    #: picks the line drawn on top, ``'all'`` picks every line hit and
+    #: ``'nearest'`` picks the line closest to the click
+    OVERLAP_POLICIES = ('topmost', 'all', 'nearest')
+
+    def __init__(self, ax=None, picker_arg=True,
+                 journal_max_bytes=256 * 2 ** 20, release_on_close=True):
+        _release_closed_selectors()
+        super().__init__(journal_max_bytes=journal_max_bytes)
         self.cid = None  # Callback id for active callback bound to lines
         self.picker_arg = picker_arg
+        self._batch_depth = 0  # Nesting depth of active batch() blocks
+        self._pending_redraws = []  # Axes whose redraw was deferred by batch
+        self._id_picker = None  # Lazily created IdBufferPicker
+        self._line_index = None  # Lazily created LineIndex
+        self._legend_manager = None  # Lazily created LegendManager
+        self._streamer = None  # LineStreamer created by start_streaming
+        self._segment_index = None  # Lazily created SegmentIndex
+        self._hover_cid = None  # Callback id of the hover tooltip
+        self._hover_tooltip = None  # HoverTooltip showing the hovered label
+        self._stream_timer = None  # Canvas timer flushing the streamer
+        self._stream_autoscale = True
+        self._collections = []  # Active ConsolidatedLineCollection instances
+        self._decimator = None  # Lazily created LineDecimator
+        self._highlighter = None  # Lazily created SelectionHighlighter
+        self._region_widget = None  # Active interactive region selector
+        self._region_widget_lines = []  # Lines added to ax by the widget
+        self._pick_handler = None  # Applies a batch of picked lines
+        self._pick_overlap = 'topmost'
+        self._pick_debounce = 0
+        self._pick_exclusive = False  # Repeated clicks pick lines beneath
+        self._pending_picks = []  # (mouse event, line) awaiting flush_picks
+        self._pick_timer = None  # Single-shot timer calling flush_picks
+        self._pick_flush_cid = None  # Flushes picks per click if no debounce
+        self.release_on_close = release_on_close
+        self._close_cid = None  # Callback id of the figure's close_event
+        self._manager_ref = None  # Weak reference to the pyplot manager
+        self._released = False  # State dropped via release()
+        self._closed = False  # Released as the figure was closed
 
         if ax is None:
+            import matplotlib.pyplot as plt  # Only needed for the default
             self.ax = plt.gca()
         else:
             self.ax = ax
+        if release_on_close:
+            # Bound methods are held weakly by the canvas callbacks
+            self._close_cid = self.fig.canvas.mpl_connect('close_event',
+                                                          self._on_close)
+            manager = getattr(self.fig.canvas, 'manager', None)
+            if any(m is manager for m in Gcf.get_all_fig_managers()):
+                self._manager_ref = weakref.ref(manager)
+            _selectors.add(self)
+
+    @property
+    def ax(self):
+        """Returns Axes instance the selector is bound to"""
+        ax = self._ax_ref()
+        if self._closed or ax is None:
+            raise ReferenceError(
+                f'The figure of this {type(self).__name__} has been closed or '
+                f'garbage collected; create a new selector for an open figure')
+        return ax
+
+    @ax.setter
+    def ax(self, ax):
+        # Held weakly so that the selector does not keep a closed figure alive
+        self._ax_ref = weakref.ref(ax)
 
     @property
     def fig(self):
         """Returns Figure instance that self.ax is bound to"""
         return self.ax.figure
 
+    @property
+    def lines(self):
+        """Returns the lines of :attr:`ax`"""
+        return self.ax.lines
+
+    @property
+    def _lines_owner(self):
+        return self.ax
+
+    def _line_data(self, line):
+        return self._full_data(line, orig=False)
+
+    def _changed(self):
+        self.redraw()
+
+    def _lines_removed(self, lines):
+        if self._line_index is not None:
+            self._line_index.remove(lines)
+
+    def _lines_restored(self, lines):
+        if self._line_index is not None:
+            self._line_index.add(lines)
+
+    def _attrs_changed(self, lines, attr):
+        if self._line_index is not None:
+            self._line_index.refresh(lines, attr)
+
     def redraw(self, ax=None):
-        """Update legend if needed and redraw plot after any updates to it"""
+        """Update legend if needed and redraw plot after any updates to it.
+
+        Inside a :meth:`batch` block the redraw is deferred and performed once
+        when the outermost block exits.
+        """
         ax = self.ax if ax is None else ax
+        if self._batch_depth > 0:
+            if not any(a is ax for a in self._pending_redraws):
+                self._pending_redraws.append(ax)
+            return
+        with self.instrumentation.timed('redraw'):
+            self._refresh_legend(ax)
+            self.instrumentation.track_draws(ax.figure.canvas)
+            ax.figure.canvas.draw_idle()  # Refresh canvas
+        self.instrumentation.emit('redrawn', ax)
+
+    def _refresh_legend(self, ax):
+        """Update legend of ``ax`` if present and visible, preserving its
+        configuration and only rebuilding it if its entries changed"""
         if ax.legend_ is not None and ax.legend_.get_visible():
-            ax.legend()  # Update legend if present and visible
-        ax.figure.canvas.draw_idle()  # Refresh canvas
+            with self.instrumentation.timed('legend'):
+                if ax is self.ax:
+                    self.legend_manager.refresh()
+                else:
+                    LegendManager(ax).refresh()
 
-    def interactive_delete(self):
+    @property
+    def legend_manager(self):
+        """Returns the :class:`~mplsel.legend.LegendManager` for :attr:`ax`"""
+        if self._legend_manager is None:
+            self._legend_manager = LegendManager(self.ax)
+        return self._legend_manager
+
+    def configure_legend(self, max_entries=None, page=0):
+        """
+        Limit the number of legend entries shown at once so that very large
+        legends do not dominate layout and draw time. Entries beyond the
+        current page are summarized by a final ``'... N more'`` entry.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries per legend
+                page; Default of **None** shows all entries
+            page (int, optional): Index of the legend page to show; Default is
+                **0**
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+
+        Example:
+            >>> sel.configure_legend(max_entries=20)
+            >>> sel.configure_legend(max_entries=20, page=1)  # Entries 20-39
+        """
+        self.legend_manager.max_entries = max_entries
+        self.legend_manager.page = page
+        self.redraw()
+        return self
+
+    def connect(self, event, func):
+        """
+        Subscribe to selector events. Events carry batches of lines rather than
+        one notification per line; see :class:`~mplsel.instrument.Instrumentation`
+        for the supported events and callback signatures.
+
+        Args:
+            event (str): One of ``'selected'``, ``'deselected'``,
+                ``'deleted'``, ``'restored'`` or ``'redrawn'``
+            func (Callable): Callback to be invoked when ``event`` occurs
+
+        Returns:
+            (int): Callback id to be passed to :meth:`disconnect`
+
+        Example:
+            >>> sel = AxesLineSelector(ax)
+            >>> cid = sel.connect('deleted', lambda lines: print(len(lines)))
+            >>> sel.delete_lines_by_inds(0, 1)
+            2
+            >>> sel.disconnect(cid)
+        """
+        return self.instrumentation.connect(event, func)
+
+    def disconnect(self, cid):
+        """Unsubscribe a callback registered via :meth:`connect`"""
+        self.instrumentation.disconnect(cid)
+
+    def timing_stats(self):
+        """
+        Accumulated timings of the selector's redraws (``'redraw'``), canvas
+        draws (``'draw'``), legend rebuilds (``'legend'``), pick handling
+        (``'pick'``), id-buffer click resolution (``'pick_lookup'``), undo
+        journal recording (``'snapshot'``) and pasting (``'paste'``).
+
+        Returns:
+            (dict): Mapping of counter name to a dict with the ``count`` of
+                timed calls and their ``total``, ``mean`` and ``max`` duration
+                in seconds
+
+        Note:
+            ``'redraw'`` measures the selector's own redraw work, i.e.
+            updating the legend and requesting a draw via ``draw_idle()``.
+            ``'draw'`` measures the actual rendering of every canvas the
+            selector redrew, whenever the canvas is drawn, which for GUI
+            backends happens asynchronously. It includes draws not caused by
+            the selector (e.g. on zoom) but not ``savefig``.
+        """
+        return self.instrumentation.timing_stats()
+
+    def reset_timing_stats(self):
+        """
+        Reset all counters reported by :meth:`timing_stats`
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        self.instrumentation.reset_timings()
+        return self
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that defers all redraws and legend rebuilds issued by
+        operations within the block until the block exits, at which point each
+        affected Axes is redrawn exactly once. Blocks may be nested; only the
+        outermost block triggers the redraw.
+
+        Yields:
+            (AxesLineSelector): Current selection instance (``self``)
+
+        Example:
+            >>> sel = AxesLineSelector(ax)
+            >>> with sel.batch():
+            ...     sel.select_lines_by_inds(0, 2) \\
+            ...        .setattr_selection('linewidth', 3) \\
+            ...        .setattr_selection('alpha', .5)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def begin_batch(self):
+        """
+        Enter batched mode for use with the chained API. All redraws are held
+        back until a matching call to :meth:`end_batch`.
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+
+        Example:
+            >>> sel.begin_batch() \\
+            ...    .select_all_lines() \\
+            ...    .delete_selection() \\
+            ...    .end_batch()
+        """
+        self._batch_depth += 1
+        return self
+
+    def end_batch(self):
+        """
+        Exit batched mode entered via :meth:`begin_batch`. When the outermost
+        batch is closed, every Axes that requested a redraw during the batch is
+        redrawn once.
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        for ax in self._close_batch():
+            self.redraw(ax)
+        return self
+
+    def _close_batch(self):
+        """Leave one level of batching and return the Axes whose redraw is
+        due if the outermost batch was closed"""
+        if self._batch_depth == 0:
+            raise RuntimeError('end_batch() called without matching begin_batch()')
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return []
+        pending, self._pending_redraws = self._pending_redraws, []
+        return pending
+
+    @property
+    def is_batching(self):
+        """Returns ``True`` if redraws are currently being deferred"""
+        return self._batch_depth > 0
+
+    def interactive_delete(self, id_buffer=False, overlap='topmost',
+                           debounce=0):
         """
         Bind callbacks to plot-window to enable interactive deletion by
         left-clicking on lines in the plot-window. All deleted lines are saved
-        in the ``self.delete_buffer`` buffer so that deletions can be undone if
-        desired.'
+        in the ``self.journal`` undo history so that deletions can be undone if
+        desired.
+
+        Args:
+            id_buffer (bool, optional): If **True**, resolve clicks with the
+                offscreen :class:`~mplsel.picking.IdBufferPicker` instead of
+                matplotlib's per-artist ``pick_event``. Recommended for axes
+                with thousands of lines; Default is **False**
+            overlap (str, optional): Which of several lines hit by one click
+                are deleted. See :attr:`OVERLAP_POLICIES`; Default is
+                **'topmost'**. Repeated clicks on the same spot within one
+                debounce window delete successive lines beneath it
+            debounce (float or None, optional): Window in milliseconds during
+                which clicks are coalesced into a single deletion with one
+                journal entry and one redraw. **0** coalesces the clicks
+                received within one GUI event-loop tick and **None** applies
+                every click as soon as it has been processed; Default is **0**
 
         Returns:
             (AxesLineSelector): Current selection instance (``self``) 
@@ -106,180 +419,299 @@ class AxesLineSelector:
             button is not selected after zooming when left-clicking on a line
             for deletion
         """
-        self._disconnect_current_callback()
-        for ln in self.ax.lines:
-            ln.set_picker(self.picker_arg)
-        self.cid = \
-            self.fig.canvas.mpl_connect('pick_event', self._delete_callback)
+        self._connect_interactive(self._delete_picked, id_buffer, overlap,
+                                  debounce, exclusive=True)
         return self
 
-    def delete_all_lines(self):
+    def _delete_picked(self, lines):
+        """Delete a coalesced batch of interactively picked lines"""
+        self._delete_lines(lines)
+
+    def undo_last_delete(self):
         """
-        Delete all the lines in the axes. They are all stored in
-        ``self.delete_buffer`` in case undoing of the deletion operation is
-        desired
+        Restore the most recently deleted line(s) back to the Axes. Style
+        changes, reorderings and pastes recorded in :attr:`journal` after the
+        deletion are left in place; use :meth:`undo` to revert those.
 
         Returns:
-            (AxesLineSelector): Current selection instance (``self``) with all
-                lines deleted and moved to the deletion buffer.
+            (AxesLineSelector): Current selection instance (``self``)
         """
-        self.delete_buffer.snapshot(self.ax.lines)  # Snapshot current plot
-        while len(self.ax.lines) > 0:
-            ln = self.ax.lines[-1]  # Delete last line
-            self._delete_line(ln)
+        if self.journal.peek(RemoveLinesEntry.kind) is None:
+            logger.warning('No line deletions to undo!')
+        else:
+            self._undo(RemoveLinesEntry.kind)
         return self
 
-    def delete_selection(self):
+    def undo_all_delete(self):
         """
-        Delete all lines in current selection and store in deletion buffer
+        Restore all line deletions recorded in the :attr:`journal` undo
+        history, most recent first, leaving other operations in place.
 
         Returns:
-            (AxesLineSelector): Current selection instance (``self``) with
-                selected lines deleted and moved to the deletion buffer.
+            (AxesLineSelector): Current selection instance (``self``)
         """
-        self.delete_buffer.snapshot(self.ax.lines)  # Snapshot current plot
-        while len(self.line_clipboard) > 0:
-            ln = self.line_clipboard.pop(0)  # Delete first line in selection
-            self._delete_line(ln)
+        with self.batch():
+            while self.journal.peek(RemoveLinesEntry.kind) is not None:
+                self._undo(RemoveLinesEntry.kind)
         return self
 
-    def delete_lines_by_inds(self, *inds):
+    def consolidate(self, selection=False):
         """
-        Programmatically delete desired lines in the axes based on the provided
-        set of indices.
+        Render lines through a single :class:`~mplsel.collection.ConsolidatedLineCollection`
+        instead of one artist per line, which greatly reduces redraw time on
+        axes with thousands of lines. The lines remain in ``self.ax.lines`` as
+        logical lines, so index-based selection, :meth:`setattr_selection`,
+        :meth:`getattr_selection`, deletion and undo keep working on them.
 
         Args:
-            *inds (Iterable[int]): Iterable of integer indices for lines in
-                ``self.ax.lines`` to be deleted
+            selection (bool, optional): If **True**, only consolidate lines in
+                the current clipboard selection, otherwise consolidate all
+                lines in ``self.ax``; Default is **False**
 
         Returns:
-            (AxesLineSelector): Current selection instance (``self``) with
-                deleted lines added to the :attr:`delete_buffer` attribute.
+            (AxesLineSelector): Current selection instance (``self``)
 
         Note:
-            The best way to determine indices for lines of interest is to rely
-            on the ``__repr__()`` method for this class by simply querying the
-            variable containing the instance of ``AxesLineSelector`` in your
-            Python interpreter. The output provides indices for each line along
-            with the label value if any. See example below for more information.
-
-        Example:
-            >>> ax_sel = AxesLineSelector()
-            >>> ax_sel
-            AxesLineSelector (
-                ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7fba168c9990>
-                is_interactive: False
-                lines: ['0: Line2D(Label-A)',
-                    '1: Line2D(Label-B)',
-                    '2: Line2D(Label-C)',
-                clipboard: ['0: Line2D(Label-A)',
-                    '1: Line2D(Label-B)',
-                deleted buffer: []
-            )
-            >>> # Delete lines with labels 'Label-A' and 'Label-C'
-            >>> ax_sel.delete_lines_by_inds(0, 2)
-        """
-        if len(inds) < 1:
-            raise ValueError('At least one or more indices should be provided')
-        
-        # Store a snapshot of current axes lines
-        self.delete_buffer.snapshot(self.ax.lines)
-        
-        # Delete lines
-        new_lines = []
-        for i, l in enumerate(self.ax.lines):
-            if i not in inds:
-                new_lines.append(l)
-            else:
-                print(f'Deleted line: {l}')
-        self.ax.lines = new_lines
+            Lines with markers, a non-default drawstyle or a transform other
+            than ``self.ax.transData`` cannot be rendered as collection
+            segments and are left as individual artists.
+        """
+        lines = self.line_clipboard if selection else self.ax.lines
+        lines = [ln for ln in lines if can_consolidate(ln, self.ax)]
+        if len(lines) > 0:
+            coll = ConsolidatedLineCollection(self.ax, lines)
+            self.ax.add_collection(coll, autolim=False)
+            self._collections.append(coll)
         self.redraw()
         return self
 
-    def _delete_line(self, line):
-        if line in self.ax.lines:
-            self.ax.lines.remove(line)
-            print(f'Deleted line: {line}')
-        else:
-            print(f'Line: {line} was not in self.ax.lines. Skipped deletion')
-        self.redraw()  # Update plot with deletion
+    def expand(self):
+        """
+        Undo :meth:`consolidate`, restoring all consolidated lines as
+        individually drawn ``Line2D`` artists
 
-    def _delete_callback(self, event):
-        """Matplotlib event callback to bind to Line2D Artists for interactive
-        deletion of lines in the plot-window"""
-        sel_line = event.artist
-        self.delete_buffer.snapshot(self.ax.lines)  # Snapshot current plot
-        self._delete_line(sel_line)
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        for coll in self._collections:
+            coll.expand()
+        self._collections = []
+        self.redraw()
+        return self
 
-    def undo_last_delete(self):
+    def decimate(self, selection=False, points_per_pixel=1):
         """
-        Restore last deleted line back to the Axes
-        
+        Display min/max-preserving downsampled versions of very long lines,
+        sized to the pixel width of the Axes and recomputed for the visible
+        x-range whenever the x-limits change (e.g. on interactive zoom/pan).
+        The full-resolution data is retained and used by
+        :meth:`paste_selection` and data queries such as :meth:`select_where`.
+
+        Args:
+            selection (bool, optional): If **True**, only decimate lines in
+                the current clipboard selection, otherwise decimate all lines
+                in ``self.ax``; Default is **False**
+            points_per_pixel (int, optional): Number of min/max bins per pixel
+                of Axes width; Default is **1**
+
         Returns:
             (AxesLineSelector): Current selection instance (``self``)
+
+        Note:
+            Call :meth:`decimate` again after resizing the figure to resample
+            for the new Axes width.
         """
-        if len(self.delete_buffer) == 0:
-            print('No line deletions to undo!')
-        else:
-            self.ax.lines = self.delete_buffer.rewind()
-            self.redraw()
+        if self._decimator is None:
+            self._decimator = LineDecimator(self.ax, points_per_pixel)
+        self._decimator.points_per_pixel = points_per_pixel
+        lines = self.line_clipboard if selection else self.ax.lines
+        self._decimator.add(lines)
+        self.redraw()
         return self
 
-    def undo_all_delete(self):
+    def undecimate(self):
         """
-        Restore all deleted lines that were stored in the ``self.delete_buffer``
-        buffer.
-        
+        Restore the full-resolution data of all lines decimated via
+        :meth:`decimate`
+
         Returns:
             (AxesLineSelector): Current selection instance (``self``)
         """
-        for _ in range(len(self.delete_buffer)):
-            self.ax.lines = self.delete_buffer.rewind()
+        if self._decimator is not None:
+            self._decimator.remove()
         self.redraw()
         return self
 
-    def reorder_lines(self, order):
+    def compact_data(self, downcast=False):
         """
-        Reorder lines in the Axes based on new ordering provided
+        Reduce the memory held by the data of the lines in ``self.ax.lines``.
+        Lines with identical x-data are rebound onto a single shared,
+        read-only copy of it, and floating-point x/y data is optionally stored
+        as ``float32``. Lines pasted from compacted lines via
+        :meth:`paste_selection` keep sharing their x-data. Lines that are
+        decimated or streamed are skipped. Compaction is not recorded in the
+        undo journal.
+
+        Only the original data arrays are compacted. matplotlib also caches a
+        float64 copy of the x and y data of each line for drawing, so sharing
+        the x-data of many lines saves about a quarter of the memory held by
+        their data, and downcasting the y-data about another eighth. The total held
+        before compaction is logged along with the bytes reclaimed.
 
         Args:
-            order(Iterable[int]): An iterable of length matching the number of
-                lines in the Axes instance, such that
-                ``len(set(order)) == len(ax.lines)`` and
-                ``set(range(len(ax.lines))) == set(order)``. i.e., all indices in
-                ``order`` must be unique and span the range 0 to
-                ``len(ax.lines) - 1``
+            downcast (bool, optional): If **True**, store floating-point data as
+                ``float32``, losing precision beyond about 7 significant
+                digits; Default is **False**
 
         Returns:
-            (AxesLineSelector): Current selection instance (``self``)
+            (int): Number of bytes reclaimed from the data buffers of the
+                lines. The memory is only released once no other references
+                to the replaced arrays (e.g. held by the caller) remain
 
         Example:
             >>> fig, ax = plt.subplots()
-            >>> ax.plot([1, 2, 3, 4], [1, 2, 1, 3], label='Line-A')
-            >>> ax.plot([1, 2, 3, 4], [2, 4, 2, 1], label='Line-B')
-            >>> ax.legend()
+            >>> t = np.linspace(0, 1, 1000000)
+            >>> for i in range(100):
+            ...     ax.plot(t, np.sin(t + i))
             >>> sel = AxesLineSelector(ax)
-            >>> sel
-                AxesLineSelector (
-                    ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7fa1e57a32d0>
-                    is_interactive: False
-                    lines: ['0: Line2D(Line-A)', '1: Line2D(Line-B)']
-                    clipboard: []
-                    deleted buffer: []
-                )
-            >>> sel.reorder_lines([1, 0])  # 'Line-B' now precedes 'Line-A'
-        """
-        assert set(order) == set(range(len(self.ax.lines))), \
-            (f'Provided ordering is not compatible with required unique inds: '
-             f'{set(range(len(self.ax.lines)))}')
-        new_lines = [None] * len(self.ax.lines)
-        for old_ind, new_ind in enumerate(order):
-            new_lines[new_ind] = self.ax.lines[old_ind]
-        self.ax.lines = new_lines
+            >>> sel.compact_data()  # 99 copies of t, out of 3.2 GB in total
+            792000000
+        """
+        lines = [ln for ln in self.ax.lines
+                 if (self._decimator is None or ln not in self._decimator)
+                 and (self._streamer is None or ln not in self._streamer)]
+        total = data_nbytes(line_arrays(lines) + cached_arrays(lines))
+        with self.instrumentation.timed('compact'):
+            reclaimed = compact_lines(lines, downcast)
+        logger.info('Compacted data of %d line(s), reclaiming %.1f of %.1f MiB '
+                    'held by their data and drawing caches', len(lines),
+                    reclaimed / 2 ** 20, total / 2 ** 20)
+        if downcast:
+            self.redraw()
+        return reclaimed
+
+    def _full_data(self, line, orig=True):
+        """Return the full-resolution ``(x, y)`` data of ``line``"""
+        if self._decimator is None:
+            return line.get_xdata(orig=orig), line.get_ydata(orig=orig)
+        return self._decimator.full_data(line, orig=orig)
+
+    def start_streaming(self, window=10000, fps=30, autoscale=True):
+        """
+        Enable streaming updates of line data via :meth:`append_data`. Each
+        streamed line retains its most recent ``window`` samples in
+        preallocated ring buffers and keeps its identity, so the selection,
+        styling and undo history survive across updates. Queued samples are
+        applied and drawn on a canvas timer, at most ``fps`` times per second.
+
+        Args:
+            window (int, optional): Number of most recent samples retained per
+                line; Default is **10000**
+            fps (float, optional): Target maximum redraw rate; Default is
+                **30**
+            autoscale (bool, optional): If **True**, rescale the Axes to the
+                data after every update; Default is **True**
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+
+        Example:
+            >>> sel = AxesLineSelector(ax).start_streaming(window=5000)
+            >>> # From any producer thread:
+            >>> sel.append_data(0, t_chunk, y_chunk)
+
+        Note:
+            Streamed lines are no longer decimated (see :meth:`decimate`).
+            Backends without an event loop (e.g. Agg) do not run timers; call
+            :meth:`flush_stream` to apply queued samples manually.
+        """
+        self.stop_streaming()
+        if self._streamer is None or self._streamer.window != window:
+            self._streamer = LineStreamer(window)
+        self._stream_autoscale = autoscale
+        self._stream_timer = self.fig.canvas.new_timer(
+            interval=max(1, int(1000 / fps)))
+        self._stream_timer.add_callback(self.flush_stream)
+        self._stream_timer.start()
+        return self
+
+    def stop_streaming(self):
+        """
+        Stop the timer started by :meth:`start_streaming`. Lines keep their
+        current data and queued samples are applied by a final flush.
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        if self._stream_timer is not None:
+            self._stream_timer.stop()
+            self._stream_timer = None
+            self.flush_stream()
+        return self
+
+    @property
+    def is_streaming(self):
+        """Returns ``True`` if streaming updates are currently enabled"""
+        return self._stream_timer is not None
+
+    def append_data(self, line_or_index, x_chunk, y_chunk):
+        """
+        Queue new samples for a line. Safe to call from producer threads; the
+        samples are applied to the line on the GUI thread by the next
+        :meth:`flush_stream`.
+
+        Args:
+            line_or_index (Line2D or int): Line, or its index in
+                ``self.ax.lines``. Indices are resolved on the GUI thread
+                when the samples are applied
+            x_chunk (Sequence): New x values
+            y_chunk (Sequence): New y values of equal length
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        if self._streamer is None:
+            raise RuntimeError('start_streaming() must be called before '
+                               'append_data()')
+        if isinstance(line_or_index, Number):
+            line_or_index = operator.index(line_or_index)
+        self._streamer.push(line_or_index, x_chunk, y_chunk)
+        return self
+
+    def flush_stream(self):
+        """
+        Apply all samples queued via :meth:`append_data` and redraw once.
+        Called periodically by the timer of :meth:`start_streaming`.
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        if self._streamer is None or self._streamer.n_pending == 0:
+            return self
+        on_new_line = None
+        if self._decimator is not None:
+            on_new_line = (lambda ln: self._decimator.remove([ln]))
+        ax_lines = []  # Copied from self.ax.lines once an index is resolved
+
+        def resolve(index):
+            if len(ax_lines) == 0:
+                ax_lines.extend(self.ax.lines)
+            return ax_lines[index]
+
+        with self.instrumentation.timed('stream'):
+            lines = self._streamer.flush(on_new_line, resolve)
+            for table in (self._stats, self._hashes):
+                if table is not None:
+                    for ln in lines:
+                        table.invalidate(ln)
+            if self._stream_autoscale:
+                self.ax.relim()
+                self.ax.autoscale_view()
         self.redraw()
         return self
 
-    def interactive_select(self):
+    def interactive_select(self, id_buffer=False, highlight=True,
+                           overlap='topmost', debounce=0):
         """
         Bind callbacks to plot-window to enable interactive selection of lines by
         left-clicking on them in the plot-window. All selected lines are saved
@@ -287,6 +719,24 @@ class AxesLineSelector:
         :meth:`setattr_selections`, :meth:`getattr_selections` and
         :meth:`paste_selection`
 
+        Args:
+            id_buffer (bool, optional): If **True**, resolve clicks with the
+                offscreen :class:`~mplsel.picking.IdBufferPicker` instead of
+                matplotlib's per-artist ``pick_event``. Recommended for axes
+                with thousands of lines; Default is **False**
+            highlight (bool, optional): If **True**, selected lines are
+                highlighted with a blitted overlay (see
+                :class:`~mplsel.highlight.SelectionHighlighter`) without
+                redrawing the full canvas; Default is **True**
+            overlap (str, optional): Which of several lines hit by one click
+                are selected. See :attr:`OVERLAP_POLICIES`; Default is
+                **'topmost'**
+            debounce (float or None, optional): Window in milliseconds during
+                which clicks are coalesced into a single selection update.
+                **0** coalesces the clicks received within one GUI event-loop
+                tick and **None** applies every click as soon as it has been
+                processed; Default is **0**
+
         Returns:
             (AxesLineSelector): Current selection instance (``self``)
 
@@ -298,130 +748,270 @@ class AxesLineSelector:
             button is not selected after zooming when left-clicking on a line
             for selection
         """
-        self._disconnect_current_callback()
-        for ln in self.ax.lines:
-            ln.set_picker(self.picker_arg)
-        self.cid = \
-            self.fig.canvas.mpl_connect('pick_event', self._select_callback)
+        self._connect_interactive(self._select_picked, id_buffer, overlap,
+                                  debounce)
+        if highlight:
+            if self._highlighter is None:
+                self._highlighter = SelectionHighlighter(self.ax)
+            self._highlighter.connect()
+            self._highlighter.add(*self.line_clipboard)
         return self
 
-    def select_all_lines(self):
+    @property
+    def line_index(self):
+        """Returns the :class:`~mplsel.lineindex.LineIndex` for :attr:`ax`"""
+        if self._line_index is None:
+            self._line_index = LineIndex(self.ax)
+        return self._line_index
+
+    def select_by_label(self, pattern, mode='exact'):
         """
-        Select all lines in ``self.ax`` and store in :attr:`line_clipboard`
+        Select lines by label through the :attr:`line_index`. Exact labels are
+        resolved with a dictionary lookup, and glob/regex patterns are matched
+        against the distinct labels rather than against every line.
+
+        Args:
+            pattern (str): Label, glob pattern or regular expression
+            mode (str, optional): One of ``'exact'``, ``'glob'`` or
+                ``'regex'`` (matched with :func:`re.search`); Default is
+                **'exact'**
 
         Returns:
             (AxesLineSelector): Current selection instance (``self``) with
-                selected lines added to the :attr:`line_clipboard` attribute.
+                selected lines added to the ``line_clipboard`` attribute.
+
+        Example:
+            >>> sel = AxesLineSelector(ax)
+            >>> sel.select_by_label('Line-1')
+            >>> sel.select_by_label('Line-[45]', mode='glob')
+            >>> sel.select_by_label(r'-\\d{2,}$', mode='regex')
         """
-        for ln in self.ax.lines:
-            self._add_line_to_clipboard(ln)
+        self._add_lines_to_clipboard(
+            self.line_index.match_label(pattern, mode))
         return self
 
-    def select_lines(self, sel_fn):
+    def select_by_style(self, **style):
         """
-        Select lines using provided selection function to the clipboard
+        Select lines matching all provided style properties through the
+        :attr:`line_index`. Colors are compared after conversion to RGBA and
+        line styles after mapping names such as ``'dashed'`` to ``'--'``.
 
         Args:
-            sel_fn (Callable): Function signature is (line, i) where line is the
-                :class:`~matplotlib.Line2D` instance of the axes and ``i`` is
-                the index of the line in ``self.ax.lines``. ``sel_fn`` must
-                return ``True`` for lines to be selected and ``False`` otherwise
+            **style: Any of ``label``, ``color``, ``linestyle`` and ``marker``
 
         Returns:
             (AxesLineSelector): Current selection instance (``self``) with
                 selected lines added to the ``line_clipboard`` attribute.
+
+        Example:
+            >>> sel.select_by_style(color='C0', linestyle='dashed')
         """
-        for i, ln in enumerate(self.ax.lines):
-            if sel_fn(ln, i):
-                self._add_line_to_clipboard(ln)
+        self._add_lines_to_clipboard(self.line_index.match_style(**style))
         return self
 
-    def select_lines_by_inds(self, *inds):
+    @property
+    def segment_index(self):
+        """Returns the :class:`~mplsel.spatial.SegmentIndex` for :attr:`ax`"""
+        if self._segment_index is None:
+            self._segment_index = SegmentIndex(self.ax)
+        return self._segment_index
+
+    def nearest_lines(self, x, y, k=1, max_distance=None, display=False):
         """
-        Select lines programmatically based on their indices in ``self.ax.lines``
+        Find the lines nearest to a location, measured in display space
+        through the :attr:`segment_index`. Unlike picking, lines are found
+        regardless of a pick tolerance.
 
         Args:
-            *inds (Iterable[int]): Indices of lines in ``self.ax.lines`` to be
-                selected and placed in internal :attr:`lines_clipboard`. Usually
-                best determined by examining output of the :meth:`__repr__`
-                method of this class as shown in the example below.
+            x (float): x-coordinate in data coordinates, or in pixels if
+                ``display`` is **True**
+            y (float): y-coordinate in data coordinates, or in pixels if
+                ``display`` is **True**
+            k (int, optional): Maximum number of lines returned; Default is
+                **1**
+            max_distance (float, optional): Only return lines within this
+                distance in pixels; Default of **None** has no limit
+            display (bool, optional): If **True**, ``x`` and ``y`` are display
+                coordinates (e.g. ``event.x``, ``event.y``); Default is
+                **False**
 
         Returns:
-            (AxesLineSelector): Current selection instance (``self``) with
-                selected lines added to the ``line_clipboard`` attribute.
+            (list[Line2D]): Up to ``k`` lines ordered by increasing distance
 
         Example:
-            >>> fig, ax = plt.subplots()
-            >>> ax.plot([1, 2, 3, 4], [1, 2, 1, 3], label='Line-A')
-            >>> ax.plot([1, 2, 3, 4], [2, 4, 2, 1], label='Line-B')
-            >>> ax.legend()
-            >>> sel = AxesLineSelector(ax)
-            >>> sel
-                AxesLineSelector (
-                    ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7fa1e57a32d0>
-                    is_interactive: False
-                    lines: ['0: Line2D(Line-A)', '1: Line2D(Line-B)']
-                    clipboard: []
-                    deleted buffer: []
-                )
-            >>> sel.select_lines_by_inds(1)  # Select 'Line-B'
-            Added line: Line2D(Line-B) to clipboard
-            >>> sel
-            AxesLineSelector (
-                ax: <matplotlib.axes._subplots.AxesSubplot object at 0x7f3fb2b935d0>
-                is_interactive: False
-                lines: ['0: Line2D(Line-A)', '1: Line2D(Line-B)']
-                clipboard: ['0: Line2D(Line-B)']
-                deleted buffer: []
-            )
-
-        """
-        if len(inds) < 1:
-            raise ValueError('At least one or more indices should be provided')
-        for ind in inds:
-            self._add_line_to_clipboard(self.ax.lines[ind])
+            >>> # Labels of the 3 lines nearest to data coordinate (5, 2.5)
+            >>> [ln.get_label() for ln in sel.nearest_lines(5, 2.5, k=3)]
+        """
+        if not display:
+            x, y = self.ax.transData.transform((x, y))
+        return [ln for ln, _ in self.segment_index.nearest(
+            x, y, k=k, max_distance=max_distance)]
+
+    def interactive_hover(self, max_distance=10):
+        """
+        Show the label of the line nearest to the mouse cursor in a tooltip
+        while moving the mouse over the plot-window. Lines are looked up
+        through the :attr:`segment_index` and the tooltip is blitted, so no
+        full canvas redraw is required while hovering. Hovering can be
+        combined with the other interactive modes.
+
+        Args:
+            max_distance (float, optional): Maximum distance in pixels between
+                the cursor and a line for its tooltip to be shown; Default is
+                **10**
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        self.disable_hover()
+        self._hover_tooltip = HoverTooltip(self.ax)
+        self._hover_tooltip.connect()
+        self.segment_index.connect()
+        self._hover_cid = self.fig.canvas.mpl_connect(
+            'motion_notify_event', partial(self._hover_callback, max_distance))
         return self
 
-    def _add_line_to_clipboard(self, line):
-        if line not in self.line_clipboard:
-            self.line_clipboard.append(line)
-            print(f'Added line: {line} to clipboard')
+    def _hover_callback(self, max_distance, event):
+        """Matplotlib event callback updating the hover tooltip"""
+        line = None
+        if event.inaxes is self.ax:
+            with self.instrumentation.timed('hover'):
+                nearest = self.segment_index.nearest(
+                    event.x, event.y, max_distance=max_distance)
+            line = nearest[0][0] if len(nearest) > 0 else None
+        if line is None:
+            self._hover_tooltip.hide()
         else:
-            print(f'Line {line} already exists in clipboard. Skipping...')
+            self._hover_tooltip.show(event.x, event.y, line.get_label())
 
-    def _select_callback(self, event):
-        """Matplotlib event callback to bind to Line2D Artists for interactive
-        selection of lines in the plot-window"""
-        sel_line = event.artist
-        self._add_line_to_clipboard(sel_line)
-
-    def undo_last_selection(self):
+    def disable_hover(self):
         """
-        Removes most recent selection from ``self.line_clipboard``
+        Detach the tooltip callback enabled via :meth:`interactive_hover`
 
         Returns:
             (AxesLineSelector): Current selection instance (``self``)
         """
-        if len(self.line_clipboard) == 0:
-            print('No line selections to undo!')
-        ln = self.line_clipboard.pop()
-        print(f'Removed line: {ln} from clipboard')
+        if self._hover_cid is not None:
+            self.fig.canvas.mpl_disconnect(self._hover_cid)
+            self._hover_cid = None
+            self.segment_index.disconnect()
+            self._hover_tooltip.disconnect()
+            self._hover_tooltip = None
+        return self
+
+    def select_in_region(self, region, min_fraction=None):
+        """
+        Select all lines with points inside a rectangular or polygonal region.
+        Lines whose bounding box does not intersect the region are rejected
+        up-front, and the remaining lines' points are tested in vectorized
+        batches.
+
+        Args:
+            region (Bbox or Path or Sequence): Region in data coordinates. One
+                of a :class:`~matplotlib.transforms.Bbox`, a closed
+                :class:`~matplotlib.path.Path`, a ``(xmin, ymin, xmax, ymax)``
+                tuple or an ``(N, 2)`` sequence of polygon vertices
+            min_fraction (float, optional): Minimum fraction of a line's points
+                that must lie inside the region for it to be selected. Default
+                of **None** selects lines with at least one point inside
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``) with
+                selected lines added to the ``line_clipboard`` attribute.
+
+        Example:
+            >>> sel = AxesLineSelector(ax)
+            >>> sel.select_in_region((0, 2.5, 10, 3.5))  # Rectangle
+            >>> sel.select_in_region([(0, 0), (5, 4), (10, 0)])  # Triangle
+        """
+        region = as_region(region)
+        lines = list(self.ax.lines)
+        data = [self._full_data(ln, orig=False) for ln in lines]
+        mask = lines_in_region(data, self.line_stats(), region, min_fraction)
+        selected = [lines[i] for i in np.flatnonzero(mask)
+                    if not any(lines[i] is w for w in self._region_widget_lines)]
+        self._add_lines_to_clipboard(selected)
+        if self._region_widget is not None and self._highlighter is not None:
+            self._highlighter.add(*selected)
         return self
 
-    def clear_clipboard(self):
-        self.line_clipboard = []
+    def interactive_select_region(self, lasso=False, min_fraction=None,
+                                  highlight=True):
+        """
+        Enable interactive selection of all lines with points inside a region
+        drawn by dragging the mouse in the plot-window. See
+        :meth:`select_in_region`
+
+        Args:
+            lasso (bool, optional): If **True**, draw a free-form lasso region,
+                otherwise a rectangle; Default is **False**
+            min_fraction (float, optional): Minimum fraction of a line's points
+                that must lie inside the region; Default of **None** requires
+                at least one point
+            highlight (bool, optional): If **True**, selected lines are
+                highlighted with a blitted overlay; Default is **True**
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+
+        Notes:
+            Make sure to call ``self.disable_interactive()`` when interactive
+            selection mode is no longer desired.
+        """
+        # Widgets import the backend machinery, which headless use never needs
+        from matplotlib.widgets import LassoSelector, RectangleSelector
+        self._disconnect_current_callback()
+        existing = set(self.ax.lines)
+        if lasso:
+            self._region_widget = LassoSelector(
+                self.ax, lambda verts: self.select_in_region(
+                    verts, min_fraction), useblit=True)
+        else:
+            self._region_widget = RectangleSelector(
+                self.ax, lambda eclick, erelease: self.select_in_region(
+                    (eclick.xdata, eclick.ydata,
+                     erelease.xdata, erelease.ydata), min_fraction),
+                useblit=True)
+        # Some widgets draw their outline as a line added to the Axes
+        self._region_widget_lines = \
+            [ln for ln in self.ax.lines if ln not in existing]
+        if highlight:
+            if self._highlighter is None:
+                self._highlighter = SelectionHighlighter(self.ax)
+            self._highlighter.connect()
+            self._highlighter.add(*self.line_clipboard)
         return self
 
-    def paste_selection(self, ax):
+    def _select_picked(self, lines):
+        """Select a coalesced batch of interactively picked lines"""
+        self._add_lines_to_clipboard(lines)
+        if self._highlighter is not None:
+            self._highlighter.add(*lines)
+
+    def _unhighlight(self, *lines):
+        if self._highlighter is not None:
+            self._highlighter.remove(*lines)
+
+    def paste_selection(self, ax, share_data=False):
         """
         Paste a copy of all lines in the internal :attr:`lines_clipboard`
         attribute from the selection process into a different matplotlib Axes
         instance. All line properties as defined in ``self.LINE_PROPERTIES`` are
-        copied over to the new Line2D instance in :attr:`ax`
+        copied over to the new Line2D instance in :attr:`ax`. All lines are
+        added before a single autoscale and redraw of ``ax``.
 
         Args:
             ax (matplotlib.pyplot.Axes): Axes instance into which the lines in
                 the selection clipboard are to be copied over.
+            share_data (bool, optional): If **True**, pasted lines share the
+                x/y data arrays of the source lines instead of copies, and
+                the shared arrays are made read-only for the source lines as
+                well. In-place writes to the shared arrays then raise an error,
+                whereas ``set_data`` on either line binds it to a copy of the
+                new data without affecting the other. Data of streamed lines
+                is always copied, as their ring buffers are written in place.
+                Note that matplotlib still caches a copy of the data of each
+                pasted line once it is drawn; Default is **False**
 
         Returns:
             (AxesLineSelector): New selection instance linked to ``ax`` and
@@ -444,90 +1034,281 @@ class AxesLineSelector:
             >>> # Copy over 'Line-B' into new plot
             >>> sel.paste_selection(ax2)
         """
-        new_sel_line_clipboard = []
+        with self.instrumentation.timed('paste'):
+            n_existing = len(ax.lines)
+            new_lines = self._paste_lines(ax, share_data)
+            # Update the axes being pasted into
+            ax.autoscale_view()
+            self.redraw(ax)
+            return self._pasted_selection(ax, new_lines, n_existing)
+
+    def _paste_lines(self, ax, share_data=False):
+        """Add copies of all lines in the clipboard to ``ax`` without
+        redrawing and return the new lines"""
+        new_lines = []
+        x_copies = {}  # Buffer key -> copy of a shared x array
         for ln in self.line_clipboard:
-            # Plot a new line2D with same x-y data as line in clipboard
-            new_l = ax.plot(*ln.get_data())[0]
-            # Copy over all relevant attributes from line in clipboard to new line
-            for line_attr in self.LINE_PROPERTIES:
-                setattr(new_l, f'_{line_attr}', getattr(ln, f'_{line_attr}'))
-            new_sel_line_clipboard.append(new_l)
-
-        # Update the axes being pasted into
-        self.redraw(ax)
-
-        # Return new selection for axes that was pasted into with pasted lines selected
-        new_sel = AxesLineSelector(ax=ax, picker_arg=self.picker_arg)
-        new_sel.line_clipboard = new_sel_line_clipboard
+            xdata, ydata = self._full_data(ln)
+            # Ring buffers of streamed lines are written in place
+            share = share_data and (self._streamer is None
+                                    or ln not in self._streamer)
+            share_x = share
+            if not share and isinstance(xdata, np.ndarray) \
+                    and not xdata.flags.writeable:
+                # Lines sharing a read-only x buffer (e.g. after
+                # compact_data) share a single copy of it once pasted
+                key = buffer_key(xdata)
+                if key not in x_copies:
+                    x_copies[key] = readonly_copy(xdata)
+                xdata, share_x = x_copies[key], True
+            new_l = _new_line(xdata, ydata, share, share_x)
+            # Copies the style including the dash pattern, which has no
+            # public getter, but also the transform and clipping of ln
+            new_l.update_from(ln)
+            new_l.set_transform(ax.transData)
+            new_l.set_clip_path(ax.patch)
+            # Properties not copied by update_from (e.g. markevery)
+            for attr in self.LINE_PROPERTIES.difference(DASH_PROPERTIES):
+                value = get_line_attr(ln, attr)
+                if not values_equal(get_line_attr(new_l, attr), value):
+                    set_line_attr(new_l, attr, value)
+            if _is_numeric(xdata) and _is_numeric(ydata):
+                # Update the data limits from the cached statistics of ln,
+                # as add_line would cache a full copy of the data
+                add_line_unscaled(ax, new_l)
+                stats = self.stats_table.stats(ln)
+                extents = [(stats['xmin'], stats['ymin']),
+                           (stats['xmax'], stats['ymax'])]
+                if np.isfinite(extents).all():
+                    ax.update_datalim(extents)
+            else:
+                ax.add_line(new_l)
+            new_lines.append(new_l)
+        return new_lines
+
+    def _pasted_selection(self, ax, new_lines, n_existing):
+        """Return a new selection for ``ax`` with the pasted ``new_lines``
+        selected and their addition recorded in its undo journal"""
+        new_sel = AxesLineSelector(ax=ax, picker_arg=self.picker_arg,
+                                   journal_max_bytes=self.journal.max_bytes,
+                                   release_on_close=self.release_on_close)
+        new_sel.line_clipboard = LineSelection(new_lines)
+        # Pasting can be undone from the selection bound to the target axes
+        new_sel._record(AddLinesEntry(
+            list(enumerate(new_lines, start=n_existing))))
         return new_sel
 
-    def setattr_selection(self, attr, value):
+    def export_selection(self, path):
         """
-        Set a supported line property (see :class:`~AxesLineSelector.LINE_PROPERTIES`)
-        for all lines in the current clipboard selection and redraw plot.
+        Write all lines in the clipboard selection to the directory ``path``
+        so that they can be pasted into an Axes of a different process or
+        session via :meth:`import_selection`. Line data is stored as two
+        back-to-back ``.npy`` blocks (``x.npy``, ``y.npy``) that can be
+        memory-mapped, alongside a ``header.json`` holding per-line offsets and
+        the values of :attr:`LINE_PROPERTIES`.
 
         Args:
-            attr (str): A supported line-property (see :attr:`LINE_PROPERTIES`)
-            value (tuple, or Callable or Any): Either a single valid property 
-                value that is assigned uniformly to all lines in the selection, 
-                or a tuple of the same length as the current line-clipboard 
-                selection with valid property values that are assigned to each 
-                line. or a function with call-signature ``(line, i)`` where line 
-                is the :class:`~matplotlib.Line2D` instance of the axes and ``i``
-                is the index of the line in ``self.line_clipboard``. This 
-                function must return a valid value to be set for the provided
-                attribute - ``attr``
-        
+            path (str): Directory to export to. Created if it does not exist
+
         Returns:
             (AxesLineSelector): Current selection instance (``self``)
+
+        Example:
+            >>> sel.select_lines_by_inds(0, 2).export_selection('sel_export')
+            >>> # ... in a different session
+            >>> sel2 = AxesLineSelector.import_selection(ax2, 'sel_export')
         """
-        assert attr in self.LINE_PROPERTIES, \
-            f'{attr} is an unsupported line-property. Must be ' \
-            f'one of {self.LINE_PROPERTIES}'
-        
-        if isinstance(value, tuple):
-            assert len(value) == len(self.line_clipboard), \
-                f'Invalid number of values provided for ' \
-                f'{len(self.line_clipboard)} lines in clipboard'
-        elif callable(value):
-            value = tuple(
-                [value(ln, i) for i, ln in enumerate(self.line_clipboard)])
-        else:
-            value = tuple([value] * len(self.line_clipboard))
-        
-        for ln, val in zip(self.line_clipboard, value):
-            setter = getattr(ln, f'set_{attr}')
-            setter(val)
-        
-        self.redraw()
+        with self.instrumentation.timed('export'):
+            write_selection(path, list(self.line_clipboard), self._full_data,
+                            self.LINE_PROPERTIES)
+        logger.info('Exported %d lines to %s', len(self.line_clipboard), path)
         return self
 
-    def getattr_selection(self, attr):
+    @classmethod
+    def import_selection(cls, ax, path, picker_arg=True,
+                         journal_max_bytes=256 * 2 ** 20,
+                         release_on_close=True):
         """
-        Get a tuple of attribute values for lines in current clipboard selection.
+        Paste lines written by :meth:`export_selection` into ``ax``. Line
+        data is memory-mapped read-only rather than loaded into memory and
+        the data limits of ``ax`` are updated from the extents stored with
+        each line, so importing does not read the line data. Note that
+        matplotlib still caches an in-memory copy of the data of each line
+        once it is drawn.
 
         Args:
-            attr (str): A supported line-property (see :attr:`LINE_PROPERTIES`)
+            ax (matplotlib.pyplot.Axes): Axes instance into which the exported
+                lines are to be pasted
+            path (str): Directory written by :meth:`export_selection`
+            picker_arg (Any, optional): See :class:`AxesLineSelector`
+            journal_max_bytes (int, optional): See :class:`AxesLineSelector`
+            release_on_close (bool, optional): See :class:`AxesLineSelector`
+
+        Returns:
+            (AxesLineSelector): New selection instance linked to ``ax`` and
+                containing the imported lines as the active selection in the
+                clipboard
+        """
+        new_sel = cls(ax=ax, picker_arg=picker_arg,
+                      journal_max_bytes=journal_max_bytes,
+                      release_on_close=release_on_close)
+        n_existing = len(ax.lines)
+        new_lines = []
+        for xdata, ydata, props, extents in read_selection(path):
+            new_l = _new_line(xdata, ydata, share_data=True)
+            # Properties without a public setter (e.g. dashSeq) are applied
+            # last so they are not overwritten by e.g. set_linestyle
+            for attr in sorted(props, key=lambda a: (
+                    not hasattr(new_l, f'set_{a}'), a)):
+                set_line_attr(new_l, attr, props[attr])
+            if extents is None:  # Exported without extents, or non-numeric
+                ax.add_line(new_l)
+            else:
+                add_line_unscaled(ax, new_l)
+                if len(extents) > 0:
+                    ax.update_datalim(extents)
+            new_lines.append(new_l)
+        new_sel.line_clipboard = LineSelection(new_lines)
+        new_sel._record(AddLinesEntry(
+            list(enumerate(new_lines, start=n_existing))))
+        ax.autoscale_view()
+        new_sel.redraw(ax)
+        logger.info('Imported %d lines from %s', len(new_lines), path)
+        return new_sel
+
+    def _connect_interactive(self, handler, id_buffer, overlap='topmost',
+                             debounce=0, exclusive=False):
+        """Queue picked lines for ``handler``, resolving clicks either via
+        matplotlib's artist picking or via the offscreen id-buffer picker"""
+        if overlap not in self.OVERLAP_POLICIES:
+            raise ValueError(f'Unsupported overlap policy: {overlap}. Must be '
+                             f'one of {self.OVERLAP_POLICIES}')
+        self._disconnect_current_callback()
+        self._pick_handler = handler
+        self._pick_overlap = overlap
+        self._pick_debounce = debounce
+        self._pick_exclusive = exclusive
+        if id_buffer:
+            if self._id_picker is None:
+                self._id_picker = IdBufferPicker(self.ax, self._pickradius())
+            for ln in self.ax.lines:
+                # Make lines unpickable to avoid per-artist contains() tests.
+                # Line2D.set_picker(None) is rejected by newer matplotlib
+                Artist.set_picker(ln, None)
+            self.cid = self.fig.canvas.mpl_connect(
+                'button_press_event', self._id_buffer_pick)
+        else:
+            for ln in self.ax.lines:
+                ln.set_picker(self.picker_arg)
+            self.cid = self.fig.canvas.mpl_connect(
+                'pick_event',
+                lambda event: self._queue_picks(event.mouseevent, [event.artist]))
+        if debounce is None:
+            # Registered after the figure's (and id buffer's) pick handling,
+            # so that all lines hit by a click are applied together
+            self._pick_flush_cid = self.fig.canvas.mpl_connect(
+                'button_press_event', lambda event: self.flush_picks())
+
+    def _pickradius(self):
+        if isinstance(self.picker_arg, Number) \
+                and not isinstance(self.picker_arg, bool):
+            return self.picker_arg
+        return 5
+
+    def _id_buffer_pick(self, event):
+        """Resolve a mouse click via the id buffer, or via the segment index
+        if all or the nearest of overlapping lines are required"""
+        if event.inaxes is not self.ax:
+            return
+        with self.instrumentation.timed('pick_lookup'):
+            if self._pick_overlap == 'topmost':
+                line = self._id_picker.line_at(event.x, event.y)
+                hits = [] if line is None else [line]
+            else:
+                hits = [ln for ln, _ in self.segment_index.nearest(
+                    event.x, event.y, k=len(self.ax.lines),
+                    max_distance=self._pickradius())]
+        self._queue_picks(event, hits)
+
+    def _queue_picks(self, mouseevent, lines):
+        """Queue lines hit by a click until the debounce window elapses"""
+        if len(lines) == 0:
+            return
+        start_timer = len(self._pending_picks) == 0
+        self._pending_picks.extend((mouseevent, ln) for ln in lines)
+        if self._pick_debounce is not None and start_timer:
+            if self._pick_timer is None:
+                self._pick_timer = self.fig.canvas.new_timer(
+                    interval=self._pick_debounce)
+                self._pick_timer.single_shot = True
+                self._pick_timer.add_callback(self.flush_picks)
+            self._pick_timer.start()
+
+    def flush_picks(self):
+        """
+        Apply all clicks queued by :meth:`interactive_select` or
+        :meth:`interactive_delete` as one operation. Called automatically
+        once the debounce window elapses.
 
         Returns:
-            (tuple): Tuple of length matching the number of lines in the current
-                clipboard selection with each entry containing the value for the
-                `attr` attribute for that line
+            (AxesLineSelector): Current selection instance (``self``)
         """
-        assert attr in self.LINE_PROPERTIES, \
-            f'{attr} is an unsupported line-property. Must be ' \
-            f'one of {self.LINE_PROPERTIES}'
-        retval = []
-        for ln in self.line_clipboard:
-            getter = getattr(ln, f'get_{attr}')
-            retval.append(getter())
-        return tuple(retval)
+        picks, self._pending_picks = self._pending_picks, []
+        if len(picks) == 0 or self._pick_handler is None:
+            return self
+        with self.instrumentation.timed('pick'):
+            clicks = {}  # Lines hit by each click, in order of clicks
+            for mouseevent, ln in picks:
+                clicks.setdefault(id(mouseevent), (mouseevent, []))[1].append(ln)
+            positions = {ln: i for i, ln in enumerate(self.ax.lines)}
+            lines = {}
+            for mouseevent, hits in clicks.values():
+                if self._pick_exclusive:
+                    hits = [ln for ln in hits if ln not in lines]
+                hits = [ln for ln in hits if ln in positions]
+                lines.update(dict.fromkeys(
+                    self._resolve_overlap(mouseevent, hits, positions)))
+            if len(lines) > 0:
+                self._pick_handler(list(lines))
+        return self
+
+    def _resolve_overlap(self, mouseevent, hits, positions):
+        """Apply the overlap policy to the lines ``hits`` hit by one click"""
+        if len(hits) <= 1 or self._pick_overlap == 'all':
+            return hits
+        if self._pick_overlap == 'nearest':
+            return [min(hits, key=lambda ln: line_distance(
+                ln, mouseevent.x, mouseevent.y))]
+        # Lines drawn last (highest zorder, then latest in ax.lines) are on top
+        return [max(hits, key=lambda ln: (ln.get_zorder(), positions[ln]))]
 
     def _disconnect_current_callback(self):
+        self.flush_picks()  # Apply clicks still in the debounce window
+        if self._pick_timer is not None:
+            self._pick_timer.stop()
+            self._pick_timer = None
+        self._pick_handler = None
+        if self._pick_flush_cid is not None:
+            self.fig.canvas.mpl_disconnect(self._pick_flush_cid)
+            self._pick_flush_cid = None
+        if self._highlighter is not None:
+            self._highlighter.disconnect()
+        if self._region_widget is not None:
+            self._region_widget.set_active(False)
+            self._region_widget.disconnect_events()
+            self._region_widget = None
+            for ln in self._region_widget_lines:
+                ln.remove()
+            self._region_widget_lines = []
         if self.cid is not None:
             self.fig.canvas.mpl_disconnect(self.cid)
             self.cid = None
 
+    @property
+    def is_interactive(self):
+        """Returns ``True`` if an interactive mode is currently enabled"""
+        return self.cid is not None or self._region_widget is not None
+
     def disable_interactive(self):
         """
         Detach registered callbacks for interactive plot selection/deletion
@@ -539,8 +1320,108 @@ class AxesLineSelector:
         self._disconnect_current_callback()
         return self
 
-    def __del__(self):
+    def memory_usage(self):
+        """
+        Approximate memory held by the selector in bytes, broken down by
+        component. Line data owned by the Axes is not counted, so the data of
+        a line only counts towards a component keeping it alive after the line
+        was removed from the Axes.
+
+        Returns:
+            (dict): Bytes held by ``'clipboard'`` (selected lines, including
+                the data of those no longer in the Axes), ``'undo'`` and
+                ``'redo'`` (the :attr:`journal` history), ``'caches'``
+                (statistics, hashes, spatial and label indices and the id
+                buffer), ``'decimated'`` (full-resolution data of decimated
+                lines) and ``'streams'`` (streaming ring buffers), and their
+                ``'total'``
+
+        Example:
+            >>> sel.delete_lines_by_inds(0, 1)
+            >>> sel.memory_usage()
+            {'clipboard': 0, 'undo': 16000032, 'redo': 0, 'caches': 0,
+             'decimated': 0, 'streams': 0, 'total': 16000032}
+        """
+        _release_closed_selectors()
+        ax = self._ax_ref()
+        in_axes = set(ax.lines) if ax is not None else set()
+        orphans = [ln for ln in self.line_clipboard if ln not in in_axes]
+        caches = (self._stats, self._hashes, self._line_index,
+                  self._segment_index, self._id_picker)
+        usage = {
+            'clipboard': 8 * len(self.line_clipboard)
+            + data_nbytes(line_arrays(orphans)),
+            'undo': self.journal.nbytes,
+            'redo': self.journal.redo_nbytes,
+            'caches': sum(c.nbytes for c in caches if c is not None),
+            'decimated': self._decimator.nbytes
+            if self._decimator is not None else 0,
+            'streams': self._streamer.nbytes
+            if self._streamer is not None else 0}
+        usage['total'] = sum(usage.values())
+        return usage
+
+    def release(self):
+        """
+        Release all state held by the selector: the clipboard, the undo/redo
+        :attr:`journal`, cached statistics and indices and interactive
+        callbacks, all of which keep the lines and their figure alive.
+        Decimated lines are restored to their full-resolution data first.
+
+        Called automatically once the figure is closed if
+        ``release_on_close`` is **True**, after which accessing :attr:`ax`
+        raises a ``ReferenceError``. Otherwise the selector remains usable
+        for as long as the Axes is kept alive elsewhere, as it only refers to
+        the Axes weakly.
+
+        Returns:
+            (AxesLineSelector): Current selection instance (``self``)
+        """
+        if self._released:
+            return self
+        if self._ax_ref() is not None:  # Else gone along with its canvas
+            self._disconnect_all()
+        if self._decimator is not None:
+            self._decimator.remove()
+        self.line_clipboard = LineSelection()
+        self.journal.clear()
+        self._stats = self._hashes = self._line_index = None
+        self._segment_index = self._id_picker = self._highlighter = None
+        self._legend_manager = self._decimator = self._streamer = None
+        self._collections = []
+        self._pending_redraws = []
+        self._manager_ref = None
+        _selectors.discard(self)
+        self._released = True
+        return self
+
+    def _on_close(self, event):
+        self.release()
+        self._closed = True
+
+    def _disconnect_all(self):
+        """Disconnect all callbacks and timers from the canvas"""
         self._disconnect_current_callback()
+        self.disable_hover()
+        if self._stream_timer is not None:
+            self._stream_timer.stop()
+            self._stream_timer = None
+        if self._close_cid is not None:
+            self.fig.canvas.mpl_disconnect(self._close_cid)
+            self._close_cid = None
+        self.instrumentation.untrack_draws()
+
+    def __del__(self):
+        # Drop clicks still in the debounce window rather than applying them
+        # (e.g. deleting lines) during garbage collection. Nothing is drawn
+        # or disconnected here, as the figure and its canvas may be torn down
+        # in the same collection; canvas callbacks are dropped along with the
+        # selector, but timers would keep firing
+        self._pending_picks = []
+        for timer in (getattr(self, '_pick_timer', None),
+                      getattr(self, '_stream_timer', None)):
+            if timer is not None:
+                timer.stop()
 
     def __repr__(self):
         clipboard = pformat(
@@ -548,12 +1429,14 @@ class AxesLineSelector:
                 self.line_clipboard)]).replace('\n', '\n\t\t')
         # deleted = pformat(
         #     [str(ln) for ln in self.deleted_lines]).replace('\n', '\n\t\t')
+        ax = self._ax_ref()
         lines = pformat(
             [f'{i}: {str(ln)}' for i, ln in enumerate(
-                self.ax.lines)]).replace('\n', '\n\t\t')
+                ax.lines if ax is not None else ())]).replace('\n', '\n\t\t')
+        ax_repr = ax.__repr__() if ax is not None else 'None (released)'
         return f"{self.__class__.__name__} (\n" \
-               f"\tax: {self.ax.__repr__()}\n" \
-               f"\tis_interactive: {self.cid is not None}\n" \
+               f"\tax: {ax_repr}\n" \
+               f"\tis_interactive: {self.is_interactive}\n" \
                f"\tlines: {lines}\n" \
                f"\tclipboard: {clipboard}\n" \
-               f"\tdeletion snapshot length: {len(self.delete_buffer)}\n)"
+               f"\tundo history length: {len(self.journal)}\n)"
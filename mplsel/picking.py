@@ -0,0 +1,131 @@
+import numpy as np
+from matplotlib.lines import Line2D
+
+from .stats import data_version
+
+
+class IdBufferPicker:
+    """
+    Offscreen picking engine that renders every line of an Axes once into an
+    Agg buffer with a unique flat color per line, so that resolving a click
+    becomes a pixel lookup rather than a ``Line2D.contains()`` test against
+    every artist.
+
+    The buffer is rebuilt lazily whenever the view limits, figure or Axes
+    size, the set of lines, their data arrays or their widths or styles
+    change. Call :meth:`invalidate` to force a rebuild after modifying
+    line data in place.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance whose lines are to be picked
+        pickradius (float, optional): Search radius in pixels around the
+            clicked location; Default is **5** (matching ``Line2D``)
+    """
+    def __init__(self, ax, pickradius=5):
+        self.ax = ax
+        self.pickradius = pickradius
+        self._lines = []  # Lines rendered in current buffer, ordered by id - 1
+        self._ids = None  # 2D array of line ids (0 for background)
+        self._key = None  # Cache key of current buffer
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the id buffer in bytes"""
+        return self._ids.nbytes if self._ids is not None else 0
+
+    def invalidate(self):
+        """Discard the current buffer so that it is rebuilt on next lookup"""
+        self._ids = None
+        self._key = None
+
+    def _cache_key(self):
+        fig = self.ax.figure
+        return (tuple(self.ax.viewLim.bounds),
+                tuple(self.ax.bbox.bounds),
+                tuple(fig.bbox.bounds),
+                fig.dpi,
+                tuple((id(ln), ln.get_linewidth(), ln.get_linestyle(),
+                       ln.get_markersize(),
+                       ln.get_visible()) + data_version(ln)
+                      for ln in self.ax.lines))
+
+    @staticmethod
+    def _id_to_rgb(line_id):
+        return ((line_id >> 16) & 0xFF) / 255., \
+               ((line_id >> 8) & 0xFF) / 255., \
+               (line_id & 0xFF) / 255.
+
+    def _make_proxy(self, line, line_id):
+        """Create a flat-colored, non-antialiased stand-in for ``line``"""
+        proxy = Line2D(*line.get_data(orig=False))
+        proxy.update_from(line)
+        proxy.set_figure(line.figure)
+        color = self._id_to_rgb(line_id)
+        proxy.set_color(color)
+        proxy.set_markerfacecolor(color)
+        proxy.set_markeredgecolor(color)
+        proxy.set_markerfacecoloralt(color)
+        proxy.set_alpha(None)
+        proxy.set_antialiased(False)
+        if line.get_linestyle() not in ('None', ' ', ''):
+            proxy.set_linestyle('-')  # Dashed lines are pickable along gaps
+        return proxy
+
+    def rebuild(self):
+        """Render all visible lines of :attr:`ax` into the offscreen id buffer"""
+        from matplotlib.backends.backend_agg import RendererAgg
+        fig = self.ax.figure
+        width, height = fig.bbox.size
+        renderer = RendererAgg(int(np.ceil(width)), int(np.ceil(height)),
+                               fig.dpi)
+        renderer.clear()
+        self._lines = list(self.ax.lines)
+        # Draw in the same order as matplotlib so that topmost lines win
+        drawn = sorted(enumerate(self._lines),
+                       key=lambda item: item[1].get_zorder())
+        for i, ln in drawn:
+            if ln.get_visible():
+                self._make_proxy(ln, i + 1).draw(renderer)
+        rgba = np.asarray(renderer.buffer_rgba())
+        ids = (rgba[..., 0].astype(np.uint32) << 16) \
+            | (rgba[..., 1].astype(np.uint32) << 8) \
+            | rgba[..., 2].astype(np.uint32)
+        ids[rgba[..., 3] == 0] = 0
+        self._ids = ids
+        self._key = self._cache_key()
+
+    def _ensure_buffer(self):
+        if self._ids is None or self._key != self._cache_key():
+            self.rebuild()
+
+    def line_at(self, x, y):
+        """
+        Return the topmost line rendered nearest to display coordinates
+        ``(x, y)`` within :attr:`pickradius` pixels.
+
+        Args:
+            x (float): Display x-coordinate in pixels (e.g. ``event.x``)
+            y (float): Display y-coordinate in pixels (e.g. ``event.y``)
+
+        Returns:
+            (matplotlib.lines.Line2D or None): Picked line, or **None** if no
+                line was rendered near the provided location
+        """
+        self._ensure_buffer()
+        height, width = self._ids.shape
+        col, row = int(x), height - 1 - int(y)
+        r = int(np.ceil(self.pickradius))
+        r0, r1 = max(row - r, 0), min(row + r + 1, height)
+        c0, c1 = max(col - r, 0), min(col + r + 1, width)
+        if r0 >= r1 or c0 >= c1:
+            return None
+        window = self._ids[r0:r1, c0:c1]
+        hit_rows, hit_cols = np.nonzero(window)
+        if len(hit_rows) == 0:
+            return None
+        dist = (hit_rows + r0 - row) ** 2 + (hit_cols + c0 - col) ** 2
+        nearest = np.argmin(dist)
+        if dist[nearest] > self.pickradius ** 2:
+            return None
+        line_id = window[hit_rows[nearest], hit_cols[nearest]]
+        return self._lines[line_id - 1]
@@ -0,0 +1,91 @@
+import numpy as np
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox
+
+# Maximum number of points tested against a region in a single vectorized pass
+_CHUNK_POINTS = 2 ** 22
+
+
+def as_region(region):
+    """
+    Normalize ``region`` to either a :class:`~matplotlib.transforms.Bbox` or a
+    closed :class:`~matplotlib.path.Path`
+
+    Args:
+        region (Bbox or Path or Sequence): A ``Bbox``, a ``Path``, a 4-tuple
+            ``(xmin, ymin, xmax, ymax)`` or an ``(N, 2)`` sequence of polygon
+            vertices in data coordinates
+
+    Returns:
+        (Bbox or Path): Normalized region
+    """
+    if isinstance(region, (Bbox, Path)):
+        return region
+    arr = np.asarray(region, dtype=float)
+    if arr.shape == (4,):
+        x0, y0, x1, y1 = arr
+        return Bbox.from_extents(min(x0, x1), min(y0, y1),
+                                 max(x0, x1), max(y0, y1))
+    if arr.ndim == 2 and arr.shape[1] == 2 and len(arr) >= 3:
+        if not np.array_equal(arr[0], arr[-1]):
+            arr = np.vstack([arr, arr[:1]])
+        return Path(arr, closed=True)
+    raise ValueError('region must be a Bbox, Path, (xmin, ymin, xmax, ymax) '
+                     'tuple or an (N, 2) sequence of polygon vertices')
+
+
+def _contains(region, x, y):
+    if isinstance(region, Bbox):
+        return (x >= region.x0) & (x <= region.x1) \
+            & (y >= region.y0) & (y <= region.y1)
+    return region.contains_points(np.column_stack([x, y]))
+
+
+def lines_in_region(data, bounds, region, min_fraction=None):
+    """
+    Vectorized test of which lines have points inside ``region``
+
+    Args:
+        data (Sequence[tuple]): Numeric ``(x, y)`` data of each line
+        bounds (dict): Per-line ``xmin``, ``xmax``, ``ymin`` and ``ymax``
+            arrays (see :class:`~mplsel.stats.LineStatsTable`), used to reject
+            lines whose bounding box does not intersect the region before any
+            point is tested
+        region (Bbox or Path): Region as returned by :func:`as_region`
+        min_fraction (float, optional): Minimum fraction of a line's points
+            that must be inside the region. Default of **None** requires at
+            least one point
+
+    Returns:
+        (numpy.ndarray): Boolean mask over the lines in ``data``
+    """
+    ext = region if isinstance(region, Bbox) else region.get_extents()
+    candidates = np.flatnonzero(
+        (bounds['xmax'] >= ext.x0) & (bounds['xmin'] <= ext.x1)
+        & (bounds['ymax'] >= ext.y0) & (bounds['ymin'] <= ext.y1))
+    counts = np.zeros(len(data), dtype=np.int64)
+    npoints = np.zeros(len(data), dtype=np.int64)
+
+    def test_chunk(inds):
+        xs = [np.asarray(data[i][0], dtype=float) for i in inds]
+        ys = [np.asarray(data[i][1], dtype=float) for i in inds]
+        lengths = np.array([len(y) for y in ys])
+        line_ids = np.repeat(inds, lengths)
+        inside = _contains(region, np.concatenate(xs), np.concatenate(ys))
+        counts[inds] = np.bincount(line_ids, weights=inside,
+                                   minlength=len(data))[inds].astype(np.int64)
+        npoints[inds] = lengths
+
+    chunk, n_chunk = [], 0
+    for i in candidates:
+        chunk.append(i)
+        n_chunk += len(data[i][1])
+        if n_chunk >= _CHUNK_POINTS:
+            test_chunk(np.array(chunk))
+            chunk, n_chunk = [], 0
+    if len(chunk) > 0:
+        test_chunk(np.array(chunk))
+
+    if min_fraction is None:
+        return counts > 0
+    return (counts > 0) & (counts / np.maximum(npoints, 1) >= min_fraction)
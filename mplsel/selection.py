@@ -0,0 +1,130 @@
+class LineSelection:
+    """
+    Insertion-ordered, hash-backed container of ``Line2D`` objects used as the
+    selection clipboard of :class:`~mplsel.AxesLineSelector`.
+
+    Adding, removing and membership tests are O(1). Indexed access is O(1)
+    as well, amortised over removals, which are tombstoned and compacted
+    lazily. Set operations (``|``, ``&``, ``-``) preserve the ordering of the
+    left-hand operand followed by any new items from the right-hand operand.
+
+    Args:
+        lines (Iterable[Line2D], optional): Initial lines of the selection.
+            Duplicates are ignored
+    """
+    _TOMBSTONE = object()
+
+    def __init__(self, lines=()):
+        self._items = []  # Lines in insertion order with tombstoned removals
+        self._pos = {}  # Line -> position in self._items
+        self.update(lines)
+
+    def add(self, line):
+        """
+        Add ``line`` to the end of the selection if not already present
+
+        Returns:
+            (bool): **True** if the line was added, **False** if it was already
+                part of the selection
+        """
+        if line in self._pos:
+            return False
+        self._pos[line] = len(self._items)
+        self._items.append(line)
+        return True
+
+    def update(self, lines):
+        """Add all ``lines`` not already in the selection, in order"""
+        for ln in lines:
+            self.add(ln)
+
+    def discard(self, line):
+        """Remove ``line`` from the selection if present"""
+        pos = self._pos.pop(line, None)
+        if pos is not None:
+            self._items[pos] = self._TOMBSTONE
+            if len(self._items) > 2 * len(self._pos) + 16:
+                self._compact()
+
+    def remove(self, line):
+        """Remove ``line`` from the selection. Raises ``KeyError`` if absent"""
+        if line not in self._pos:
+            raise KeyError(line)
+        self.discard(line)
+
+    def pop(self, index=-1):
+        """Remove and return the line at ``index`` (default: last)"""
+        if index == -1:
+            while self._items:
+                ln = self._items.pop()
+                if ln is not self._TOMBSTONE:
+                    del self._pos[ln]
+                    return ln
+            raise IndexError('pop from empty LineSelection')
+        ln = self[index]
+        self.discard(ln)
+        return ln
+
+    def clear(self):
+        self._items = []
+        self._pos = {}
+
+    def copy(self):
+        return self.__class__(self)
+
+    def _compact(self):
+        if len(self._items) != len(self._pos):
+            self._items = [ln for ln in self._items
+                           if ln is not self._TOMBSTONE]
+            self._pos = {ln: i for i, ln in enumerate(self._items)}
+
+    def index(self, line):
+        """Return the position of ``line`` within the selection"""
+        self._compact()
+        return self._pos[line]
+
+    def union(self, other):
+        new_sel = self.copy()
+        new_sel.update(other)
+        return new_sel
+
+    def intersection(self, other):
+        other = other if isinstance(other, (LineSelection, set, dict)) \
+            else set(other)
+        return self.__class__(ln for ln in self if ln in other)
+
+    def difference(self, other):
+        other = other if isinstance(other, (LineSelection, set, dict)) \
+            else set(other)
+        return self.__class__(ln for ln in self if ln not in other)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __getitem__(self, index):
+        self._compact()
+        if isinstance(index, slice):
+            return self.__class__(self._items[index])
+        return self._items[index]
+
+    def __contains__(self, line):
+        return line in self._pos
+
+    def __len__(self):
+        return len(self._pos)
+
+    def __iter__(self):
+        return (ln for ln in self._items if ln is not self._TOMBSTONE)
+
+    def __reversed__(self):
+        return (ln for ln in reversed(self._items)
+                if ln is not self._TOMBSTONE)
+
+    def __eq__(self, other):
+        if not isinstance(other, LineSelection):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)!r})'
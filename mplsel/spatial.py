@@ -0,0 +1,233 @@
+import numpy as np
+
+from .stats import data_version
+
+
+def _segment_distances(px, py, p0, p1):
+    """Distances from point ``(px, py)`` to the segments ``p0``-``p1``"""
+    d = p1 - p0
+    length_sq = np.einsum('ij,ij->i', d, d)
+    t = np.einsum('ij,ij->i', np.array([px, py]) - p0, d)
+    t = np.clip(np.divide(t, length_sq, out=np.zeros_like(t),
+                          where=length_sq > 0), 0, 1)
+    closest = p0 + t[:, None] * d
+    return np.hypot(closest[:, 0] - px, closest[:, 1] - py)
+
+
+def line_segments(line):
+    """
+    Return the segments of ``line`` in display space as ``(p0, p1)`` arrays
+    of start and end points. Lines without a line style (markers only) are
+    represented by zero-length segments at their points.
+    """
+    xy = line.get_transform().transform(line.get_xydata())
+    if line.get_linestyle() in ('None', ' ', ''):
+        p0 = p1 = xy
+    else:
+        p0, p1 = xy[:-1], xy[1:]
+    valid = np.isfinite(p0).all(axis=1) & np.isfinite(p1).all(axis=1)
+    return p0[valid], p1[valid]
+
+
+def line_distance(line, x, y):
+    """Distance in pixels from display coordinates ``(x, y)`` to ``line``"""
+    p0, p1 = line_segments(line)
+    if len(p0) == 0:
+        return np.inf
+    return float(_segment_distances(x, y, p0, p1).min())
+
+
+class SegmentIndex:
+    """
+    Uniform grid index over the segments of all visible lines of an Axes in
+    display space, used to find the lines nearest to a location without
+    testing every line. Each grid cell lists the segments whose bounding box
+    overlaps it, and queries search outwards from the cell containing the
+    query location until no unsearched segment can be nearer.
+
+    Lines without a line style (markers only) are indexed by their points.
+    The index is rebuilt lazily whenever the view limits, figure size, the
+    set of lines, their visibility or their data arrays change. Call
+    :meth:`invalidate` to force a rebuild after modifying line data in place.
+    While connected to the canvas via :meth:`connect` (e.g. for hovering),
+    these changes are only checked for after the canvas has been drawn, so
+    that queries on every mouse-move skip the check.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance whose lines are indexed
+        cell_size (float, optional): Edge length of the grid cells in pixels;
+            Default of **None** sizes cells to hold about
+            :attr:`SEGMENTS_PER_CELL` segments on average, enlarged as needed
+            to list each segment in at most :attr:`CELLS_PER_SEGMENT` cells
+            on average
+    """
+    #: Average number of segments per grid cell targeted by automatic sizing
+    SEGMENTS_PER_CELL = 16
+
+    #: Average number of grid cells a segment may be listed in before
+    #: automatic sizing enlarges the cells, bounding the size of the index
+    #: for long segments (e.g. noisy data)
+    CELLS_PER_SEGMENT = 4
+
+    def __init__(self, ax, cell_size=None):
+        self.ax = ax
+        self.cell_size = cell_size
+        self._lines = []  # Indexed lines, indexed by segment line ids
+        self._p0 = self._p1 = None  # (M, 2) segment end points in pixels
+        self._seg_lines = None  # (M,) line id of each segment
+        self._cell_segs = None  # Segment ids sorted by grid cell
+        self._cell_start = None  # Start of each cell in self._cell_segs
+        self._grid = None  # (x0, y0, nx, ny, cell) of the grid
+        self._key = None  # Cache key of the current index
+        self._cid = None  # Callback id of the connected draw_event
+        self._drawn = True  # Canvas drawn since the cache key was checked
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the index in bytes"""
+        arrays = (self._p0, self._p1, self._seg_lines, self._cell_segs,
+                  self._cell_start)
+        return sum(arr.nbytes for arr in arrays if arr is not None)
+
+    def invalidate(self):
+        """Discard the index so that it is rebuilt on next query"""
+        self._key = None
+
+    def connect(self):
+        """Only check whether the index is outdated after canvas draws"""
+        if self._cid is None:
+            self._cid = self.ax.figure.canvas.mpl_connect(
+                'draw_event', self._on_draw)
+            self._drawn = True
+
+    def disconnect(self):
+        if self._cid is not None:
+            self.ax.figure.canvas.mpl_disconnect(self._cid)
+            self._cid = None
+
+    def _on_draw(self, event):
+        self._drawn = True
+
+    def _cache_key(self):
+        fig = self.ax.figure
+        return (tuple(self.ax.viewLim.bounds),
+                tuple(self.ax.bbox.bounds),
+                fig.dpi,
+                tuple((id(ln), ln.get_visible(), ln.get_linestyle())
+                      + data_version(ln) for ln in self.ax.lines))
+
+    def rebuild(self):
+        """Index the segments of all visible lines of :attr:`ax`"""
+        self._lines = [ln for ln in self.ax.lines if ln.get_visible()]
+        segments = [line_segments(ln) for ln in self._lines]
+        self._p0 = np.concatenate([s[0] for s in segments] + [np.zeros((0, 2))])
+        self._p1 = np.concatenate([s[1] for s in segments] + [np.zeros((0, 2))])
+        self._seg_lines = np.repeat(np.arange(len(segments)),
+                                    [len(s[0]) for s in segments])
+
+        x0, y0, width, height = self.ax.bbox.bounds
+        cell = self.cell_size
+        if cell is None:
+            cell = np.sqrt(width * height * self.SEGMENTS_PER_CELL
+                           / max(len(self._seg_lines), 1))
+            cell = float(np.clip(cell, 2, 64))
+
+        # Range of cells overlapped by the bounding box of each segment.
+        # Segments outside the Axes are clamped into the border cells
+        lo = np.minimum(self._p0, self._p1)
+        hi = np.maximum(self._p0, self._p1)
+        max_entries = self.CELLS_PER_SEGMENT * len(self._seg_lines)
+        while True:
+            nx = max(1, int(np.ceil(width / cell)))
+            ny = max(1, int(np.ceil(height / cell)))
+            self._grid = (x0, y0, nx, ny, cell)
+            cx0, cy0 = self._cells(lo[:, 0], lo[:, 1])
+            cx1, cy1 = self._cells(hi[:, 0], hi[:, 1])
+            widths = cx1 - cx0 + 1
+            counts = widths * (cy1 - cy0 + 1)
+            if self.cell_size is not None or nx * ny == 1 \
+                    or counts.sum() <= max_entries:
+                break
+            cell *= 2
+        seg_ids = np.repeat(np.arange(len(counts)), counts)
+        k = np.arange(len(seg_ids)) - np.repeat(np.cumsum(counts) - counts,
+                                                counts)
+        cells = (cy0[seg_ids] + k // widths[seg_ids]) * nx \
+            + cx0[seg_ids] + k % widths[seg_ids]
+        order = np.argsort(cells, kind='stable')
+        self._cell_segs = seg_ids[order]
+        self._cell_start = np.searchsorted(cells[order],
+                                           np.arange(nx * ny + 1))
+        self._key = self._cache_key()
+
+    def _cells(self, x, y):
+        x0, y0, nx, ny, cell = self._grid
+        cx = np.clip(np.floor((x - x0) / cell), 0, nx - 1)
+        cy = np.clip(np.floor((y - y0) / cell), 0, ny - 1)
+        return cx.astype(np.int64), cy.astype(np.int64)
+
+    def _ensure_index(self):
+        if self._cid is not None and not self._drawn and self._key is not None:
+            return
+        self._drawn = False
+        if self._key is None or self._key != self._cache_key():
+            self.rebuild()
+
+    def _search_window(self, x, y, qx, qy, r):
+        """
+        Return the ids of segments in the square of cells within ``r`` cells
+        of cell ``(qx, qy)`` (possibly with duplicates), and the distance
+        from ``(x, y)`` beyond which unsearched segments may lie
+        """
+        x0, y0, nx, ny, cell = self._grid
+        c0, c1 = max(qx - r, 0), min(qx + r, nx - 1)
+        r0, r1 = max(qy - r, 0), min(qy + r, ny - 1)
+        # The cells of one grid row are contiguous in self._cell_segs
+        segs = np.concatenate(
+            [self._cell_segs[self._cell_start[cy * nx + c0]:
+                             self._cell_start[cy * nx + c1 + 1]]
+             for cy in range(r0, r1 + 1)])
+        # Nothing lies beyond the border cells, as segments are clamped
+        edges = [x - (x0 + c0 * cell) if c0 > 0 else np.inf,
+                 x0 + (c1 + 1) * cell - x if c1 < nx - 1 else np.inf,
+                 y - (y0 + r0 * cell) if r0 > 0 else np.inf,
+                 y0 + (r1 + 1) * cell - y if r1 < ny - 1 else np.inf]
+        return segs, max(min(edges), 0)
+
+    def nearest(self, x, y, k=1, max_distance=None):
+        """
+        Return the ``k`` lines nearest to display coordinates ``(x, y)``
+
+        Args:
+            x (float): Display x-coordinate in pixels (e.g. ``event.x``)
+            y (float): Display y-coordinate in pixels (e.g. ``event.y``)
+            k (int, optional): Maximum number of lines returned; Default is
+                **1**
+            max_distance (float, optional): Only return lines within this
+                distance in pixels; Default of **None** has no limit
+
+        Returns:
+            (list[tuple]): ``(line, distance)`` pairs ordered by increasing
+                distance in pixels
+        """
+        self._ensure_index()
+        if len(self._seg_lines) == 0:
+            return []
+        (qx,), (qy,) = self._cells(np.array([x]), np.array([y]))
+        r = 0
+        while True:
+            segs, bound = self._search_window(x, y, qx, qy, r)
+            dist = _segment_distances(x, y, self._p0[segs], self._p1[segs])
+            seg_lines = self._seg_lines[segs]
+            nearest = {}  # Line id -> distance, for the k nearest lines
+            for i in np.argsort(dist, kind='stable'):
+                if dist[i] > bound or len(nearest) == k:
+                    break
+                nearest.setdefault(seg_lines[i], dist[i])
+            if len(nearest) == k or bound == np.inf or \
+                    (max_distance is not None and bound >= max_distance):
+                break
+            r = max(1, 2 * r)
+        return [(self._lines[line_id], float(d))
+                for line_id, d in nearest.items()
+                if max_distance is None or d <= max_distance]
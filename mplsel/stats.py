@@ -0,0 +1,167 @@
+import operator
+import warnings
+
+import numpy as np
+
+
+def data_version(line):
+    """
+    Return a key identifying the current x/y data of ``line``. The key changes
+    whenever the data arrays are replaced via ``set_data``/``set_xdata``/
+    ``set_ydata``. In-place modification of the arrays is not detected.
+    """
+    xorig, yorig = line.get_xdata(orig=True), line.get_ydata(orig=True)
+    return id(xorig), id(yorig), len(xorig), len(yorig)
+
+
+class LineStatsTable:
+    """
+    Cache of vectorized per-line statistics for the lines of an Axes, used to
+    evaluate data-driven selection queries without a Python callback per line.
+
+    Statistics of a line are computed once and reused until its data arrays
+    are replaced. The table is indexed in the same order as ``ax.lines``.
+
+    Available fields are listed in :attr:`FIELDS`.
+
+    Args:
+        ax (matplotlib.pyplot.Axes): Axes instance whose lines are tabulated
+        data_getter (Callable, optional): Function with call-signature
+            ``(line)`` returning the numeric ``(x, y)`` data to tabulate for
+            ``line``. Default of **None** uses the line's current data
+    """
+    FIELDS = ('xmin', 'xmax', 'xmean', 'ymin', 'ymax', 'ymean',
+              'npoints', 'nnan')
+
+    OPERATORS = {
+        'gt': operator.gt, 'ge': operator.ge, 'lt': operator.lt,
+        'le': operator.le, 'eq': operator.eq, 'ne': operator.ne,
+        'between': lambda a, lim: (a >= lim[0]) & (a <= lim[1]),
+        'isin': lambda a, vals: np.isin(a, vals)}
+
+    def __init__(self, ax, data_getter=None):
+        self.ax = ax
+        self.data_getter = data_getter
+        self._line_stats = {}  # Line -> (data version, stats row)
+        self._table = None
+        self._table_key = None
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the cached statistics in bytes"""
+        nbytes = len(self._line_stats) * 8 * (len(self.FIELDS) + 4)
+        if self._table is not None:
+            nbytes += sum(arr.nbytes for arr in self._table.values())
+        return nbytes
+
+    def invalidate(self, line=None):
+        """
+        Discard cached statistics for ``line``, or for all lines if **None**.
+        Required after modifying line data arrays in place.
+        """
+        if line is None:
+            self._line_stats.clear()
+        else:
+            self._line_stats.pop(line, None)
+        self._table = None
+        self._table_key = None
+
+    def _get_data(self, line):
+        if self.data_getter is not None:
+            return self.data_getter(line)
+        return line.get_xdata(orig=False), line.get_ydata(orig=False)
+
+    @staticmethod
+    def compute_stats(x, y):
+        """Return a tuple of :attr:`FIELDS` values for line data ``x, y``"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        nnan = int(np.count_nonzero(np.isnan(x) | np.isnan(y)))
+        if len(y) - nnan == 0:
+            return (np.nan,) * 6 + (len(y), nnan)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return (np.nanmin(x), np.nanmax(x), np.nanmean(x),
+                    np.nanmin(y), np.nanmax(y), np.nanmean(y),
+                    len(y), nnan)
+
+    def _row(self, line, x, y):
+        """Return the cached statistics of ``line`` for its data ``x, y``,
+        computing them if its data was replaced"""
+        version = (id(x), id(y), len(x), len(y))
+        cached = self._line_stats.get(line)
+        if cached is None or cached[0] != version:
+            cached = (version, self.compute_stats(x, y))
+            self._line_stats[line] = cached
+        return cached[1]
+
+    def stats(self, line):
+        """
+        Return the statistics of a single line, which need not be in
+        ``ax.lines``, without tabulating all other lines
+
+        Returns:
+            (dict): Mapping of each field in :attr:`FIELDS` to its value
+        """
+        return dict(zip(self.FIELDS, self._row(line, *self._get_data(line))))
+
+    def table(self):
+        """
+        Return the statistics of all lines in ``ax.lines``
+
+        Returns:
+            (dict): Mapping of each field in :attr:`FIELDS` to a NumPy array of
+                length ``len(ax.lines)``
+        """
+        lines = self.ax.lines
+        data = [self._get_data(ln) for ln in lines]
+        versions = [(id(x), id(y), len(x), len(y)) for x, y in data]
+        key = tuple(zip(map(id, lines), versions))
+        if self._table is not None and key == self._table_key:
+            return self._table
+
+        rows = [self._row(ln, x, y) for ln, (x, y) in zip(lines, data)]
+        # Drop cached stats of lines no longer in the Axes
+        if len(self._line_stats) > len(lines):
+            current = set(lines)
+            for ln in [ln for ln in self._line_stats if ln not in current]:
+                del self._line_stats[ln]
+
+        arr = np.array(rows, dtype=float).reshape(len(rows), len(self.FIELDS))
+        self._table = {field: arr[:, i] for i, field in enumerate(self.FIELDS)}
+        self._table['npoints'] = self._table['npoints'].astype(int)
+        self._table['nnan'] = self._table['nnan'].astype(int)
+        self._table_key = key
+        return self._table
+
+    def query(self, **criteria):
+        """
+        Evaluate ``criteria`` against the table and return a boolean mask over
+        ``ax.lines``. All criteria must hold for a line to match.
+
+        Criteria are given as ``<field>__<op>=value`` where ``op`` is one of
+        :attr:`OPERATORS` (``<field>=value`` is shorthand for ``eq``), or as
+        ``xrange=(lo, hi)``/``yrange=(lo, hi)`` to match lines whose x/y extent
+        overlaps the given interval.
+
+        Returns:
+            (numpy.ndarray): Boolean mask of length ``len(ax.lines)``
+        """
+        table = self.table()
+        mask = np.ones(len(self.ax.lines), dtype=bool)
+        for name, value in criteria.items():
+            if name in ('xrange', 'yrange'):
+                lo, hi = value
+                axis = name[0]
+                mask &= (table[f'{axis}max'] >= lo) & (table[f'{axis}min'] <= hi)
+                continue
+            field, _, op = name.partition('__')
+            op = op or 'eq'
+            if field not in table:
+                raise ValueError(f'Unsupported field: {field}. Must be one of '
+                                 f'{self.FIELDS + ("xrange", "yrange")}')
+            if op not in self.OPERATORS:
+                raise ValueError(f'Unsupported operator: {op}. Must be one of '
+                                 f'{tuple(self.OPERATORS)}')
+            mask &= self.OPERATORS[op](table[field], value)
+        return mask
@@ -0,0 +1,120 @@
+import numpy as np
+
+from .duplicates import array_digest
+
+
+def _owner(arr):
+    """Return the array owning the memory viewed by ``arr``"""
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+def buffer_key(arr):
+    """Return a key that is equal for arrays viewing the same memory in the
+    same way"""
+    return (id(_owner(arr)), arr.__array_interface__['data'][0], arr.shape,
+            arr.strides, arr.dtype.str)
+
+
+def data_nbytes(arrays):
+    """
+    Return the total size in bytes of the distinct buffers backing
+    ``arrays``. Arrays viewing the same buffer are counted once, with the full
+    size of the buffer.
+    """
+    owners = {}
+    for arr in arrays:
+        arr = _owner(arr) if isinstance(arr, np.ndarray) else np.asarray(arr)
+        owners[id(arr)] = arr.nbytes
+    return sum(owners.values())
+
+
+def line_arrays(lines):
+    """Return the original x and y data arrays of ``lines``"""
+    return [data for ln in lines
+            for data in (ln.get_xdata(orig=True), ln.get_ydata(orig=True))]
+
+
+def cached_arrays(lines):
+    """Return the ``(N, 2)`` float64 copies of the data that matplotlib caches
+    to draw ``lines``, which are not shared between lines"""
+    return [ln._xy for ln in lines if getattr(ln, '_xy', None) is not None]
+
+
+def bind_data(line, x=None, y=None):
+    """Bind ``line`` to the arrays ``x`` and/or ``y`` directly, bypassing the
+    copy made by ``Line2D.set_data`` in recent matplotlib versions"""
+    if x is not None:
+        line._xorig = x
+        line._invalidx = True
+    if y is not None:
+        line._yorig = y
+        line._invalidy = True
+    line.stale = True
+
+
+def readonly_copy(data, dtype=None):
+    """Return a contiguous read-only copy of ``data`` that can be shared"""
+    copy = np.array(data, dtype=dtype, copy=True)
+    copy.flags.writeable = False
+    return copy
+
+
+def _is_numeric(arr):
+    return arr.dtype.kind in 'biuf'
+
+
+def _downcast_dtype(dtype, downcast):
+    if downcast and dtype.kind == 'f' and dtype.itemsize > 4:
+        return np.dtype(np.float32)
+    return dtype
+
+
+def compact_lines(lines, downcast=False):
+    """
+    Rebind ``lines`` with identical x-data onto a single shared read-only
+    copy of it, and optionally store x and y data as ``float32``. Lines are
+    grouped by content hashes of their x-data, which are computed once per
+    distinct buffer. Only numeric data is compacted.
+
+    Args:
+        lines (Sequence[Line2D]): Lines to compact
+        downcast (bool, optional): If **True**, store floating-point data as
+            ``float32``, losing precision beyond about 7 significant digits;
+            Default is **False**
+
+    Returns:
+        (int): Number of bytes by which the distinct buffers backing the data
+            of ``lines`` shrank. The memory is only released once no other
+            references to the replaced arrays remain
+    """
+    lines = list(lines)
+    nbytes = data_nbytes(line_arrays(lines))
+    digests = {}  # Buffer key -> digest, to hash each distinct buffer once
+    groups = {}  # Digest -> [(line, x)]
+    for ln in lines:
+        x = np.asarray(ln.get_xdata(orig=True))
+        if not _is_numeric(x):
+            continue
+        key = buffer_key(x)
+        if key not in digests:
+            digests[key] = array_digest(x)
+        groups.setdefault(digests[key], []).append((ln, x))
+
+    for group in groups.values():
+        xs = [x for _, x in group]
+        dtype = _downcast_dtype(
+            np.result_type(*{x.dtype for x in xs}), downcast)
+        if len({buffer_key(x) for x in xs}) == 1 and xs[0].dtype == dtype:
+            continue  # Already shared
+        shared = readonly_copy(xs[0], dtype)
+        for ln, _ in group:
+            bind_data(ln, x=shared)
+
+    if downcast:
+        for ln in lines:
+            y = np.asarray(ln.get_ydata(orig=True))
+            if _is_numeric(y) and _downcast_dtype(y.dtype, True) != y.dtype:
+                bind_data(ln, y=y.astype(np.float32))
+    return nbytes - data_nbytes(line_arrays(lines))
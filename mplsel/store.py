@@ -0,0 +1,380 @@
+import logging
+import weakref
+from pprint import pformat
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.artist import Artist
+from matplotlib.lines import Line2D
+
+from .editor import LineEditor
+from .journal import DASH_PROPERTIES, get_line_attr, set_line_attr
+from .linesel import AxesLineSelector
+from .selection import LineSelection
+from .storage import bind_data, data_nbytes, line_arrays
+from .style import values_equal
+
+logger = logging.getLogger(__name__)
+
+#: Line properties held by a :class:`LineRecord`. The dash pattern properties
+#: of :attr:`LineEditor.LINE_PROPERTIES` are derived from ``linestyle``
+STYLE_PROPERTIES = LineEditor.LINE_PROPERTIES.difference(DASH_PROPERTIES)
+
+
+def default_style():
+    """Return the style of a new line according to the current rcParams,
+    apart from its color, which follows the property cycle"""
+    return dict(
+        linewidth=rcParams['lines.linewidth'],
+        linestyle=rcParams['lines.linestyle'],
+        alpha=None,
+        color=rcParams['lines.color'],
+        antialiased=rcParams['lines.antialiased'],
+        dashcapstyle=rcParams['lines.dash_capstyle'],
+        dashjoinstyle=rcParams['lines.dash_joinstyle'],
+        drawstyle='default',
+        label='',
+        marker=rcParams['lines.marker'],
+        markeredgecolor=rcParams['lines.markeredgecolor'],
+        markeredgewidth=rcParams['lines.markeredgewidth'],
+        markerfacecolor=rcParams['lines.markerfacecolor'],
+        markerfacecoloralt='none',
+        markersize=rcParams['lines.markersize'],
+        markevery=None,
+        solidcapstyle=rcParams['lines.solid_capstyle'],
+        solidjoinstyle=rcParams['lines.solid_joinstyle'],
+        visible=True)
+
+
+class LineRecord:
+    """
+    Data and style of one line of a :class:`LineStore`, without the artist
+    machinery of a ``Line2D``. Style properties are stored as ``_<attr>``
+    attributes, so that the undo journal treats records like lines.
+
+    Args:
+        x (ArrayLike): x-data of the line, kept without copying if it is
+            already a NumPy array
+        y (ArrayLike): y-data of the line
+        **style: Values of :data:`STYLE_PROPERTIES`. Missing properties
+            default to :func:`default_style`
+    """
+    __slots__ = ('x', 'y') + tuple(f'_{attr}' for attr in STYLE_PROPERTIES)
+
+    def __init__(self, x, y, **style):
+        unsupported = set(style) - STYLE_PROPERTIES
+        assert len(unsupported) == 0, \
+            f'{unsupported} are unsupported line-properties. Must be ' \
+            f'one of {STYLE_PROPERTIES}'
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        for attr, value in {**default_style(), **style}.items():
+            setattr(self, f'_{attr}', value)
+
+    @property
+    def style(self):
+        """Returns a dict of all :data:`STYLE_PROPERTIES` of the record"""
+        return {attr: getattr(self, f'_{attr}') for attr in STYLE_PROPERTIES}
+
+    def get_xdata(self, orig=True):
+        return self.x
+
+    def get_ydata(self, orig=True):
+        return self.y
+
+    def get_data(self, orig=True):
+        return self.x, self.y
+
+    def get_label(self):
+        return self._label
+
+    def __str__(self):
+        return f'LineRecord({self._label})'
+
+    __repr__ = __str__
+
+
+class LineStoreArtist(Artist):
+    """
+    Artist drawing the records of a :class:`LineStore` in an Axes. A
+    ``Line2D`` is created for each record on the first draw, and on later
+    draws lines are only synced with the records if the store changed since.
+    Created via :meth:`LineStore.attach`; call :meth:`remove` to detach.
+
+    Args:
+        store (LineStore): Store whose records are drawn
+    """
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self._lines = {}  # Record -> (Line2D, style applied to it)
+        self._synced = None  # Store version the lines were last synced to
+
+    def _new_line(self):
+        ln = Line2D([], [])
+        ln.axes = self.axes  # Enables subslicing of sorted data
+        ln.stale_callback = None  # The store marks this artist stale instead
+        ln.set_figure(self.figure)
+        ln.set_transform(self.get_transform())
+        ln.set_clip_on(self.get_clip_on())
+        ln.set_clip_path(self.axes.patch)
+        return ln, {}
+
+    def sync(self):
+        """
+        Create or update the ``Line2D`` of each record of the store
+
+        Returns:
+            (list[Line2D]): Lines in the order of ``store.lines``
+        """
+        records = self.store.lines
+        if self._synced != self.store.version:
+            lines = {}
+            for rec in records:
+                ln, applied = self._lines.get(rec) or self._new_line()
+                if ln.get_xdata(orig=True) is not rec.x \
+                        or ln.get_ydata(orig=True) is not rec.y:
+                    bind_data(ln, rec.x, rec.y)
+                for attr, value in rec.style.items():
+                    if attr not in applied \
+                            or not values_equal(applied[attr], value):
+                        set_line_attr(ln, attr, value)
+                        applied[attr] = value
+                lines[rec] = (ln, applied)
+            self._lines = lines  # Drops lines of records no longer stored
+            self._synced = self.store.version
+        return [self._lines[rec][0] for rec in records]
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        # Same order as matplotlib draws the lines of an Axes
+        for ln in sorted(self.sync(), key=lambda ln: ln.get_zorder()):
+            ln.draw(renderer)
+        self.stale = False
+
+    def legend_handles_labels(self):
+        """
+        Return the lines and labels to pass to ``ax.legend``, skipping lines
+        whose label is empty or starts with an underscore
+
+        Example:
+            >>> ax.legend(*artist.legend_handles_labels())
+        """
+        handles = [ln for ln in self.sync()
+                   if ln.get_label() and not ln.get_label().startswith('_')]
+        return handles, [ln.get_label() for ln in handles]
+
+
+class LineStore(LineEditor):
+    """
+    Lightweight selection model holding line data and style as
+    :class:`LineRecord` instances rather than ``Line2D`` artists. Shares the
+    selection, deletion, reordering, styling and undo operations of
+    :class:`~mplsel.AxesLineSelector` (see :class:`~mplsel.editor.LineEditor`)
+    but does not require an Axes or pyplot, so
+    that data-only filtering never pays for artists. Artists are only created
+    once the store is drawn via :meth:`attach`, or converted into regular
+    lines via :meth:`materialize`.
+
+    Args:
+        journal_max_bytes (int, optional): Approximate memory budget of the
+            undo journal in bytes (see :class:`~mplsel.journal.EditJournal`);
+            Default is **256 MiB**
+
+    Attributes:
+        lines (list[LineRecord]): Records in drawing order
+        line_clipboard (LineSelection): Currently selected records
+        journal (EditJournal): Undo/redo history of operations on the store
+        instrumentation (Instrumentation): Event notifications and timings
+        version (int): Counter incremented on every change to the records
+
+    Example:
+        >>> store = LineStore()
+        >>> store.add_lines((t, y) for y in signals)
+        >>> store.select_where(nnan__gt=0).delete_selection()
+        >>> store.select_by_label('sensor-*', 'glob') \\
+        ...     .setattr_selection('color', 'C1')
+        >>> fig, ax = plt.subplots()
+        >>> store.attach(ax)  # Line2D artists are created when drawn
+    """
+    LINE_PROPERTIES = STYLE_PROPERTIES
+
+    def __init__(self, journal_max_bytes=256 * 2 ** 20):
+        super().__init__(journal_max_bytes=journal_max_bytes)
+        self.lines = []
+        self.version = 0
+        self._n_added = 0  # Lines added so far, for the color cycle
+        self._artists = weakref.WeakSet()  # Attached LineStoreArtists
+
+    @classmethod
+    def from_lines(cls, lines, journal_max_bytes=256 * 2 ** 20):
+        """
+        Create a store holding the data and style of ``lines``. The data
+        arrays are shared with the lines rather than copied.
+
+        Args:
+            lines (Iterable[Line2D]): Lines to store, e.g. ``ax.lines``
+            journal_max_bytes (int, optional): See :class:`LineStore`
+
+        Returns:
+            (LineStore): New store with one record per line
+        """
+        store = cls(journal_max_bytes=journal_max_bytes)
+        store.lines = [
+            LineRecord(ln.get_xdata(orig=True), ln.get_ydata(orig=True),
+                       **{attr: get_line_attr(ln, attr)
+                          for attr in STYLE_PROPERTIES})
+            for ln in lines]
+        store._n_added = len(store.lines)
+        return store
+
+    @property
+    def _lines_owner(self):
+        return self
+
+    def _changed(self):
+        """Mark attached artists stale after any change to the records"""
+        self.version += 1
+        for artist in self._artists:
+            artist.stale = True
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the records, caches and the undo/redo
+        history in bytes"""
+        caches = [cache for cache in (self._stats, self._hashes)
+                  if cache is not None]
+        return data_nbytes(line_arrays(self.lines)) + self.journal.nbytes \
+            + self.journal.redo_nbytes + sum(c.nbytes for c in caches)
+
+    def add_line(self, x, y, **style):
+        """
+        Add a line to the end of the store. Like plotting onto an Axes, this
+        is not recorded in the undo journal.
+
+        Args:
+            x (ArrayLike): x-data of the line, stored without copying if it is
+                already a NumPy array
+            y (ArrayLike): y-data of the line
+            **style: Values of :data:`STYLE_PROPERTIES`. The color defaults to
+                the next color of the property cycle
+
+        Returns:
+            (LineRecord): The new record
+        """
+        return self.add_lines([(x, y)], **style)[0]
+
+    def add_lines(self, data, **style):
+        """
+        Add several lines to the end of the store (see :meth:`add_line`)
+
+        Args:
+            data (Iterable[tuple]): ``(x, y)`` data of each line
+            **style: Style applied to all lines
+
+        Returns:
+            (list[LineRecord]): The new records
+        """
+        colors = rcParams['axes.prop_cycle'].by_key().get('color')
+        records = []
+        for x, y in data:
+            rec_style = dict(style)
+            if 'color' not in rec_style and colors:
+                rec_style['color'] = colors[self._n_added % len(colors)]
+            records.append(LineRecord(x, y, **rec_style))
+            self._n_added += 1
+        self.lines.extend(records)
+        self._changed()
+        return records
+
+    def set_data(self, line_or_index, x, y):
+        """
+        Replace the data of a record, e.g. to update it with new samples
+
+        Args:
+            line_or_index (LineRecord or int): Record or its index in
+                :attr:`lines`
+            x (ArrayLike): New x-data
+            y (ArrayLike): New y-data
+
+        Returns:
+            (LineStore): Current store instance (``self``)
+        """
+        rec = self.lines[line_or_index] \
+            if isinstance(line_or_index, (int, np.integer)) else line_or_index
+        rec.x, rec.y = np.asarray(x), np.asarray(y)
+        self._changed()
+        return self
+
+    def _data_limits(self):
+        table = self.line_stats()
+        if len(self.lines) == 0 or np.all(np.isnan(table['xmin'])):
+            return None
+        return [(np.nanmin(table['xmin']), np.nanmin(table['ymin'])),
+                (np.nanmax(table['xmax']), np.nanmax(table['ymax']))]
+
+    def attach(self, ax):
+        """
+        Draw the records in ``ax`` through a :class:`LineStoreArtist` and
+        autoscale ``ax`` to their data. No ``Line2D`` is created until the
+        figure is drawn, and the artist follows later changes to the store.
+
+        Args:
+            ax (matplotlib.axes.Axes): Axes to draw the records in
+
+        Returns:
+            (LineStoreArtist): The artist added to ``ax``
+        """
+        artist = LineStoreArtist(self)
+        ax.add_artist(artist)
+        self._artists.add(artist)
+        limits = self._data_limits()
+        if limits is not None:
+            ax.update_datalim(limits)
+            ax.autoscale_view()
+        return artist
+
+    def materialize(self, ax, **kwargs):
+        """
+        Add a regular ``Line2D`` for each record to ``ax``, sharing the data
+        arrays of the records, for full interactive editing through an
+        :class:`~mplsel.AxesLineSelector`
+
+        Args:
+            ax (matplotlib.axes.Axes): Axes to add the lines to
+            **kwargs: Passed on to :class:`~mplsel.AxesLineSelector`
+
+        Returns:
+            (AxesLineSelector): New selection instance linked to ``ax`` with
+                the lines of the selected records selected
+        """
+        lines = {}
+        for rec in self.lines:
+            ln = Line2D([], [])
+            bind_data(ln, rec.x, rec.y)
+            for attr, value in rec.style.items():
+                set_line_attr(ln, attr, value)
+            ax.add_line(ln)
+            lines[rec] = ln
+        ax.autoscale_view()
+        sel = AxesLineSelector(ax, **kwargs)
+        sel.line_clipboard = LineSelection(
+            lines[rec] for rec in self.line_clipboard if rec in lines)
+        sel.redraw()
+        return sel
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __repr__(self):
+        clipboard = pformat(
+            [f'{i}: {str(rec)}' for i, rec in enumerate(
+                self.line_clipboard)]).replace('\n', '\n\t\t')
+        lines = pformat(
+            [f'{i}: {str(rec)}' for i, rec in enumerate(
+                self.lines)]).replace('\n', '\n\t\t')
+        return f"{self.__class__.__name__} (\n" \
+               f"\tlines: {lines}\n" \
+               f"\tclipboard: {clipboard}\n" \
+               f"\tundo history length: {len(self.journal)}\n)"
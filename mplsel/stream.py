@@ -0,0 +1,164 @@
+from collections import deque
+from numbers import Number
+
+import numpy as np
+
+from .storage import bind_data
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer holding the most recent ``capacity`` values. Every
+    value is stored twice, ``capacity`` elements apart, so that the buffered
+    values are always available as one contiguous view without copying.
+
+    Args:
+        capacity (int): Maximum number of values held
+        dtype (numpy.dtype, optional): Data type of the values; Default is
+            **float**
+    """
+    def __init__(self, capacity, dtype=float):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.capacity = capacity
+        self._data = np.empty(2 * capacity, dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, values):
+        """Append ``values``, discarding the oldest values beyond capacity"""
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        cap = self.capacity
+        if len(values) >= cap:
+            self._data[:cap] = self._data[cap:] = values[-cap:]
+            self._start, self._size = 0, cap
+            return
+        inds = (self._start + self._size + np.arange(len(values))) % cap
+        self._data[inds] = self._data[inds + cap] = values
+        overflow = max(0, self._size + len(values) - cap)
+        self._start = (self._start + overflow) % cap
+        self._size = min(cap, self._size + len(values))
+
+    def view(self):
+        """Return a read-only view of the buffered values, oldest first"""
+        view = self._data[self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+
+
+def _buffer_dtype(*arrays):
+    """Common dtype of ``arrays`` that can be held in a :class:`RingBuffer`"""
+    try:
+        dtype = np.result_type(*[np.asarray(a) for a in arrays])
+    except TypeError:
+        return np.dtype(float)
+    if dtype.kind in 'biu':
+        return np.dtype(float)  # Leave room for non-integer samples
+    return dtype if dtype.kind in 'fcmM' else np.dtype(float)
+
+
+class LineStreamer:
+    """
+    Streaming storage for lines whose data grows continuously. Producers hand
+    chunks of samples over through :meth:`push`, which is safe to call from
+    any thread, and the GUI thread applies all pending chunks in one go via
+    :meth:`flush`. Each streamed line keeps its identity and is bound to views
+    of two :class:`RingBuffer` instances holding the most recent ``window``
+    samples.
+
+    Args:
+        window (int): Number of most recent samples retained per line
+    """
+    def __init__(self, window):
+        self.window = window
+        self._buffers = {}  # Line -> (x RingBuffer, y RingBuffer)
+        self._pending = deque()  # (line, x chunk, y chunk) from producers
+
+    def __contains__(self, line):
+        return line in self._buffers
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the ring buffers in bytes"""
+        return sum(buf.nbytes for buffers in self._buffers.values()
+                   for buf in buffers)
+
+    def push(self, line, x_chunk, y_chunk):
+        """Queue a chunk of samples for ``line``, which may also be an index
+        resolved by :meth:`flush`. Thread-safe"""
+        x_chunk = np.array(x_chunk, copy=True).ravel()
+        y_chunk = np.array(y_chunk, copy=True).ravel()
+        if len(x_chunk) != len(y_chunk):
+            raise ValueError('x_chunk and y_chunk must be of equal length')
+        self._pending.append((line, x_chunk, y_chunk))
+
+    @property
+    def n_pending(self):
+        """Returns number of queued chunks not yet applied by :meth:`flush`"""
+        return len(self._pending)
+
+    def _buffers_for(self, line, x_chunk, y_chunk, on_new_line):
+        buffers = self._buffers.get(line)
+        if buffers is None:
+            if on_new_line is not None:
+                on_new_line(line)
+            # Seed the buffers with the data the line already holds
+            xorig = line.get_xdata(orig=True)
+            yorig = line.get_ydata(orig=True)
+            buffers = (RingBuffer(self.window, _buffer_dtype(xorig, x_chunk)),
+                       RingBuffer(self.window, _buffer_dtype(yorig, y_chunk)))
+            buffers[0].extend(xorig)
+            buffers[1].extend(yorig)
+            self._buffers[line] = buffers
+        return buffers
+
+    def flush(self, on_new_line=None, resolve=None):
+        """
+        Apply all queued chunks and rebind the updated lines to their latest
+        buffer contents. Must be called from the GUI thread.
+
+        Args:
+            on_new_line (Callable, optional): Function with call-signature
+                ``(line)`` called before the buffers of a line that was not
+                streamed before are seeded with its current data
+            resolve (Callable, optional): Function with call-signature
+                ``(index)`` returning the line for chunks pushed with an index
+                rather than a line. Required if any such chunks are queued
+
+        Returns:
+            (list[Line2D]): Lines whose data was updated
+        """
+        updated = {}
+        # Chunks pushed while flushing are left for the next flush
+        for _ in range(len(self._pending)):
+            line, x_chunk, y_chunk = self._pending.popleft()
+            if isinstance(line, Number):
+                line = resolve(line)
+            xbuf, ybuf = self._buffers_for(line, x_chunk, y_chunk,
+                                           on_new_line)
+            xbuf.extend(x_chunk)
+            ybuf.extend(y_chunk)
+            updated[line] = None
+        for line in updated:
+            xbuf, ybuf = self._buffers[line]
+            bind_data(line, xbuf.view(), ybuf.view())
+        return list(updated)
+
+    def discard(self, line):
+        """Stop streaming ``line``, keeping its current data"""
+        self._buffers.pop(line, None)
+
+    def clear(self):
+        self._buffers.clear()
+        self._pending.clear()
@@ -0,0 +1,132 @@
+import matplotlib
+import numpy as np
+from matplotlib.colors import Colormap, Normalize, to_rgba_array
+
+#: Line properties holding a color
+COLOR_PROPERTIES = {
+    'color', 'markeredgecolor', 'markerfacecolor', 'markerfacecoloralt'}
+
+#: Line properties holding a number (or bool) that are returned as NumPy
+#: arrays in bulk queries
+NUMERIC_PROPERTIES = {
+    'linewidth', 'alpha', 'markersize', 'markeredgewidth', 'antialiased',
+    'visible'}
+
+
+def _get_cmap(cmap):
+    """Return the colormap ``cmap`` or the registered colormap of that name,
+    without importing pyplot"""
+    if isinstance(cmap, Colormap):
+        return cmap
+    registry = getattr(matplotlib, 'colormaps', None)
+    if registry is None:  # matplotlib < 3.5
+        from matplotlib import cm
+        return cm.get_cmap(cmap)
+    return registry[cmap]
+
+
+def colormap_values(spec, field_getter=None):
+    """
+    Map per-line values to RGBA colors through a colormap
+
+    Args:
+        spec (dict): Colormap spec with keys ``'cmap'`` (colormap or its
+            name), ``'values'`` (array of one value per line, or the name of a
+            :class:`~mplsel.stats.LineStatsTable` field such as ``'ymax'``)
+            and optionally ``'norm'`` (a ``Normalize`` instance) or
+            ``'vmin'``/``'vmax'``. By default the norm spans the finite range
+            of ``values``
+        field_getter (Callable, optional): Function with call-signature
+            ``(field)`` returning the per-line array of a statistics field
+
+    Returns:
+        (numpy.ndarray): ``(N, 4)`` array of RGBA colors
+    """
+    unknown = set(spec) - {'cmap', 'values', 'norm', 'vmin', 'vmax'}
+    if len(unknown) > 0 or 'cmap' not in spec or 'values' not in spec:
+        raise ValueError(f"Invalid colormap spec: {spec}. Must contain "
+                         f"'cmap' and 'values' and optionally 'norm', "
+                         f"'vmin' and 'vmax'")
+    values = spec['values']
+    if isinstance(values, str):
+        if field_getter is None:
+            raise ValueError('Statistics fields are not available here')
+        values = field_getter(values)
+    values = np.asarray(values, dtype=float)
+    norm = spec.get('norm')
+    if norm is None:
+        finite = values[np.isfinite(values)]
+        vmin = spec.get('vmin', finite.min() if len(finite) > 0 else 0.)
+        vmax = spec.get('vmax', finite.max() if len(finite) > 0 else 1.)
+        norm = Normalize(vmin=vmin, vmax=vmax)
+    return _get_cmap(spec['cmap'])(norm(values))
+
+
+def resolve_values(attr, value, lines, field_getter=None):
+    """
+    Expand ``value`` to a list of one value of ``attr`` per line in ``lines``
+
+    Args:
+        attr (str): Line property being set
+        value (Any): A single value applied to all lines, a tuple of one value
+            per line, a callable with call-signature ``(line, i)``, a NumPy
+            array of one value per line (``(N, 3)`` or ``(N, 4)`` for colors)
+            or, for color properties, a colormap spec (see
+            :func:`colormap_values`)
+        lines (Sequence[Line2D]): Lines being updated
+        field_getter (Callable, optional): See :func:`colormap_values`
+
+    Returns:
+        (list): Value of ``attr`` for each line
+    """
+    n = len(lines)
+    if isinstance(value, dict):
+        if attr not in COLOR_PROPERTIES:
+            raise ValueError(f'Colormap specs are only supported for '
+                             f'{COLOR_PROPERTIES}')
+        value = colormap_values(value, field_getter)
+    if isinstance(value, tuple):
+        assert len(value) == n, \
+            f'Invalid number of values provided for {n} lines in clipboard'
+        return list(value)
+    if callable(value):
+        return [value(ln, i) for i, ln in enumerate(lines)]
+    if isinstance(value, np.ndarray):
+        per_line = value.ndim == 2 if attr in COLOR_PROPERTIES else \
+            value.ndim == 1
+        if per_line:
+            assert len(value) == n, \
+                f'Invalid number of values provided for {n} lines in ' \
+                f'clipboard'
+            if value.ndim == 2:
+                return [tuple(row) for row in value.tolist()]
+            return value.tolist()
+        if attr in COLOR_PROPERTIES:
+            value = tuple(value.tolist())
+    return [value] * n
+
+
+def values_equal(a, b):
+    """Return ``True`` if property values ``a`` and ``b`` are equal"""
+    if a is b:
+        return True
+    if isinstance(a, (str, type(None))) or isinstance(b, (str, type(None))):
+        return isinstance(a, type(b)) and a == b
+    try:
+        return bool(np.array_equal(a, b))
+    except (TypeError, ValueError):
+        return a == b
+
+
+def as_array(attr, values):
+    """
+    Return ``values`` of ``attr`` as a NumPy array if the property is numeric
+    (``float`` with NaN for unset values) or a color (``(N, 4)`` RGBA), and as
+    a tuple otherwise
+    """
+    if attr in COLOR_PROPERTIES:
+        return to_rgba_array(values) if len(values) > 0 else np.zeros((0, 4))
+    if attr in NUMERIC_PROPERTIES:
+        dtype = bool if attr in ('antialiased', 'visible') else float
+        return np.array(values, dtype=dtype)
+    return tuple(values)
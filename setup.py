@@ -29,6 +29,10 @@ setup(
     python_requires='>=3.6',
     install_requires=[
         'matplotlib>=3.0.3',
+        'numpy',
     ],
+    entry_points={
+        'console_scripts': ['mplsel=mplsel.batch:main'],
+    },
 )
 
@@ -0,0 +1,17 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    x = np.arange(10.)
+    for i in range(5):
+        ax.plot(x, x * i, label=f'Line-{i}')
+    yield ax
+    plt.close(fig)
@@ -0,0 +1,81 @@
+import csv
+import json
+import pickle
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from mplsel.batch import apply_recipe, load_recipe, main
+
+#: Recipe of the README
+RECIPE = {
+    'axes': 0,
+    'steps': [
+        {'select_by_label': ['sensor-*', 'glob']},
+        {'setattrs_selection': {'attrs': {'color': 'C1', 'linewidth': 2}}},
+        {'clear_clipboard': None},
+        {'select_where': {'nnan__gt': 0}},
+        {'delete_selection': None},
+        {'select_all_lines': None},
+        {'paste': {'template': 'template.pickle'}}
+    ],
+    'savefig': {'dpi': 50}
+}
+
+
+def _pickle_figure(fig, path):
+    with open(path, 'wb') as f:
+        pickle.dump(fig, f)
+    plt.close(fig)
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    figures = tmp_path / 'figures'
+    figures.mkdir()
+    x = np.arange(20.)
+    for n in range(3):
+        fig, ax = plt.subplots()
+        for i in range(4):
+            y = x * i
+            if i == n:
+                y[5] = np.nan
+            ax.plot(x, y, label=f'sensor-{i}')
+        ax.plot(x, -x, '--', label='reference')
+        _pickle_figure(fig, figures / f'fig{n}.pickle')
+    _pickle_figure(plt.subplots()[0], tmp_path / 'template.pickle')
+    (figures / 'broken.pickle').write_bytes(b'not a figure')
+    with open(tmp_path / 'recipe.json', 'w') as f:
+        json.dump(RECIPE, f)
+    return tmp_path
+
+
+def test_apply_recipe(batch_dir):
+    recipe = load_recipe(batch_dir / 'recipe.json')
+    with open(batch_dir / 'figures' / 'fig1.pickle', 'rb') as f:
+        fig = pickle.load(f)
+    out_fig = apply_recipe(fig, recipe)
+    lines = out_fig.axes[0].lines
+    assert [ln.get_label() for ln in lines] == \
+        ['sensor-0', 'sensor-2', 'sensor-3', 'reference']
+    assert [ln.get_linewidth() for ln in lines] == [2, 2, 2, 1.5]
+    assert lines[-1].get_linestyle() == '--'
+    plt.close('all')
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_main(batch_dir, jobs):
+    out = batch_dir / 'out'
+    code = main([str(batch_dir / 'recipe.json'), str(batch_dir / 'figures'),
+                 str(out), '--format', 'png', 'svg', '--jobs', str(jobs)])
+    assert code == 1  # Due to broken.pickle
+    with open(out / 'report.csv') as f:
+        rows = {row['file'].rsplit('/', 1)[-1]: row for row in csv.DictReader(f)}
+    assert rows.pop('broken.pickle')['status'] == 'error'
+    assert len(rows) == 3
+    for name, row in rows.items():
+        assert row['status'] == 'ok', row['error']
+        stem = name.split('.')[0]
+        assert (out / f'{stem}.png').exists()
+        assert (out / f'{stem}.svg').exists()
@@ -0,0 +1,53 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from mplsel import AxesLineSelector
+from mplsel.decimate import minmax_indices
+
+
+@pytest.fixture
+def long_ax():
+    fig, ax = plt.subplots(figsize=(2, 2), dpi=50)
+    x = np.arange(100000.)
+    ax.plot(x, np.sin(x / 1000), label='sine')
+    ax.plot(x, np.cos(x / 1000), label='cosine')
+    yield ax
+    plt.close(fig)
+
+
+def test_minmax_indices_keep_extrema():
+    y = np.array([0., 5, 1, -3, 2, np.nan, 4, 4, 8])
+    inds = minmax_indices(y, 4)
+    assert {1, 3, 8} <= set(inds)
+    assert np.all(np.diff(inds) > 0)
+    np.testing.assert_array_equal(minmax_indices(y, 8), np.arange(9))
+
+
+def test_decimate_and_zoom(long_ax):
+    line = long_ax.lines[0]
+    x, y = line.get_xdata(), line.get_ydata()
+    sel = AxesLineSelector(long_ax).decimate()
+    assert len(line.get_xdata()) <= 2 * long_ax.bbox.width + 4
+    assert line.get_ydata().max() == y.max()
+    np.testing.assert_array_equal(sel._full_data(line)[1], y)
+    long_ax.set_xlim(0, 1000)
+    shown = line.get_xdata()
+    assert np.count_nonzero((shown >= 0) & (shown <= 1000)) > 10
+    sel.undecimate()
+    np.testing.assert_array_equal(line.get_xdata(), x)
+
+
+def test_set_data_replaces_full_resolution_data(long_ax):
+    line = long_ax.lines[0]
+    sel = AxesLineSelector(long_ax).decimate()
+    x = np.arange(50000.)
+    line.set_data(x, -x)
+    long_ax.set_xlim(0, 50000)  # Decimates the new data, not the old
+    assert line.get_ydata().min() == -49999
+    assert len(line.get_xdata()) < len(x)
+    np.testing.assert_array_equal(sel._full_data(line)[1], -x)
+    assert sel.select_where(ymin__lt=-1).line_clipboard[0] is line
+    line.set_data(x, x)
+    sel.undecimate()  # Keeps the data set since the last decimation
+    np.testing.assert_array_equal(line.get_ydata(), x)
@@ -0,0 +1,80 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from mplsel import FigureLineSelector
+
+
+@pytest.fixture
+def fig():
+    fig, axs = plt.subplots(2, 2)
+    x = np.arange(10.)
+    for i, ax in enumerate(axs.flat):
+        ax.plot(x, x, label='baseline')
+        ax.plot(x, x * (i + 2), label=f'signal-{i}')
+    yield fig
+    plt.close(fig)
+
+
+def count_draws(monkeypatch, fig):
+    draws = []
+    monkeypatch.setattr(fig.canvas, 'draw_idle', lambda: draws.append(None))
+    return draws
+
+
+def test_one_draw_per_operation(fig, monkeypatch):
+    draws = count_draws(monkeypatch, fig)
+    sel = FigureLineSelector(fig)
+    sel.select_lines(lambda ln, i: ln.get_label() == 'baseline')
+    assert len(sel.line_clipboard) == 4
+    sel.setattr_selection('linewidth', 3)
+    assert len(draws) == 1
+    assert sel.getattr_selection('linewidth') == (3,) * 4
+    sel.delete_selection()
+    assert len(draws) == 2
+    assert [len(ax.lines) for ax in fig.axes] == [1] * 4
+
+
+def test_undo_spans_all_axes(fig):
+    sel = FigureLineSelector(fig).select_all_lines()
+    sel.setattr_selection('linewidth', tuple(range(1, 9)))
+    assert sel.getattr_selection('linewidth') == tuple(range(1, 9))
+    sel.delete_selection()
+    sel.undo()
+    assert [len(ax.lines) for ax in fig.axes] == [2] * 4
+    sel.undo()
+    assert {ln.get_linewidth() for ax in fig.axes for ln in ax.lines} == \
+        {plt.rcParams['lines.linewidth']}
+    sel.redo()
+    assert fig.axes[3].lines[1].get_linewidth() == 8
+
+
+def test_colormap_spec_with_empty_selection(fig):
+    sel = FigureLineSelector(fig)
+    sel.setattrs_selection({'color': {'cmap': 'viridis', 'values': 'ymax'}})
+    assert sel._undo_stack == []
+    sel.select_all_lines().setattrs_selection(
+        {'color': {'cmap': 'viridis', 'values': 'ymax'}})
+    assert len(set(sel.getattr_selection('color'))) > 1
+
+
+def test_paste_selection(fig):
+    sel = FigureLineSelector(fig).select_where(ymax__gt=30)
+    fig2, ax2 = plt.subplots()
+    pasted = sel.paste_selection(ax2)
+    assert [ln.get_label() for ln in ax2.lines] == ['signal-2', 'signal-3']
+    assert pasted.axes == [ax2]
+    assert len(pasted.line_clipboard) == 2
+    pasted.undo()
+    assert len(ax2.lines) == 0
+    pasted.redo()
+    assert len(ax2.lines) == 2
+    plt.close(fig2)
+
+
+def test_select_by_label_and_style(fig):
+    sel = FigureLineSelector(fig).select_by_label('signal-[23]', mode='glob')
+    assert sel.getattr_selection('label') == ('signal-2', 'signal-3')
+    fig.axes[0].lines[0].set_linestyle('--')
+    sel.clear_clipboard().select_by_style(linestyle='dashed')
+    assert list(sel.line_clipboard) == [fig.axes[0].lines[0]]
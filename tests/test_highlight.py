@@ -0,0 +1,40 @@
+from mplsel import AxesLineSelector
+from mplsel.highlight import SelectionHighlighter
+
+
+def test_highlights_are_blitted(ax, monkeypatch):
+    canvas = ax.figure.canvas
+    highlighter = SelectionHighlighter(ax)
+    highlighter.connect()
+    canvas.draw()  # Caches the background
+    draws, blits = [], []
+    monkeypatch.setattr(canvas, 'draw_idle', lambda: draws.append(None))
+    monkeypatch.setattr(canvas, 'blit', lambda bbox=None: blits.append(bbox))
+    highlighter.add(ax.lines[0], ax.lines[1])
+    highlighter.add(ax.lines[1])  # Already highlighted
+    highlighter.remove(ax.lines[0])
+    assert draws == []
+    assert len(blits) == 2
+    assert list(highlighter._highlights) == [ax.lines[1]]
+    highlighter.disconnect()
+    assert len(highlighter._highlights) == 0
+
+
+def test_highlights_fall_back_to_draw_idle_before_first_draw(ax, monkeypatch):
+    draws = []
+    monkeypatch.setattr(ax.figure.canvas, 'draw_idle',
+                        lambda: draws.append(None))
+    highlighter = SelectionHighlighter(ax)
+    highlighter.connect()
+    highlighter.add(ax.lines[2])
+    assert len(draws) == 1
+
+
+def test_interactive_select_highlights_selection(ax):
+    sel = AxesLineSelector(ax).select_lines_by_inds(0, 2)
+    sel.interactive_select()
+    assert list(sel._highlighter._highlights) == [ax.lines[0], ax.lines[2]]
+    sel.undo_last_selection()
+    assert list(sel._highlighter._highlights) == [ax.lines[0]]
+    sel.disable_interactive()
+    assert len(sel._highlighter._highlights) == 0
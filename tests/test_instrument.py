@@ -0,0 +1,63 @@
+import logging
+
+import pytest
+
+from mplsel import AxesLineSelector
+
+
+def test_events_carry_batches_of_lines(ax):
+    sel = AxesLineSelector(ax)
+    events = []
+    for event in ('selected', 'deselected', 'deleted', 'restored'):
+        sel.connect(event, lambda lines, event=event:
+                    events.append((event, list(lines))))
+    redrawn = []
+    cid = sel.connect('redrawn', redrawn.append)
+    sel.select_lines_by_inds(0, 1)
+    first, second = ax.lines[0], ax.lines[1]
+    sel.undo_last_selection()
+    sel.delete_lines_by_inds(0, 1)
+    sel.undo()
+    assert events == [('selected', [first, second]),
+                      ('deselected', [second]),
+                      ('deleted', [first, second]),
+                      ('restored', [first, second])]
+    assert redrawn == [ax, ax]
+    sel.disconnect(cid)
+    sel.redo()
+    assert len(redrawn) == 2
+    with pytest.raises(ValueError):
+        sel.connect('clicked', print)
+
+
+def test_timing_stats(ax):
+    sel = AxesLineSelector(ax)
+    sel.select_all_lines().setattr_selection('linewidth', 3)
+    sel.delete_selection()
+    stats = sel.timing_stats()
+    assert stats['redraw']['count'] == 2
+    assert stats['snapshot']['count'] == 2
+    for counter in stats.values():
+        assert counter['total'] >= counter['max'] >= counter['mean'] >= 0
+    assert sel.reset_timing_stats().timing_stats() == {}
+
+
+def test_times_canvas_draws(ax):
+    sel = AxesLineSelector(ax)
+    sel.select_all_lines().setattr_selection('linewidth', 3)
+    # Agg draws immediately on draw_idle(), within the selector's redraw
+    stats = sel.timing_stats()
+    assert stats['draw']['count'] == 1
+    assert stats['redraw']['total'] >= stats['draw']['total'] > 0
+    ax.figure.canvas.draw()  # Draws not requested by the selector count too
+    assert sel.timing_stats()['draw']['count'] == 2
+    sel.release()
+    ax.figure.canvas.draw()
+    assert sel.timing_stats()['draw']['count'] == 2
+
+
+def test_logs_instead_of_printing(ax, caplog, capsys):
+    with caplog.at_level(logging.INFO, logger='mplsel'):
+        AxesLineSelector(ax).select_lines_by_inds(0, 1).delete_selection()
+    assert 'Deleted 2 line(s)' in caplog.messages
+    assert capsys.readouterr().out == ''
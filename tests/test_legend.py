@@ -0,0 +1,89 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from mplsel import AxesLineSelector
+from mplsel.legend import LegendManager, legend_config
+
+
+@pytest.fixture
+def ax30():
+    fig, ax = plt.subplots()
+    for i in range(30):
+        ax.plot(np.arange(5.), np.arange(5.) * i, label=f'L{i}')
+    yield ax
+    plt.close(fig)
+
+
+def legend_labels(ax):
+    return [t.get_text() for t in ax.get_legend().texts]
+
+
+def test_explicit_handles_are_kept(ax30):
+    ax30.legend(handles=list(ax30.lines[:3]), framealpha=.2, loc='upper left')
+    sel = AxesLineSelector(ax30).select_lines_by_inds(1)
+    sel.setattr_selection('linewidth', 4)
+    assert legend_labels(ax30) == ['L0', 'L1', 'L2']
+    assert ax30.get_legend().get_frame().get_alpha() == .2
+    sel.setattr_selection('label', 'renamed')
+    assert legend_labels(ax30) == ['L0', 'renamed', 'L2']
+    assert ax30.get_legend().get_frame().get_alpha() == .2
+    sel.delete_selection()
+    assert legend_labels(ax30) == ['L0', 'L2']
+    sel.undo()
+    assert legend_labels(ax30) == ['L0', 'renamed', 'L2']
+
+
+def test_full_legend_follows_lines(ax30):
+    ax30.legend()
+    sel = AxesLineSelector(ax30).delete_lines_by_inds(0)
+    assert len(legend_labels(ax30)) == 29
+    sel.undo()
+    assert legend_labels(ax30)[0] == 'L0'
+
+
+def test_restyles_without_rebuilding(ax30):
+    legend = ax30.legend(loc='upper left', ncol=2)
+    sel = AxesLineSelector(ax30).select_lines_by_inds(3)
+    sel.setattr_selection('color', 'red')
+    assert ax30.get_legend() is legend
+    assert legend.get_lines()[3].get_color() == 'red'
+    sel.delete_selection()
+    assert ax30.get_legend() is not legend
+    assert ax30.get_legend()._ncols == 2
+    assert len(legend_labels(ax30)) == 29
+
+
+def test_configure_legend_pages_entries(ax30):
+    ax30.legend()
+    sel = AxesLineSelector(ax30).configure_legend(max_entries=10)
+    assert legend_labels(ax30) == [f'L{i}' for i in range(10)] \
+        + ['... 20 more']
+    assert sel.legend_manager.n_pages == 3
+    sel.configure_legend(max_entries=10, page=2)
+    assert legend_labels(ax30)[:2] == ['L20', 'L21']
+    sel.configure_legend()
+    assert len(legend_labels(ax30)) == 30
+
+
+def test_custom_labels_are_left_untouched(ax30):
+    legend = ax30.legend(ax30.lines[:2], ['a', 'b'])
+    assert not LegendManager(ax30).refresh()
+    assert ax30.get_legend() is legend
+
+
+def test_config_roundtrip(ax30):
+    kwargs = dict(loc='lower right', ncol=2, framealpha=.3, fancybox=False,
+                  facecolor='yellow', edgecolor='red', labelcolor='blue',
+                  mode='expand', title='T', title_fontsize=7, shadow=True,
+                  markerfirst=False, borderpad=2)
+    config = legend_config(ax30.legend(**kwargs))
+    rebuilt = ax30.legend(**config)
+    for key in ('framealpha', 'fancybox', 'mode', 'markerfirst', 'loc',
+                'facecolor', 'edgecolor', 'labelcolor'):
+        assert legend_config(rebuilt)[key] == config[key], key
+    assert config['framealpha'] == .3
+    assert config['fancybox'] is False
+    assert config['markerfirst'] is False
+    assert config['mode'] == 'expand'
+    assert rebuilt.get_title().get_fontsize() == 7
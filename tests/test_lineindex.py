@@ -0,0 +1,47 @@
+from mplsel import AxesLineSelector
+
+
+def test_select_by_label(ax):
+    sel = AxesLineSelector(ax)
+    assert list(sel.select_by_label('Line-1').line_clipboard) == [ax.lines[1]]
+    sel.clear_clipboard().select_by_label('Line-[34]', mode='glob')
+    assert list(sel.line_clipboard) == list(ax.lines[3:])
+    sel.clear_clipboard().select_by_label(r'-[02]$', mode='regex')
+    assert list(sel.line_clipboard) == [ax.lines[0], ax.lines[2]]
+    assert len(sel.clear_clipboard().select_by_label('Line').line_clipboard) \
+        == 0
+
+
+def test_select_by_style(ax):
+    ax.lines[3].set_linestyle('--')
+    ax.lines[4].set_linestyle('--')
+    sel = AxesLineSelector(ax).select_by_style(linestyle='dashed')
+    assert list(sel.line_clipboard) == list(ax.lines[3:])
+    sel.clear_clipboard().select_by_style(color='C3', linestyle='--')
+    assert list(sel.line_clipboard) == [ax.lines[3]]
+    sel.clear_clipboard().select_by_style(color=(0, 0, 0), label='Line-0')
+    assert len(sel.line_clipboard) == 0
+
+
+def test_detects_lines_replaced_outside_selector(ax):
+    sel = AxesLineSelector(ax)
+    assert sel.line_index.match_label('Line-*', 'glob') == list(ax.lines)
+    old = ax.lines[2]
+    old.remove()
+    new, = ax.plot([0, 1], [0, 1], label='Line-new')
+    assert len(ax.lines) == 5
+    assert old not in sel.line_index.lookup('label', 'Line-2')
+    assert sel.line_index.lookup('label', 'Line-new') == [new]
+    assert list(sel.select_by_label('Line-n*', mode='glob').line_clipboard) \
+        == [new]
+
+
+def test_tracks_selector_changes(ax):
+    sel = AxesLineSelector(ax)
+    assert len(sel.line_index.lookup('color', 'C1')) == 1
+    sel.select_lines_by_inds(0).setattr_selection('color', 'C1')
+    assert set(sel.line_index.lookup('color', 'C1')) == set(ax.lines[:2])
+    sel.delete_lines_by_inds(1)
+    assert sel.line_index.lookup('color', 'C1') == [ax.lines[0]]
+    sel.undo()
+    assert len(sel.line_index.lookup('color', 'C1')) == 2
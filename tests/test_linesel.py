@@ -0,0 +1,341 @@
+import gc
+import threading
+import weakref
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.backend_bases import MouseEvent
+
+from mplsel import AxesLineSelector
+
+
+def labels(ax):
+    return [ln.get_label() for ln in ax.lines]
+
+
+def click(ax, x, y):
+    canvas = ax.figure.canvas
+    event = MouseEvent('button_press_event', canvas,
+                       *ax.transData.transform((x, y)), button=1)
+    canvas.callbacks.process('button_press_event', event)
+
+
+def test_batch_defers_redraws(ax, monkeypatch):
+    draws = []
+    monkeypatch.setattr(ax.figure.canvas, 'draw_idle',
+                        lambda: draws.append(None))
+    sel = AxesLineSelector(ax)
+    with sel.batch():
+        with sel.batch():
+            sel.select_lines_by_inds(0, 1).setattr_selection('linewidth', 3)
+        sel.setattr_selection('alpha', .5)
+        assert sel.is_batching
+        assert draws == []
+    assert not sel.is_batching
+    assert len(draws) == 1
+    assert sel.getattr_selection('linewidth') == (3, 3)
+    sel.begin_batch().setattr_selection('linewidth', 4).end_batch()
+    assert len(draws) == 2
+    with pytest.raises(RuntimeError):
+        sel.end_batch()
+
+
+def test_delete_selection(ax):
+    sel = AxesLineSelector(ax).select_lines_by_inds(1, 3)
+    deleted = list(sel.line_clipboard)
+    sel.delete_selection()
+    assert labels(ax) == ['Line-0', 'Line-2', 'Line-4']
+    assert len(sel.line_clipboard) == 0
+    assert all(ln.axes is None for ln in deleted)
+    ax.figure.canvas.draw()
+
+
+def test_delete_lines_by_inds_and_undo(ax):
+    sel = AxesLineSelector(ax).delete_lines_by_inds(0, 2)
+    assert labels(ax) == ['Line-1', 'Line-3', 'Line-4']
+    sel.undo()
+    assert labels(ax) == [f'Line-{i}' for i in range(5)]
+    assert all(ln.axes is ax for ln in ax.lines)
+    sel.redo()
+    assert labels(ax) == ['Line-1', 'Line-3', 'Line-4']
+
+
+def test_delete_all_lines_and_undo_all(ax):
+    sel = AxesLineSelector(ax)
+    sel.delete_lines_by_inds(4).delete_lines_by_inds(0)
+    sel.delete_all_lines()
+    assert len(ax.lines) == 0
+    sel.undo_all_delete()
+    assert labels(ax) == [f'Line-{i}' for i in range(5)]
+
+
+def test_undo_last_delete_keeps_later_operations(ax):
+    sel = AxesLineSelector(ax).delete_lines_by_inds(1)
+    sel.select_lines_by_inds(0).setattr_selection('linewidth', 4)
+    sel.undo_last_delete()
+    assert labels(ax) == [f'Line-{i}' for i in range(5)]
+    assert ax.lines[0].get_linewidth() == 4
+    assert len(sel.journal) == 1
+    sel.undo_last_delete()  # Only warns, the style change is kept
+    assert ax.lines[0].get_linewidth() == 4
+
+
+def test_undo_all_delete_keeps_reordering(ax):
+    sel = AxesLineSelector(ax).delete_lines_by_inds(0)
+    sel.reorder_lines([3, 2, 1, 0])
+    sel.delete_lines_by_inds(0)
+    sel.undo_all_delete()
+    assert labels(ax) == ['Line-0', 'Line-4', 'Line-3', 'Line-2', 'Line-1']
+    sel.undo()  # The reordering still applies to the restored lines
+    assert labels(ax) == [f'Line-{i}' for i in range(5)]
+
+
+def test_dedupe(ax):
+    ax.plot(np.arange(10.), np.arange(10.), label='Copy')
+    sel = AxesLineSelector(ax).dedupe()
+    assert labels(ax) == [f'Line-{i}' for i in range(5)]
+    sel.undo()
+    assert labels(ax)[-1] == 'Copy'
+
+
+def test_reorder_lines_and_undo(ax):
+    sel = AxesLineSelector(ax)
+    patch = ax.axhspan(0, 1)  # Non-line children keep their position
+    sel.reorder_lines([4, 3, 2, 1, 0])
+    assert labels(ax) == [f'Line-{i}' for i in range(4, -1, -1)]
+    assert ax.patches[0] is patch
+    sel.undo()
+    assert labels(ax) == [f'Line-{i}' for i in range(5)]
+    sel.redo()
+    assert labels(ax) == [f'Line-{i}' for i in range(4, -1, -1)]
+
+
+def test_reorder_lines_rejects_invalid_order(ax):
+    with pytest.raises(AssertionError):
+        AxesLineSelector(ax).reorder_lines([0, 0, 1, 2, 3])
+
+
+def test_undo_restores_consolidated_lines(ax):
+    sel = AxesLineSelector(ax).consolidate()
+    coll = sel._collections[0]
+    sel.delete_lines_by_inds(0)
+    ax.figure.canvas.draw()
+    assert len(coll.get_segments()) == 4
+    sel.undo()
+    ax.lines[0].set_linewidth(5)
+    ax.figure.canvas.draw()
+    assert len(coll.get_segments()) == 5
+    assert coll.get_linewidth()[0] == 5
+
+
+def test_consolidated_lines_follow_reordering(ax):
+    sel = AxesLineSelector(ax).consolidate()
+    coll = sel._collections[0]
+    sel.reorder_lines(range(4, -1, -1))
+    ax.figure.canvas.draw()
+    np.testing.assert_array_equal(coll.get_segments()[0],
+                                  ax.lines[0].get_xydata())
+    assert ax.lines[0].get_label() == 'Line-4'
+
+
+def test_consolidate_skips_lines_not_in_data_coordinates(ax):
+    ax.lines[1].set_transform(ax.transAxes)
+    sel = AxesLineSelector(ax).consolidate()
+    assert ax.lines[1] not in sel._collections[0].logical_lines
+    assert len(sel._collections[0].logical_lines) == 4
+
+
+def test_paste_selection_copies_style(ax):
+    ax.lines[1].set_linestyle('--')
+    ax.lines[1].set_linewidth(3)
+    ax.lines[2].set_linestyle((2, (4, 1, 1, 1)))
+    ax.lines[2].set_markevery(2)
+    sel = AxesLineSelector(ax).select_lines_by_inds(1, 2)
+    fig2, ax2 = plt.subplots()
+    new_sel = sel.paste_selection(ax2)
+    src, new = list(sel.line_clipboard), list(new_sel.line_clipboard)
+    assert list(ax2.lines) == new
+    for attr in ('linestyle', 'linewidth', 'color', 'label', 'markevery',
+                 'dashSeq', 'dashOffset'):
+        assert new_sel.getattr_selection(attr) == sel.getattr_selection(attr)
+    assert new[0].get_transform() == ax2.transData
+    np.testing.assert_array_equal(new[1].get_xydata(), src[1].get_xydata())
+    fig2.canvas.draw()
+    new_sel.undo()
+    assert len(ax2.lines) == 0
+    plt.close(fig2)
+
+
+def test_paste_selection_shares_data_copy_on_write(ax):
+    src = ax.lines[3]
+    sel = AxesLineSelector(ax).select_lines_by_inds(3)
+    fig2, ax2 = plt.subplots()
+    new = sel.paste_selection(ax2, share_data=True).line_clipboard[0]
+    assert np.shares_memory(new.get_ydata(orig=True), src.get_ydata(orig=True))
+    np.testing.assert_array_equal(ax2.dataLim.get_points(), [[0, 0], [9, 27]])
+    with pytest.raises(ValueError):
+        src.get_ydata(orig=True)[0] = 100  # Would also change the copy
+    with pytest.raises(ValueError):
+        new.get_ydata(orig=True)[0] = 100
+    src.set_ydata(np.zeros(10))
+    np.testing.assert_array_equal(new.get_ydata(), np.arange(10.) * 3)
+    plt.close(fig2)
+
+
+def test_setattr_dash_pattern(ax):
+    ax.lines[0].set_linestyle('--')
+    sel = AxesLineSelector(ax).select_lines_by_inds(0)
+    sel.setattr_selection('dashSeq', lambda ln, i: (6., 2.))
+    assert sel.getattr_selection('dashSeq') == ((6., 2.),)
+    sel.undo()
+    assert sel.getattr_selection('dashSeq') != ((6., 2.),)
+    assert sel.getattrs_selection('dashcapstyle')['dashcapstyle'] == \
+        ('butt',)
+
+
+def test_import_selection_sets_limits_without_caching_data(ax, tmp_path,
+                                                           monkeypatch):
+    ax.lines[2].set_ydata(np.r_[np.nan, ax.lines[2].get_ydata()[1:]])
+    ax.set_yscale('log')
+    sel = AxesLineSelector(ax).select_lines_by_inds(1, 2, 3)
+    sel.export_selection(str(tmp_path))
+    fig2, ax2 = plt.subplots()
+    fig3, ax3 = plt.subplots()
+    ax2.set_yscale('log')
+    ax3.set_yscale('log')
+    for ln in sel.line_clipboard:
+        ax3.plot(ln.get_xdata(), ln.get_ydata())
+
+    recached = []
+    monkeypatch.setattr(fig2.canvas, 'draw_idle', lambda: None)
+    monkeypatch.setattr(type(ax.lines[0]), 'recache',
+                        lambda ln, always=False: recached.append(ln))
+    new_sel = AxesLineSelector.import_selection(ax2, str(tmp_path))
+    monkeypatch.undo()
+    assert recached == []
+    assert labels(ax2) == ['Line-1', 'Line-2', 'Line-3']
+    np.testing.assert_allclose(ax2.dataLim.get_points(),
+                               ax3.dataLim.get_points())
+    np.testing.assert_allclose(ax2.dataLim.minpos, ax3.dataLim.minpos)
+    assert ax2.get_ylim() == ax3.get_ylim()
+    fig2.canvas.draw()
+    new_sel.undo()
+    assert len(ax2.lines) == 0
+    plt.close(fig2)
+    plt.close(fig3)
+
+
+def test_append_data_resolves_indices_on_flush(ax):
+    sel = AxesLineSelector(ax).start_streaming(window=12)
+    producer = threading.Thread(
+        target=sel.append_data, args=(1, [10., 11., 12.], [1., 2., 3.]))
+    producer.start()
+    producer.join()
+    sel.reorder_lines((0, 3, 2, 1, 4))  # Indices refer to the flush time
+    sel.append_data(-1, [10.], [4.])
+    sel.stop_streaming()
+    assert ax.lines[1].get_label() == 'Line-3'
+    np.testing.assert_array_equal(ax.lines[1].get_xdata()[-3:],
+                                  [10., 11., 12.])
+    np.testing.assert_array_equal(ax.lines[1].get_ydata()[-3:], [1., 2., 3.])
+    assert len(ax.lines[1].get_xdata()) == 12
+    assert ax.lines[4].get_ydata()[-1] == 4.
+    with pytest.raises(TypeError):
+        sel.append_data(1.5, [0.], [0.])
+
+
+def test_overlap_policies(ax):
+    sel = AxesLineSelector(ax).interactive_select(overlap='all',
+                                                  debounce=None)
+    click(ax, 0, 0)  # All lines pass through the origin
+    assert set(sel.line_clipboard) == set(ax.lines)
+    sel.clear_clipboard().interactive_select(debounce=None)
+    click(ax, 0, 0)
+    assert list(sel.line_clipboard) == [ax.lines[4]]
+    sel.disable_interactive()
+    with pytest.raises(ValueError):
+        sel.interactive_select(overlap='bottom')
+
+
+def test_debounced_clicks_are_deleted_together(ax):
+    sel = AxesLineSelector(ax).interactive_delete(debounce=10000)
+    click(ax, 0, 0)
+    click(ax, 0, 0)  # Deletes the line beneath the topmost line
+    click(ax, 9, 9)
+    assert len(ax.lines) == 5
+    sel.flush_picks()
+    assert labels(ax) == ['Line-0', 'Line-2']
+    assert len(sel.journal) == 1
+    sel.undo()
+    assert len(ax.lines) == 5
+    sel.disable_interactive()
+
+
+def test_del_drops_pending_picks(ax, monkeypatch):
+    sel = AxesLineSelector(ax).interactive_delete(debounce=10000)
+    click(ax, 9, 36)
+    assert len(sel._pending_picks) > 0
+    draws = []
+    monkeypatch.setattr(ax.figure.canvas, 'draw_idle',
+                        lambda: draws.append(None))
+    sel.__del__()
+    assert len(ax.lines) == 5
+    assert draws == []  # No canvas work during garbage collection
+
+
+def test_memory_usage(ax):
+    sel = AxesLineSelector(ax)
+    nbytes = ax.lines[0].get_xdata().nbytes
+    sel.delete_lines_by_inds(0, 1)
+    usage = sel.memory_usage()
+    assert usage['undo'] >= 4 * nbytes
+    assert usage['total'] == sum(v for k, v in usage.items() if k != 'total')
+    sel.undo()
+    usage = sel.memory_usage()
+    assert usage['undo'] == 0
+    assert 0 < usage['redo'] < nbytes
+    sel.select_all_lines().select_where(ymax__gt=10)
+    assert sel.memory_usage()['caches'] > 0
+
+
+def test_release_once_figure_closed():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], label='Line-0')
+    sel = AxesLineSelector(ax).select_all_lines().setattr_selection('alpha', .5)
+    plt.close(fig)
+    assert sel.memory_usage()['total'] == 0
+    assert len(sel.line_clipboard) == 0
+    assert len(sel.journal) == 0
+    with pytest.raises(ReferenceError, match='closed'):
+        sel.select_all_lines()
+    fig_ref = weakref.ref(fig)
+    del fig, ax
+    gc.collect()
+    assert fig_ref() is None  # Not kept alive by the selector
+
+
+def test_closed_figure_is_not_kept_alive():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], label='Line-0')
+    sel = AxesLineSelector(ax)
+    fig_ref = weakref.ref(fig)
+    plt.close(fig)  # Emits no close_event on non-GUI backends
+    del fig, ax
+    gc.collect()
+    assert fig_ref() is None
+    with pytest.raises(ReferenceError, match='closed'):
+        sel.select_all_lines()
+
+
+def test_repr_after_release():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], label='Line-0')
+    sel = AxesLineSelector(ax).select_lines_by_inds(0)
+    assert 'Line-0' in repr(sel)
+    sel.release()
+    assert 'Line-0' in repr(sel)  # Still alive, referred to weakly
+    plt.close(fig)
+    del fig, ax
+    gc.collect()
+    assert 'None (released)' in repr(sel)
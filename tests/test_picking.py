@@ -0,0 +1,26 @@
+import numpy as np
+
+from mplsel.picking import IdBufferPicker
+
+
+def display(ax, x, y):
+    return ax.transData.transform((x, y))
+
+
+def test_rebuilds_after_data_replaced(ax):
+    ax.set_ylim(-1, 40)
+    picker = IdBufferPicker(ax)
+    top = ax.lines[4]
+    assert picker.line_at(*display(ax, 9, 36)) is top
+    top.set_ydata(np.full(10, 20.))
+    assert picker.line_at(*display(ax, 9, 36)) is None
+    assert picker.line_at(*display(ax, 2, 20)) is top
+
+
+def test_rebuilds_after_axes_resized(ax):
+    ax.set_ylim(-1, 40)
+    picker = IdBufferPicker(ax)
+    assert picker.line_at(*display(ax, 9, 36)) is ax.lines[4]
+    ax.set_position([.5, .5, .4, .4])
+    assert picker.line_at(*display(ax, 9, 36)) is ax.lines[4]
+    assert picker.line_at(*display(ax, 5, 5)) is ax.lines[1]
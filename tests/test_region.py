@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox
+
+from mplsel import AxesLineSelector
+from mplsel.region import as_region
+
+
+def test_as_region():
+    bbox = as_region((3, 4, 1, 2))
+    assert isinstance(bbox, Bbox)
+    assert tuple(bbox.extents) == (1, 2, 3, 4)
+    path = as_region([(0, 0), (1, 0), (1, 1)])
+    assert isinstance(path, Path)
+    np.testing.assert_array_equal(path.vertices[-1], (0, 0))
+    with pytest.raises(ValueError):
+        as_region([(0, 0), (1, 1)])
+
+
+def test_select_in_rectangle(ax):
+    sel = AxesLineSelector(ax).select_in_region((0, 2.5, 10, 3.5))
+    assert list(sel.line_clipboard) == [ax.lines[1], ax.lines[3]]
+
+
+def test_select_in_polygon(ax):
+    sel = AxesLineSelector(ax)
+    sel.select_in_region([(.5, -1), (10, -1), (10, 8)])
+    assert list(sel.line_clipboard) == [ax.lines[0]]
+
+
+def test_select_by_fraction_inside(ax):
+    sel = AxesLineSelector(ax)
+    sel.select_in_region((-1, -1, 10, 10), min_fraction=.5)
+    assert list(sel.line_clipboard) == list(ax.lines[:3])
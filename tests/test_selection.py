@@ -0,0 +1,49 @@
+import pytest
+
+from mplsel import AxesLineSelector
+from mplsel.selection import LineSelection
+
+
+def test_order_and_membership():
+    sel = LineSelection('abcd')
+    assert not sel.add('b')
+    sel.discard('b')
+    assert sel.add('b')
+    assert list(sel) == ['a', 'c', 'd', 'b']
+    assert 'b' in sel and 'e' not in sel
+    assert sel[1] == 'c'
+    assert sel.index('b') == 3
+    assert sel.pop() == 'b'
+    assert sel.pop(0) == 'a'
+    assert list(sel) == ['c', 'd']
+    with pytest.raises(KeyError):
+        sel.remove('a')
+
+
+def test_removals_are_compacted():
+    sel = LineSelection(range(100))
+    for i in range(0, 100, 2):
+        sel.discard(i)
+    assert len(sel) == 50
+    assert list(sel) == list(range(1, 100, 2))
+    assert sel[-1] == 99
+    assert next(reversed(sel)) == 99
+    assert sel.index(51) == 25
+
+
+def test_set_operations_keep_left_order():
+    a, b = LineSelection('cab'), LineSelection('bd')
+    assert list(a | b) == ['c', 'a', 'b', 'd']
+    assert list(a & b) == ['b']
+    assert list(a - ['a']) == ['c', 'b']
+    assert a[:2] == LineSelection('ca')
+    assert a.copy() == a and a.copy() is not a
+
+
+def test_selector_clipboard(ax):
+    sel = AxesLineSelector(ax).select_lines_by_inds(3, 1, 3)
+    assert list(sel.line_clipboard) == [ax.lines[3], ax.lines[1]]
+    sel.select_all_lines()
+    assert len(sel.line_clipboard) == 5
+    sel.undo_last_selection()
+    assert list(sel.line_clipboard) == [ax.lines[i] for i in (3, 1, 0, 2)]
@@ -0,0 +1,58 @@
+import numpy as np
+from matplotlib.backend_bases import MouseEvent
+
+from mplsel import AxesLineSelector
+from mplsel.spatial import SegmentIndex, line_distance
+
+
+def test_nearest_lines(ax):
+    ax.figure.canvas.draw()
+    sel = AxesLineSelector(ax)
+    nearest = sel.nearest_lines(5, 10.5, k=5)
+    assert nearest[0] is ax.lines[2]
+    assert len(nearest) == 5
+    x, y = ax.transData.transform((5, 10.5))
+    distances = [line_distance(ln, x, y) for ln in nearest]
+    assert distances == sorted(distances)
+    assert sel.nearest_lines(x, y, display=True) == nearest[:1]
+    assert sel.nearest_lines(0, 60, max_distance=1) == []
+
+
+def test_index_follows_data_and_visibility(ax):
+    ax.figure.canvas.draw()
+    index = SegmentIndex(ax)
+    x, y = ax.transData.transform((5, 10.5))
+    assert index.nearest(x, y)[0][0] is ax.lines[2]
+    ax.lines[2].set_visible(False)
+    assert index.nearest(x, y)[0][0] is not ax.lines[2]
+    ax.lines[0].set_ydata(np.full(10, 10.5))
+    assert index.nearest(x, y)[0][0] is ax.lines[0]
+
+
+def test_long_segments_bound_index_size(ax):
+    ax.plot(np.tile([0., 9.], 500), np.tile([0., 36.], 500))
+    index = SegmentIndex(ax)
+    index.rebuild()
+    n_segments = sum(len(ln.get_xdata()) - 1 for ln in ax.lines)
+    assert len(index._cell_segs) <= \
+        (SegmentIndex.CELLS_PER_SEGMENT + 1) * n_segments
+
+
+def test_hover_tooltip_shows_nearest_label(ax):
+    sel = AxesLineSelector(ax).interactive_hover()
+    canvas = ax.figure.canvas
+    canvas.draw()
+    tooltip = sel._hover_tooltip.annotation
+
+    def move(x, y):
+        event = MouseEvent('motion_notify_event', canvas,
+                           *ax.transData.transform((x, y)))
+        canvas.callbacks.process('motion_notify_event', event)
+
+    move(9, 35.5)
+    assert tooltip.get_visible()
+    assert tooltip.get_text() == 'Line-4'
+    move(1, 30)
+    assert not tooltip.get_visible()
+    sel.disable_hover()
+    assert tooltip.axes is None and tooltip.figure is None
@@ -0,0 +1,49 @@
+import logging
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from mplsel import AxesLineSelector
+
+
+def test_compact_data_shares_x(ax):
+    x_nbytes = ax.lines[0].get_xdata().nbytes
+    sel = AxesLineSelector(ax)
+    assert sel.compact_data() == 4 * x_nbytes
+    xs = [ln.get_xdata() for ln in ax.lines]
+    assert all(x is xs[0] for x in xs)
+    assert not xs[0].flags.writeable
+    assert sel.compact_data() == 0
+    ax.figure.canvas.draw()
+
+
+def test_compact_data_logs_total(caplog):
+    fig, ax = plt.subplots()
+    x = np.arange(2 ** 17.)  # 1 MiB
+    for i in range(4):
+        ax.plot(x, x * i)
+    with caplog.at_level(logging.INFO, logger='mplsel.linesel'):
+        AxesLineSelector(ax).compact_data()
+    # Original x and y plus matplotlib's cached (N, 2) copy of both per line,
+    # of which three copies of x are reclaimed
+    assert 'reclaiming 3.0 of 16.0 MiB' in caplog.text
+    plt.close(fig)
+
+
+def test_compact_data_downcast(ax):
+    reclaimed = AxesLineSelector(ax).compact_data(downcast=True)
+    assert ax.lines[0].get_xdata().dtype == np.float32
+    assert ax.lines[4].get_ydata().dtype == np.float32
+    # Four of five x arrays are shared, and the remaining x and all y halved
+    assert reclaimed == 4 * 80 + 40 + 5 * 40
+
+
+def test_paste_keeps_compacted_x_shared(ax):
+    sel = AxesLineSelector(ax)
+    sel.compact_data()
+    fig2, ax2 = plt.subplots()
+    sel.select_all_lines().paste_selection(ax2)
+    xs = [ln.get_xdata() for ln in ax2.lines]
+    assert all(np.shares_memory(x, xs[0]) for x in xs)
+    assert not np.shares_memory(xs[0], ax.lines[0].get_xdata())
+    plt.close(fig2)
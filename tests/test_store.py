@@ -0,0 +1,61 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from mplsel import AxesLineSelector, LineEditor, LineStore
+
+
+def make_store():
+    store = LineStore()
+    x = np.arange(10.)
+    store.add_lines((x, x * i) for i in range(4))
+    store.add_line(x, np.r_[np.nan, x[1:]], label='gappy')
+    store.add_line(x, x * 3)
+    return store
+
+
+def test_shares_editor_with_selector():
+    assert issubclass(LineStore, LineEditor)
+    assert issubclass(AxesLineSelector, LineEditor)
+    assert LineStore.select_where is AxesLineSelector.select_where
+    assert LineStore.setattrs_selection is AxesLineSelector.setattrs_selection
+
+
+def test_select_delete_and_undo():
+    store = make_store()
+    deleted = []
+    store.instrumentation.connect('deleted', deleted.append)
+    store.select_where(nnan__gt=0).delete_selection()
+    store.select_duplicates().delete_selection()
+    assert len(store) == 4
+    assert len(deleted) == 2
+    store.undo()
+    assert len(store) == 5
+    store.redo().undo().undo()
+    assert [rec.get_label() for rec in store.lines][4] == 'gappy'
+
+
+def test_setattr_and_reorder():
+    store = make_store()
+    version = store.version
+    store.select_by_label('gap*', 'glob') \
+        .setattrs_selection({'color': 'k', 'linewidth': 3})
+    assert store.getattr_selection('linewidth') == (3,)
+    assert store.version > version
+    store.reorder_lines(range(5, -1, -1))
+    assert store.lines[1].get_label() == 'gappy'
+    store.undo().undo()
+    assert store.lines[4].get_label() == 'gappy'
+    assert store.getattrs_selection('color')['color'].shape == (1, 4)
+    assert store.getattr_selection('linewidth') != (3,)
+
+
+def test_attached_artist_follows_changes():
+    store = make_store()
+    fig, ax = plt.subplots()
+    artist = store.attach(ax)
+    fig.canvas.draw()
+    store.select_lines_by_inds(0, 1).delete_selection()
+    assert artist.stale
+    fig.canvas.draw()
+    assert len(artist.sync()) == 4
+    plt.close(fig)